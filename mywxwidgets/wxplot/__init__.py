@@ -5,11 +5,16 @@ A simple plotting library for the wxPython Phoenix project.
 """
 
 from .plotcanvas import PlotCanvas
-from .polyobjects import (PlotGraphics, PlotPrintout, PolyBoxPlot,
-                          PolyHistogram, PolyLine, PolyMarker, PolySpline)
+from .polyobjects import (PlotGraphics, PlotPrintout, PolyAdaptiveHistogram,
+                          PolyBoxPlot, PolyBoxPlots, PolyCandlestick,
+                          PolyErrorBars, PolyFill, PolyHistogram, PolyImage,
+                          PolyLine, PolyMarker, PolyMultiLine, PolyScatter,
+                          PolySpline, PolyStreamBoxPlot, PolyStreamHistogram)
 
 __all__ = [
-    'PolyLine', 'PolySpline', 'PolyMarker', 'PolyBoxPlot', 'PolyHistogram',
-    'PlotGraphics', 'PlotCanvas', 'PlotPrintout'
+    'PolyLine', 'PolySpline', 'PolyMultiLine', 'PolyMarker', 'PolyScatter',
+    'PolyFill', 'PolyErrorBars', 'PolyCandlestick', 'PolyImage', 'PolyBoxPlot',
+    'PolyBoxPlots', 'PolyStreamBoxPlot', 'PolyHistogram', 'PolyAdaptiveHistogram',
+    'PolyStreamHistogram', 'PlotGraphics', 'PlotCanvas', 'PlotPrintout'
 ]
 __updated__ = '2025-2-7'
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Colour maps for value-coloured plot objects.
+
+A colour map is a list of anchor colours; `colour_lut` interpolates it into
+a lookup table and `quantize` maps values to indices into that table.
+"""
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import wx
+from numpy.typing import ArrayLike, NDArray
+
+# anchor colours, evenly spaced from the lowest to the highest value
+COLOURMAPS = {
+    'viridis': ['#440154', '#482878', '#3e4989', '#31688e', '#26828e',
+                '#1f9e89', '#35b779', '#6ece58', '#b5de2b', '#fde725'],
+    'plasma': ['#0d0887', '#46039f', '#7201a8', '#9c179e', '#bd3786',
+               '#d8576b', '#ed7953', '#fb9f3a', '#fdca26', '#f0f921'],
+    'inferno': ['#000004', '#1b0c41', '#4a0c6b', '#781c6d', '#a52c60',
+                '#cf4446', '#ed6925', '#fb9b06', '#f7d13d', '#fcffa4'],
+    'coolwarm': ['#3b4cc0', '#6788ee', '#9abbff', '#c9d7f0', '#edd1c2',
+                 '#f7a789', '#e26952', '#b40426'],
+    'jet': ['#00007f', '#0000ff', '#007fff', '#00ffff', '#7fff7f',
+            '#ffff00', '#ff7f00', '#ff0000', '#7f0000'],
+    'gray': ['#000000', '#ffffff'],
+}
+
+ColourMap = Union[str, Sequence[Union[str, wx.Colour, Tuple[int, int, int]]]]
+
+
+def colour_lut(cmap: ColourMap, n: int = 256) -> NDArray[np.uint8]:
+    """
+    Interpolates a colour map into a lookup table.
+
+    Parameters
+    ----------
+    cmap : str | sequence of colours
+        A name in `COLOURMAPS` or at least two colours (`wx.Colour`, colour
+        names / hex strings or RGB tuples)
+    n : int
+        The number of colours in the table
+
+    Returns
+    -------
+    NDArray[np.uint8]
+        The ``(n, 3)`` RGB table.
+    """
+    if isinstance(cmap, str):
+        try:
+            cmap = COLOURMAPS[cmap]
+        except KeyError:
+            raise ValueError('Unknown colour map {!r}. Should be one of {}'.format(
+                cmap, list(COLOURMAPS)))
+    if len(cmap) < 2:
+        raise ValueError('A colour map needs at least two colours')
+    anchors = np.asarray(
+        [c[:3] if isinstance(c, tuple) else wx.Colour(c).Get(False)
+         for c in cmap], np.float64)
+    x = np.linspace(0, 1, n)
+    xp = np.linspace(0, 1, len(anchors))
+    lut = np.column_stack([np.interp(x, xp, anchors[:, i]) for i in range(3)])
+    return np.round(lut).astype(np.uint8)
+
+
+def quantize(values: ArrayLike,
+             n: int,
+             vmin: Optional[float] = None,
+             vmax: Optional[float] = None) -> NDArray[np.intp]:
+    """
+    Maps values linearly onto the colour indices ``0 .. n-1``.
+
+    Values outside ``[vmin, vmax]`` are clipped, non-finite values get -1.
+    `vmin` and `vmax` default to the finite range of `values`.
+    """
+    values = np.asarray(values, np.float64)
+    finite = np.isfinite(values)
+    if vmin is None:
+        vmin = values[finite].min() if finite.any() else 0.
+    if vmax is None:
+        vmax = values[finite].max() if finite.any() else 1.
+    span = vmax - vmin if vmax > vmin else 1.
+    index = np.full(values.shape, -1, np.intp)
+    scaled = (values[finite] - vmin) * (n / span)
+    index[finite] = np.clip(scaled, 0, n - 1).astype(np.intp)
+    return index
+
+
+def group_by_index(index: NDArray[np.intp]) -> Tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.intp]]:
+    """
+    Groups item positions by colour index, ignoring negative indices.
+
+    Returns
+    -------
+    tuple
+        ``(order, starts, colours)``: the item positions sorted by index,
+        where each group starts in `order`, and the index of each group.
+    """
+    order = np.argsort(index, kind='stable')
+    order = order[index[order] >= 0]
+    sorted_index = index[order]
+    change = sorted_index[1:] != sorted_index[:-1]
+    starts = np.flatnonzero(np.r_[len(order) > 0, change])
+    return order, starts, sorted_index[starts]
+
+
+__all__ = ['COLOURMAPS', 'colour_lut', 'quantize', 'group_by_index']
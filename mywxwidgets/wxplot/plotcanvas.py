@@ -1,21 +1,49 @@
 # -*- coding: utf-8 -*-
 import os.path
 import sys
-from typing import Callable, Literal, Optional, Sequence, Tuple, Union
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import wx
 from numpy.typing import NDArray
-from wx.lib.plot.utils import (DisplaySide, TempStyle, scale_and_shift_point,
-                               set_displayside)
+from wx.lib.plot.utils import DisplaySide, TempStyle, set_displayside
 
 from .polyobjects import (LINESTYLE, PlotGraphics, PlotPrintout, PolyBoxPlot,
-                          PolyLine, PolyMarker)
+                          PolyLine, PolyMarker, PolyMultiLine)
 
 ID_HOME = 20000
 ID_DATAMARKER = 20001
 ID_SAVE = 20003
 
+# graphics renderers by name, with the wx.GraphicsRenderer getter of each
+_RENDERERS = {
+    'default': 'GetDefaultRenderer',
+    'cairo': 'GetCairoRenderer',
+    'direct2d': 'GetDirect2DRenderer',
+    'gdiplus': 'GetGDIPlusRenderer',
+}
+
+# widest expected texts of the toolbar readouts, they size the controls
+_LABLOC_TEMPLATE = 'X = -00000.000 ; Y = -00000.000     '
+_POILAB_TEMPLATE = 'M' * 24 + '  |    '
+
+
+def _segments(x1, y1, x2, y2) -> NDArray[np.int32]:
+    """Broadcasts line end points to an ``(n, 4)`` int32 segment array"""
+    lines = np.broadcast_arrays(*map(np.atleast_1d, (x1, y1, x2, y2)))
+    return np.stack(lines, axis=-1).astype(np.int32)
+
+
+def _drawLineList(dc: wx.DC, lines) -> None:
+    """Draws the segment arrays with a single `DrawLineList` call"""
+    if lines:
+        lines = np.concatenate(lines)
+        if len(lines):
+            dc.DrawLineList(lines)
+
 
 def load_svg(name: str):
     try:
@@ -76,7 +104,6 @@ class PlotCanvas(wx.Panel):
                                wx.FONTWEIGHT_NORMAL, False,
                                faceName='Microsoft Yahei')
         self.SetFont(default_font)
-        self.labloc.SetFont(default_font)
 
         self._init_layout(style)
         self.Fit()
@@ -85,6 +112,7 @@ class PlotCanvas(wx.Panel):
 
         self._init_cursor()
         self._init_var()
+        self._sizeReadouts(default_font)
         self._init_pen()
         self._init_bind()
 
@@ -101,9 +129,11 @@ class PlotCanvas(wx.Panel):
                              load_svg('save.svg'),
                              '保存视图')
         self.toolbar.AddStretchableSpace()
-        self.poilab = wx.StaticText(self.toolbar)
+        # fixed width readouts: changing their text never resizes them
+        style = wx.ST_NO_AUTORESIZE | wx.ST_ELLIPSIZE_END
+        self.poilab = wx.StaticText(self.toolbar, style=style)
         self.toolbar.AddControl(self.poilab)
-        self.labloc = wx.StaticText(self.toolbar)
+        self.labloc = wx.StaticText(self.toolbar, style=style)
         self.toolbar.AddControl(self.labloc)
         self.toolbar.Realize()
 
@@ -124,8 +154,19 @@ class PlotCanvas(wx.Panel):
 
         self._zoomEnabled: bool = False
         self._dragEnabled: bool = False
-        self._labxy_l: int = 0
-        self._poilab_l: int = 0
+        # toolbar readouts, updated at most once per `_readoutInterval` s
+        self._readoutText = {'labloc': '', 'poilab': ''}
+        self._readoutShown = {'labloc': '', 'poilab': ''}
+        self._readoutInterval: float = 1 / 60
+        self._readoutTime: float = 0.
+        self._readoutTimer: Optional[wx.CallLater] = None
+        self._readoutFont: Optional[wx.Font] = None
+
+        # offscreen buffer, may be larger than the canvas after shrinking
+        self._Buffer: Optional[wx.Bitmap] = None
+        self._drawnSize: Tuple[int, int] = (1, 1)  # canvas size of the drawing
+        self._resizeDelay: int = 100
+        self._resizeTimer: Optional[wx.CallLater] = None
 
         # Drawing Variables
         self.last_draw = None
@@ -168,7 +209,26 @@ class PlotCanvas(wx.Panel):
         self._useScientificNotation: bool = False
 
         self._antiAliasingEnabled: bool = False
+        self._rendererName: str = 'default'
+        self._renderer: Optional[wx.GraphicsRenderer] = None  # None: default
+        # durations in seconds of the phases of the last _Draw
+        self._drawTimes: Dict[str, float] = {}
         self._hiResEnabled: bool = False
+        self._markerSpritesEnabled: bool = False
+        self._renderBackend: str = 'dc'
+        self._renderThreads: int = 0
+        self._renderExecutor: Optional[ThreadPoolExecutor] = None
+        # raster layer of every plot object, with the key it was drawn for
+        self._layerCacheEnabled: bool = False
+        self._layerCache = weakref.WeakKeyDictionary()
+
+        # interaction level-of-detail
+        self._lodAntiAliasing: bool = False
+        self._lodMarkers: bool = False
+        self._lodDecimation: int = 0
+        self._lodDelay: int = 300
+        self._interacting: bool = False
+        self._lodTimer: Optional[wx.CallLater] = None
         self._pointSize: Tuple[float, float] = (1.0, 1.0)
         self._fontScale: float = 1.0
         self._tickLength = tuple(-x * 2 for x in self._pointSize)
@@ -231,6 +291,7 @@ class PlotCanvas(wx.Panel):
         self.canvas.Bind(wx.EVT_LEAVE_WINDOW, self.OnLeave)
         self.canvas.Bind(wx.EVT_PAINT, self.OnPaint)
         self.canvas.Bind(wx.EVT_SIZE, self.OnSize)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.OnDestroy)
         # OnSize called to make sure the buffer is initialized.
         # This might result in OnSize getting called twice on some
         # platforms at initialization, but little harm done.
@@ -620,6 +681,248 @@ class PlotCanvas(wx.Panel):
         """Get the enableAntiAliasing value."""
         return self._antiAliasingEnabled
 
+    @staticmethod
+    def GetGraphicsRenderers() -> List[str]:
+        """Get the names of the graphics renderers available here."""
+        names = []
+        for name, getter in _RENDERERS.items():
+            getter = getattr(wx.GraphicsRenderer, getter, None)
+            if getter is not None and getter() is not None:
+                names.append(name)
+        return names
+
+    def SetGraphicsRenderer(self, renderer: Union[Literal['default', 'cairo', 'direct2d', 'gdiplus'],
+                                                  wx.GraphicsRenderer] = 'default') -> None:
+        """
+        Set the graphics renderer used for anti-aliased drawing.
+
+        Parameters
+        ----------
+        renderer : {'default', 'cairo', 'direct2d', 'gdiplus'} or `wx.GraphicsRenderer`
+            The renderer, by name or instance. See `GetGraphicsRenderers`
+            for the names available on this platform and
+            `BenchmarkRenderers` to find the fastest one for a plot.
+        """
+        if isinstance(renderer, wx.GraphicsRenderer):
+            name = renderer.GetName() or 'custom'
+        else:
+            if renderer not in _RENDERERS:
+                raise TypeError('Value should be one of {} or a '
+                                'wx.GraphicsRenderer'.format(list(_RENDERERS)))
+            getter = getattr(wx.GraphicsRenderer, _RENDERERS[renderer], None)
+            name = renderer
+            renderer = getter() if getter is not None else None
+            if renderer is None:
+                raise ValueError('The {!r} renderer is not available on this '
+                                 'platform'.format(name))
+        self._rendererName = name
+        self._renderer = renderer
+        self.Redraw()
+
+    def GetGraphicsRenderer(self) -> str:
+        """Get the name of the graphics renderer."""
+        return self._rendererName
+
+    def GetDrawTimes(self) -> Dict[str, float]:
+        """
+        Get the durations in seconds of the phases of the last drawing.
+
+        The keys are 'setup' (DC and fonts), 'axes' (labels, legend, grid
+        and ticks), 'graphics' (scaling and drawing the plot objects) and
+        'total', which also covers flushing the graphics context and, on
+        screen, putting the buffer on the window. Empty before the first
+        drawing.
+        """
+        return dict(self._drawTimes)
+
+    def BenchmarkRenderers(self, repeat: int = 5) -> Dict[str, float]:
+        """
+        Redraws the current plot with every available graphics renderer.
+
+        Parameters
+        ----------
+        repeat : int
+            The number of drawings per renderer.
+
+        Returns
+        -------
+        dict
+            The median drawing time in seconds of each renderer name, and
+            of 'none' for drawing without anti-aliasing. Empty if nothing
+            was drawn yet.
+        """
+        if self.last_draw is None:
+            return {}
+        saved = (self._antiAliasingEnabled, self._rendererName, self._renderer)
+        results = {}
+        try:
+            for name in ['none'] + self.GetGraphicsRenderers():
+                self._antiAliasingEnabled = name != 'none'
+                if name != 'none':
+                    self._rendererName = name
+                    self._renderer = getattr(wx.GraphicsRenderer,
+                                             _RENDERERS[name])()
+                times = []
+                for _ in range(repeat):
+                    self.Redraw()
+                    times.append(self._drawTimes['total'])
+                results[name] = float(np.median(times))
+        finally:
+            self._antiAliasingEnabled, self._rendererName, self._renderer = saved
+            self.Redraw()
+        return results
+
+    def _graphicsDC(self, dc: wx.DC) -> wx.GCDC:
+        """Wraps the DC in a `wx.GCDC` drawing with the selected renderer."""
+        if self._renderer is None:
+            return wx.GCDC(dc)
+        return wx.GCDC(self._renderer.CreateContextFromUnknownDC(dc))
+
+    def SetEnableMarkerSprites(self, value: bool = True) -> None:
+        """
+        Set the enableMarkerSprites value.
+
+        If True, each marker shape is rendered once into a small bitmap and
+        stamped on every point, which keeps large scatter plots fast with
+        anti-aliasing on. Not used for printing and hi-res drawing.
+        """
+        if not isinstance(value, bool):
+            raise TypeError('Value should be True or False')
+        self._markerSpritesEnabled = value
+        self.Redraw()
+
+    def GetEnableMarkerSprites(self) -> bool:
+        """Get the enableMarkerSprites value."""
+        return self._markerSpritesEnabled
+
+    def SetRenderBackend(self, backend: Literal['dc', 'raster'] = 'dc') -> None:
+        """
+        Set how the plot objects are drawn on screen.
+
+        Parameters
+        ----------
+        backend : {'dc', 'raster'}
+            'dc' issues DC primitives for every object. 'raster' draws
+            lines and markers into a NumPy RGBA buffer, which is put on the
+            DC with one ``DrawBitmap``. Raster lines are not anti-aliased.
+            Objects without raster support, printing and hi-res drawing
+            always use the DC.
+        """
+        if backend not in ('dc', 'raster'):
+            raise TypeError('Value should be \'dc\' or \'raster\'')
+        self._renderBackend = backend
+        self.Redraw()
+
+    def GetRenderBackend(self) -> str:
+        """Get the render backend, 'dc' or 'raster'."""
+        return self._renderBackend
+
+    def SetRenderThreads(self, threads: int = 0) -> None:
+        """
+        Set the number of worker threads preparing the plot objects.
+
+        The objects are scaled on the workers and, with the raster backend,
+        drawn in one contiguous chunk per worker, which are composited in
+        order on the UI thread.
+        NumPy releases the GIL for most of that work, so plots with many
+        series use several cores. 0 does everything on the UI thread.
+        """
+        if not isinstance(threads, int) or threads < 0:
+            raise TypeError('`threads` must be a non-negative int')
+        if threads == self._renderThreads:
+            return
+        if self._renderExecutor is not None:
+            self._renderExecutor.shutdown(wait=False)
+            self._renderExecutor = None
+        if threads:
+            self._renderExecutor = ThreadPoolExecutor(
+                threads, thread_name_prefix='wxplot-render')
+        self._renderThreads = threads
+        self.Redraw()
+
+    def GetRenderThreads(self) -> int:
+        """Get the number of render worker threads, 0 if disabled."""
+        return self._renderThreads
+
+    def SetEnableLayerCache(self, value: bool = True) -> None:
+        """
+        Set the enableLayerCache value.
+
+        If True, the raster backend keeps the layer drawn for every plot
+        object and only redraws the layers of objects whose version (see
+        `PolyPoints.markChanged`) or view changed, then composites them.
+        Costs the memory of the drawn pixels of every object.
+        """
+        if not isinstance(value, bool):
+            raise TypeError('Value should be True or False')
+        self._layerCacheEnabled = value
+        if not value:
+            self._layerCache.clear()
+        self.Redraw()
+
+    def GetEnableLayerCache(self) -> bool:
+        """Get the enableLayerCache value."""
+        return self._layerCacheEnabled
+
+    def SetInteractionLOD(self,
+                          antiAliasing: bool = True,
+                          markers: bool = True,
+                          decimation: int = 4,
+                          delay: int = 300) -> None:
+        """
+        Set the interaction level-of-detail policy.
+
+        While dragging, zooming or resizing, the plot is drawn at a lower
+        quality. Full quality is restored `delay` ms after the last
+        interaction. Calling with all degradations off disables the policy.
+
+        Parameters
+        ----------
+        antiAliasing : bool, default True
+            Draw without anti-aliasing during interaction.
+        markers : bool, default True
+            Hide line markers and draw scatter markers as dots during
+            interaction.
+        decimation : int, default 4
+            Decimate lines to the min/max of every `decimation` pixel
+            columns during interaction. 0 disables it.
+        delay : int, default 300
+            Idle delay in milliseconds before full quality is restored.
+        """
+        if not isinstance(decimation, int) or decimation < 0:
+            raise TypeError('`decimation` must be a non-negative int')
+        if not isinstance(delay, int) or delay < 0:
+            raise TypeError('`delay` must be a non-negative int')
+        self._lodAntiAliasing = bool(antiAliasing)
+        self._lodMarkers = bool(markers)
+        self._lodDecimation = decimation
+        self._lodDelay = delay
+
+    def GetInteractionLOD(self) -> dict:
+        """Get the interaction level-of-detail policy as a dict."""
+        return {
+            'antiAliasing': self._lodAntiAliasing,
+            'markers': self._lodMarkers,
+            'decimation': self._lodDecimation,
+            'delay': self._lodDelay
+        }
+
+    def SetResizeDelay(self, delay: int = 100) -> None:
+        """
+        Set the resize debounce delay in milliseconds.
+
+        While the window is being resized the previous drawing is shown
+        stretched, and the plot is redrawn once no size event came for
+        `delay` ms. 0 redraws on every size event.
+        """
+        if not isinstance(delay, int) or delay < 0:
+            raise TypeError('`delay` must be a non-negative int')
+        self._resizeDelay = delay
+
+    def GetResizeDelay(self) -> int:
+        """Get the resize debounce delay in milliseconds."""
+        return self._resizeDelay
+
     def SetEnableHiRes(self, value: bool = True) -> None:
         """Set the enableHiRes value."""
         if not isinstance(value, bool):
@@ -744,7 +1047,6 @@ class PlotCanvas(wx.Panel):
         self._pointLabelEnabled = value
         self.Redraw()  # will erase existing pointLabel if present
         self.last_PointLabel = None
-        self._poilab_l = 0
         if not self._pointLabelEnabled:
             self.set_poilab(None)
 
@@ -1189,13 +1491,15 @@ class PlotCanvas(wx.Panel):
         if dlg1:
             dlg1.Destroy()
 
-        # Save Bitmap
-        res = self._Buffer.SaveFile(fileName, extensions[fType])
+        # Save Bitmap, the buffer may be larger than the drawing
+        bmp = self._Buffer
+        if tuple(bmp.GetSize()) != self._drawnSize:
+            bmp = bmp.GetSubBitmap(wx.Rect(0, 0, *self._drawnSize))
+        res = bmp.SaveFile(fileName, extensions[fType])
         return res
 
     def Reset(self) -> None:
         """Unzoom the plot."""
-        self._labxy_l = 0
         self.last_PointLabel = None  # reset pointLabel
         if self.last_draw is not None:
             self._Draw(self.last_draw[0])
@@ -1259,18 +1563,26 @@ class PlotCanvas(wx.Panel):
             drawing context - doesn't have to be specified.
             If it's not, the offscreen buffer is used
         """
-
+        start = time.perf_counter()
+        onScreen = dc is None
+        # sprites are screen bitmaps, so only used for on-screen drawing
+        useSprites = onScreen and self._markerSpritesEnabled
+        lod = onScreen and self._interacting
+        antiAliasing = (self._antiAliasingEnabled
+                        and not (lod and self._lodAntiAliasing))
         if dc is None:
             # sets new dc and clears it
+            self._ensureBuffer()
             dc = wx.BufferedDC(wx.ClientDC(self.canvas), self._Buffer)
             bbr = wx.Brush(self.GetBackgroundColour(), wx.BRUSHSTYLE_SOLID)
             dc.SetBackground(bbr)
             dc.SetBackgroundMode(wx.SOLID)
             dc.Clear()
-        if self._antiAliasingEnabled:
+        if antiAliasing:
             if not isinstance(dc, wx.GCDC):
+                # one graphics context for the whole frame
                 try:
-                    dc = wx.GCDC(dc)
+                    dc = self._graphicsDC(dc)
                 except Exception:  # XXX: Yucky.
                     pass
                 else:
@@ -1298,6 +1610,15 @@ class PlotCanvas(wx.Panel):
                                2.0)
 
         graphics._pointSize = self._pointSize
+        graphics._useSprites = useSprites and self._pointSize == (1.0, 1.0)
+        graphics._useRaster = (onScreen and self._renderBackend == 'raster'
+                               and self._pointSize == (1.0, 1.0))
+        graphics._executor = self._renderExecutor
+        graphics._threads = self._renderThreads
+        graphics._layerCache = (self._layerCache if self._layerCacheEnabled
+                                else None)
+        graphics._hideMarkers = lod and self._lodMarkers
+        graphics._decimation = self._lodDecimation if lod else 0
 
         dc.SetTextForeground(self.GetForegroundColour())
         dc.SetTextBackground(self.GetBackgroundColour())
@@ -1306,8 +1627,12 @@ class PlotCanvas(wx.Panel):
 
         # set font size for every thing but title and legend
         dc.SetFont(self._getFont(self._fontSizeAxis))
-        self.labloc.SetFont(self._getFont(self._fontSizeLoc))
-        self.poilab.SetFont(self._getFont(self._fontSizeLoc))
+        if onScreen:
+            font = self._getFont(self._fontSizeLoc)
+            if font is not self._readoutFont:
+                self._sizeReadouts(font)
+
+        setupDone = time.perf_counter()
 
         # sizes axis to axis type, create lower left and upper right
         # corners of plot
@@ -1387,6 +1712,7 @@ class PlotCanvas(wx.Panel):
         self._pointScale = scale / self._pointSize
         self._pointShift = shift / self._pointSize
         self._drawPlotAreaItems(dc, p1, p2, scale, shift, xticks, yticks)
+        axesDone = time.perf_counter()
 
         graphics.scaleAndShift(scale, shift)
         # thicken up lines and markers if printing
@@ -1400,14 +1726,24 @@ class PlotCanvas(wx.Panel):
                              int(rectWidth * self._pointSize[0] + 2),
                              int(rectHeight * self._pointSize[1] + 1))
         # Draw the lines and markers
-        #        start = _time.perf_counter()
         graphics.draw(dc)
-        #        time_str = 'entire graphics drawing took: {} seconds'
-        #        print(time_str.format(_time.perf_counter() - start))
         # remove the clipping region
         dc.DestroyClippingRegion()
+        graphicsDone = time.perf_counter()
 
         self._adjustScrollbars()
+        if isinstance(dc, wx.GCDC) and dc.GetGraphicsContext():
+            # the context may queue the drawing, finish it within 'total'
+            dc.GetGraphicsContext().Flush()
+        if onScreen:
+            # the buffer reaches the window when its DC is destroyed
+            del dc
+        self._drawTimes = {
+            'setup': setupDone - start,
+            'axes': axesDone - setupDone,
+            'graphics': graphicsDone - axesDone,
+            'total': time.perf_counter() - start,
+        }
 
     def Redraw(self, dc=None) -> None:
         """Redraw the existing plot."""
@@ -1418,16 +1754,12 @@ class PlotCanvas(wx.Panel):
     def Clear(self) -> None:
         """Erase the window."""
         self.last_PointLabel = None  # reset pointLabel
+        self._ensureBuffer()
         dc = wx.BufferedDC(wx.ClientDC(self.canvas), self._Buffer)
         bbr = wx.Brush(self.GetBackgroundColour(), wx.SOLID)
         dc.SetBackground(bbr)
         dc.SetBackgroundMode(wx.SOLID)
         dc.Clear()
-        if self._antiAliasingEnabled:
-            try:
-                dc = wx.GCDC(dc)
-            except Exception:
-                pass
         dc.SetTextForeground(self.GetForegroundColour())
         dc.SetTextBackground(self.GetBackgroundColour())
         self.last_draw = None
@@ -1467,13 +1799,23 @@ class PlotCanvas(wx.Panel):
             return []
         graphics, xAxis, yAxis = self.last_draw
         l = []
-        for i, obj in enumerate(graphics):
+        i = 0  # curve number, PolyMultiLine counts one curve per series
+        for obj in graphics:
+            if not obj.getVisible():
+                i += obj.nSeries if isinstance(obj, PolyMultiLine) else 1
+                continue
+            if isinstance(obj, PolyMultiLine):
+                if obj._x.size:
+                    for n, cp in enumerate(obj.getClosestPoints(pntXY, pointScaled)):
+                        l.append([i + n, obj.getLegend(n)] + cp)
+                i += obj.nSeries
+                continue
             # check there are points in the curve
-            if len(obj.points) == 0:
-                continue  # go to next obj
-            # [curveNum, legend, closest pt index, pointXY, scaledXY, dist]
-            cn = [i, obj.getLegend()] + obj.getClosestPoint(pntXY, pointScaled)
-            l.append(cn)
+            if len(obj.points) != 0:
+                # [curveNum, legend, closest pt index, pointXY, scaledXY, dist]
+                cn = [i, obj.getLegend()] + obj.getClosestPoint(pntXY, pointScaled)
+                l.append(cn)
+            i += 1
         return l
 
     def GetClosestPoint(self, pntXY, pointScaled=True):
@@ -1611,14 +1953,14 @@ class PlotCanvas(wx.Panel):
         # 鼠标滚轮 缩放图像 前滚放大 后滚缩小
         rotation = event.GetWheelRotation()
         # self.SetCursor(self.MagCursor)
+        self._beginInteraction()
         ratio = (0.9, 0.9) if rotation > 0 else (1.1, 1.1)
         self.Zoom(self._getXY(event), ratio)
         # self.SetCursor(self.defaultCursor)
 
     def set_poilab(self, sl: Union[Sequence[str], str, None]):
         if sl is None:
-            self.poilab.SetLabel('')
-            self.toolbar.Realize()
+            self._setReadout('poilab', '')
             return
         if isinstance(sl, str):
             s = sl
@@ -1627,19 +1969,12 @@ class PlotCanvas(wx.Panel):
         else:
             raise TypeError('`sl` must be str or Sequence[str] or None.')
         s += '  |    '
-        self.poilab.SetLabel(s)
-        if self._poilab_l < len(s):
-            self.toolbar.Realize()
-            self._poilab_l = len(s)
+        self._setReadout('poilab', s)
 
     def set_labxy(self, pntXY) -> None:
         x, y = np.round(pntXY, 3)
         s = 'X = {} ; Y = {}     '.format(x, y)
-        self.labloc.SetLabel(s)
-        if self._labxy_l < len(s):
-            # self.Layout()
-            self.toolbar.Realize()
-            self._labxy_l = len(s)
+        self._setReadout('labloc', s)
 
     def OnMotion(self, event) -> None:
         xy0 = self._getXY(event)
@@ -1657,6 +1992,7 @@ class PlotCanvas(wx.Panel):
             dx, dy = xy0 - self._dragPoint0
             xAxis = xAxis - dx
             yAxis = yAxis - dy
+            self._beginInteraction()
             self._Draw(graphics, xAxis, yAxis)
             self._dragPoint0 = xy0
             self._move_leave()
@@ -1671,6 +2007,7 @@ class PlotCanvas(wx.Panel):
                 self._ZoomEnabled = (True, 'y')
             else:
                 raito = (1, 1)
+            self._beginInteraction()
             self.Zoom(self._zoomPoint0, raito)
             self._zoomPoint1 = xy0
             self._move_leave()
@@ -1734,33 +2071,31 @@ class PlotCanvas(wx.Panel):
         if self.last_PointLabel is not None:
             self._drawPointLabel(self.last_PointLabel)  # erase old
             self.last_PointLabel = None
-        dc = wx.BufferedPaintDC(self.canvas, self._Buffer)
-        if self._antiAliasingEnabled:
-            try:
-                dc = wx.GCDC(dc)
-            except Exception:
-                pass
+        if self._resizeTimer is not None:
+            # still resizing: show the previous drawing stretched
+            self._drawStretchedBuffer(wx.PaintDC(self.canvas))
+            return
+        # only blits the buffer, so no graphics context is needed
+        wx.BufferedPaintDC(self.canvas, self._Buffer)
 
     def OnSize(self, event) -> None:
-        # The Buffer init is done here, to make sure the buffer is always
-        # the same size as the Window
-        Size = self.canvas.GetClientSize()
-        Size.width = max(1, Size.width)
-        Size.height = max(1, Size.height)
-
-        # Make new offscreen bitmap: this bitmap will always have the
-        # current drawing in it, so it can be used to save the image to
-        # a file, or whatever.
-        self._Buffer = wx.Bitmap(Size.width, Size.height)
         self._setSize()
-
         self.last_PointLabel = None  # reset pointLabel
 
-        if self.last_draw is None:
-            self.Clear()
+        if event is None or self._resizeDelay == 0 or self.last_draw is None:
+            if event is not None:
+                self._beginInteraction()
+            self._redrawAfterResize()
+            return
+
+        # show the stretched previous drawing and redraw once resizing
+        # settles
+        if self._resizeTimer is None:
+            self._resizeTimer = wx.CallLater(self._resizeDelay,
+                                             self._redrawAfterResize)
         else:
-            graphics, xSpec, ySpec = self.last_draw
-            self._Draw(graphics, xSpec, ySpec)
+            self._resizeTimer.Restart(self._resizeDelay)
+        self.canvas.Refresh(False)
 
     def OnLeave(self, event) -> None:
         """Used to erase pointLabel when mouse outside window"""
@@ -1774,6 +2109,7 @@ class PlotCanvas(wx.Panel):
 
     def OnScroll(self, event) -> None:
         if not self._adjustingSB:
+            self._beginInteraction()
             self._sb_ignore = True
             sbpos = event.GetPosition()
 
@@ -1789,9 +2125,112 @@ class PlotCanvas(wx.Panel):
                 dist = (sbpos * self._sb_xunit -
                         (self._getXCurrentRange()[0] - self._sb_xfullrange[0]))
                 self.ScrollRight(dist)
+
+    def OnDestroy(self, event) -> None:
+        """Stops the render worker threads with the canvas"""
+        # the destroy events of the child windows propagate up to here
+        if event.GetEventObject() is self and self._renderExecutor is not None:
+            self._renderExecutor.shutdown(wait=False)
+            self._renderExecutor = None
+        event.Skip()
 #endregion
 
 #region private_methods
+    def _beginInteraction(self) -> None:
+        """Draw at interaction quality until the canvas is idle again"""
+        if not (self._lodAntiAliasing or self._lodMarkers or self._lodDecimation):
+            return
+        self._interacting = True
+        if self._lodTimer is None:
+            self._lodTimer = wx.CallLater(self._lodDelay, self._endInteraction)
+        else:
+            self._lodTimer.Restart(self._lodDelay)
+
+    def _endInteraction(self) -> None:
+        """Restore full quality after the idle delay"""
+        self._lodTimer = None
+        if not self:  # the window was destroyed meanwhile
+            return
+        if self._interacting:
+            self._interacting = False
+            self.Redraw()
+
+    def _sizeReadouts(self, font: wx.Font) -> None:
+        """
+        Sets the font of the toolbar readouts and gives them a fixed width
+        for it. This is the only place the toolbar is laid out again, mouse
+        movement never does.
+        """
+        for name, template in (('labloc', _LABLOC_TEMPLATE),
+                               ('poilab', _POILAB_TEMPLATE)):
+            ctrl: wx.StaticText = getattr(self, name)
+            ctrl.SetFont(font)
+            size = ctrl.GetTextExtent(template)
+            ctrl.SetMinSize(size)
+            ctrl.SetSize(size)
+        self.toolbar.Realize()
+        self._readoutFont = font
+
+    def _setReadout(self, name: str, text: str) -> None:
+        """Sets the text of a toolbar readout, throttled to the frame rate"""
+        self._readoutText[name] = text
+        if self._readoutTimer is not None:  # a flush is already pending
+            return
+        wait = self._readoutTime + self._readoutInterval - time.perf_counter()
+        if wait > 0:
+            self._readoutTimer = wx.CallLater(max(1, int(wait * 1000)),
+                                              self._flushReadouts)
+        else:
+            self._flushReadouts()
+
+    def _flushReadouts(self) -> None:
+        """Shows the latest readout texts"""
+        self._readoutTimer = None
+        if not self:  # the window was destroyed meanwhile
+            return
+        self._readoutTime = time.perf_counter()
+        for name, text in self._readoutText.items():
+            if self._readoutShown[name] != text:
+                getattr(self, name).SetLabel(text)
+                self._readoutShown[name] = text
+
+    def _ensureBuffer(self) -> None:
+        """
+        Makes sure the offscreen buffer covers the canvas.
+
+        This bitmap always has the current drawing in it, so it can be used
+        to save the image to a file, or whatever. A larger buffer is reused
+        after shrinking, unless it is more than twice the needed area, which
+        keeps buffer memory bounded.
+        """
+        width, height = self.canvas.GetClientSize()
+        width, height = max(1, width), max(1, height)
+        if self._Buffer is not None:
+            bw, bh = self._Buffer.GetSize()
+            if bw >= width and bh >= height and bw * bh <= 2 * width * height:
+                self._drawnSize = (width, height)
+                return
+        self._Buffer = wx.Bitmap(width, height)
+        self._drawnSize = (width, height)
+
+    def _redrawAfterResize(self) -> None:
+        """Redraws the plot at the new canvas size"""
+        self._resizeTimer = None
+        if not self:  # the window was destroyed meanwhile
+            return
+        if self.last_draw is None:
+            self.Clear()
+        else:
+            graphics, xSpec, ySpec = self.last_draw
+            self._Draw(graphics, xSpec, ySpec)
+
+    def _drawStretchedBuffer(self, dc: wx.DC) -> None:
+        """Draws the previous drawing stretched to the canvas size"""
+        width, height = self.canvas.GetClientSize()
+        mdc = wx.MemoryDC(self._Buffer)
+        dc.StretchBlit(0, 0, width, height, mdc, 0, 0, *self._drawnSize)
+        mdc.SelectObject(wx.NullBitmap)
+
     def _setSize(self, width=None, height=None):
         """DC width and height."""
         if width is None:
@@ -1852,15 +2291,16 @@ class PlotCanvas(wx.Panel):
         dc.SetFont(self._getFont(self._fontSizeLegend))
 
         temp1 = trhc[0] + legendLHS
-        for i in range(len(graphics)):
-            o = graphics[i]
+        for i, (o, n) in enumerate(graphics.getLegendItems()):
             # s = i * lineHeight
             temp2 = trhc[1] + i * lineHeight * 1.5
             pnt1 = (temp1, temp2)
             pnt2 = (temp1 + legendSymExt[0], temp2)
             pnt = (temp1 + legendSymExt[0] / 2., temp2)
             m1, m2 = np.asarray([pnt1, pnt2]), np.asarray([pnt])
-            if isinstance(o, PolyLine):
+            if isinstance(o, PolyMultiLine):
+                o.drawlegend(dc, self.printerScale, coord=m1, index=n)
+            elif isinstance(o, PolyLine):
                 o.drawlegend(dc, self.printerScale, coord=m1)
             elif isinstance(o, (PolyMarker, PolyBoxPlot)):
                 o.drawlegend(dc, self.printerScale, coord=m2)
@@ -1869,7 +2309,8 @@ class PlotCanvas(wx.Panel):
             # draw legend txt
             pnt = ((temp1 + legendSymExt[0] + 5 * self._pointSize[0]),
                    temp2 - legendTextExt[1] / 2)
-            dc.DrawText(o.getLegend(), int(pnt[0]), int(pnt[1]))
+            legend = o.getLegend() if n is None else o.getLegend(n)
+            dc.DrawText(legend, int(pnt[0]), int(pnt[1]))
         dc.SetFont(self._getFont(self._fontSizeAxis))  # reset
 
     def _titleLablesWH(self, dc: wx.DC, graphics: PlotGraphics) -> Tuple[wx.Size, wx.Size, wx.Size]:
@@ -1988,30 +2429,19 @@ class PlotCanvas(wx.Panel):
             raise ValueError(str(spec) + ': illegal axis specification')
 
     @TempStyle('pen')
-    def _drawGrid(self, dc, p1, p2, scale, shift, xticks, yticks):
+    def _drawGrid(self, dc, corners, xpos, ypos):
         """
         Draws the gridlines
 
         :param :class:`wx.DC` `dc`: The :class:`wx.DC` to draw on.
         :type `dc`: :class:`wx.DC`
-        :param p1: The lower-left hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p1 = (-10, -5)
-        :type p1: :class:`np.array`, length 2
-        :param p2: The upper-right hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p2 = (10, 5)
-        :type p2: :class:`np.array`, length 2
-        :param scale: The [X, Y] scaling factor to convert plot coords to
-                      DC coords
-        :type scale: :class:`np.array`, length 2
-        :param shift: The [X, Y] shift values to convert plot coords to
-                      DC coords. Must be in plot units, not DC units.
-        :type shift: :class:`np.array`, length 2
-        :param xticks: The X tick definition
-        :type xticks: list of length-2 lists
-        :param yticks: The Y tick definition
-        :type yticks: list of length-2 lists
+        :param corners: The lower-left and upper-right hand corners of the
+                        plot in DC coords, ``[[x1, y1], [x2, y2]]``
+        :type corners: :class:`np.array`, shape (2, 2)
+        :param xpos: The X tick positions in DC coords
+        :type xpos: :class:`np.array`
+        :param ypos: The Y tick positions in DC coords
+        :type ypos: :class:`np.array`
         """
         # increases thickness for printing only
         pen = self._gridPen
@@ -2019,46 +2449,27 @@ class PlotCanvas(wx.Panel):
         pen.SetWidth(int(penWidth))
         dc.SetPen(pen)
 
-        x, y, width, height = self._point2ClientCoord(p1, p2)
-
-        if self._xSpec != 'none':
-            if self._gridEnabled[0]:
-                for x, _ in xticks:
-                    pt = scale_and_shift_point(x, p1[1], scale, shift)
-                    dc.DrawLine(int(pt[0]), int(pt[1]), int(pt[0]),
-                                int(pt[1] - height))
-
-        if self._ySpec != 'none':
-            if self._gridEnabled[1]:
-                for y, label in yticks:
-                    pt = scale_and_shift_point(p1[0], y, scale, shift)
-                    dc.DrawLine(int(pt[0]), int(pt[1]), int(pt[0] + width),
-                                int(pt[1]))
+        (x1, y1), (x2, y2) = corners
+        lines = []
+        if self._xSpec != 'none' and self._gridEnabled[0]:
+            lines.append(_segments(xpos, y1, xpos, y2))
+        if self._ySpec != 'none' and self._gridEnabled[1]:
+            lines.append(_segments(x1, ypos, x2, ypos))
+        _drawLineList(dc, lines)
 
     @TempStyle('pen')
-    def _drawTicks(self, dc, p1, p2, scale, shift, xticks, yticks):
+    def _drawTicks(self, dc, corners, xpos, ypos):
         """Draw the tick marks
 
         :param :class:`wx.DC` `dc`: The :class:`wx.DC` to draw on.
         :type `dc`: :class:`wx.DC`
-        :param p1: The lower-left hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p1 = (-10, -5)
-        :type p1: :class:`np.array`, length 2
-        :param p2: The upper-right hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p2 = (10, 5)
-        :type p2: :class:`np.array`, length 2
-        :param scale: The [X, Y] scaling factor to convert plot coords to
-                      DC coords
-        :type scale: :class:`np.array`, length 2
-        :param shift: The [X, Y] shift values to convert plot coords to
-                      DC coords. Must be in plot units, not DC units.
-        :type shift: :class:`np.array`, length 2
-        :param xticks: The X tick definition
-        :type xticks: list of length-2 lists
-        :param yticks: The Y tick definition
-        :type yticks: list of length-2 lists
+        :param corners: The lower-left and upper-right hand corners of the
+                        plot in DC coords, ``[[x1, y1], [x2, y2]]``
+        :type corners: :class:`np.array`, shape (2, 2)
+        :param xpos: The X tick positions in DC coords
+        :type xpos: :class:`np.array`
+        :param ypos: The Y tick positions in DC coords
+        :type ypos: :class:`np.array`
         """
         # TODO: add option for ticks to extend outside of graph
         #       - done via negative ticklength values?
@@ -2072,59 +2483,31 @@ class PlotCanvas(wx.Panel):
         # lengthen lines for printing
         xTickLength, yTickLength = self.GetTickLengthPrinterScale()
 
+        (x1, y1), (x2, y2) = corners
         ticks = self._ticksEnabled
+        lines = []
         if self._xSpec != 'none':  # I don't like this :-/
             if ticks.bottom:
-                lines = []
-                for x, label in xticks:
-                    pt = scale_and_shift_point(x, p1[1], scale, shift)
-                    lines.append((int(pt[0]), int(pt[1]), int(pt[0]),
-                                  int(pt[1] - xTickLength)))
-                dc.DrawLineList(lines)
+                lines.append(_segments(xpos, y1, xpos, y1 - xTickLength))
             if ticks.top:
-                lines = []
-                for x, label in xticks:
-                    pt = scale_and_shift_point(x, p2[1], scale, shift)
-                    lines.append((int(pt[0]), int(pt[1]), int(pt[0]),
-                                  int(pt[1] + xTickLength)))
-                dc.DrawLineList(lines)
+                lines.append(_segments(xpos, y2, xpos, y2 + xTickLength))
 
         if self._ySpec != 'none':
             if ticks.left:
-                lines = []
-                for y, label in yticks:
-                    pt = scale_and_shift_point(p1[0], y, scale, shift)
-                    lines.append((int(pt[0]), int(pt[1]),
-                                  int(pt[0] + yTickLength), int(pt[1])))
-                dc.DrawLineList(lines)
+                lines.append(_segments(x1, ypos, x1 + yTickLength, ypos))
             if ticks.right:
-                lines = []
-                for y, label in yticks:
-                    pt = scale_and_shift_point(p2[0], y, scale, shift)
-                    lines.append((int(pt[0]), int(pt[1]),
-                                  int(pt[0] - yTickLength), int(pt[1])))
-                dc.DrawLineList(lines)
+                lines.append(_segments(x2, ypos, x2 - yTickLength, ypos))
+        _drawLineList(dc, lines)
 
     @TempStyle('pen')
-    def _drawCenterLines(self, dc, p1, p2, scale, shift):
+    def _drawCenterLines(self, dc, corners):
         """Draws the center lines
 
         :param :class:`wx.DC` `dc`: The :class:`wx.DC` to draw on.
         :type `dc`: :class:`wx.DC`
-        :param p1: The lower-left hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p1 = (-10, -5)
-        :type p1: :class:`np.array`, length 2
-        :param p2: The upper-right hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p2 = (10, 5)
-        :type p2: :class:`np.array`, length 2
-        :param scale: The [X, Y] scaling factor to convert plot coords to
-                      DC coords
-        :type scale: :class:`np.array`, length 2
-        :param shift: The [X, Y] shift values to convert plot coords to
-                      DC coords. Must be in plot units, not DC units.
-        :type shift: :class:`np.array`, length 2
+        :param corners: The lower-left and upper-right hand corners of the
+                        plot in DC coords, ``[[x1, y1], [x2, y2]]``
+        :type corners: :class:`np.array`, shape (2, 2)
         """
         # increases thickness for printing only
         pen = self._centerLinePen
@@ -2132,78 +2515,49 @@ class PlotCanvas(wx.Panel):
         pen.SetWidth(int(penWidth))
         dc.SetPen(pen)
 
+        (x1, y1), (x2, y2) = corners
+        x, y = corners.mean(axis=0)
+        lines = []
         if self._centerLinesEnabled in ('Horizontal', True):
-            y1 = scale[1] * p1[1] + shift[1]
-            y2 = scale[1] * p2[1] + shift[1]
-            y = (y1 - y2) / 2.0 + y2
-            dc.DrawLine(int(scale[0] * p1[0] + shift[0]), int(y),
-                        int(scale[0] * p2[0] + shift[0]), int(y))
+            lines.append(_segments(x1, y, x2, y))
         if self._centerLinesEnabled in ('Vertical', True):
-            x1 = scale[0] * p1[0] + shift[0]
-            x2 = scale[0] * p2[0] + shift[0]
-            x = (x1 - x2) / 2.0 + x2
-            dc.DrawLine(int(x), int(scale[1] * p1[1] + shift[1]), int(x),
-                        int(scale[1] * p2[1] + shift[1]))
+            lines.append(_segments(x, y1, x, y2))
+        _drawLineList(dc, lines)
 
     @TempStyle('pen')
-    def _drawDiagonals(self, dc, p1, p2, scale, shift):
+    def _drawDiagonals(self, dc, corners):
         """
         Draws the diagonal lines.
 
         :param :class:`wx.DC` `dc`: The :class:`wx.DC` to draw on.
         :type `dc`: :class:`wx.DC`
-        :param p1: The lower-left hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p1 = (-10, -5)
-        :type p1: :class:`np.array`, length 2
-        :param p2: The upper-right hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p2 = (10, 5)
-        :type p2: :class:`np.array`, length 2
-        :param scale: The [X, Y] scaling factor to convert plot coords to
-                      DC coords
-        :type scale: :class:`np.array`, length 2
-        :param shift: The [X, Y] shift values to convert plot coords to
-                      DC coords. Must be in plot units, not DC units.
-        :type shift: :class:`np.array`, length 2
+        :param corners: The lower-left and upper-right hand corners of the
+                        plot in DC coords, ``[[x1, y1], [x2, y2]]``
+        :type corners: :class:`np.array`, shape (2, 2)
         """
         pen = self._diagonalPen
         penWidth = self.printerScale * pen.GetWidth()
         pen.SetWidth(int(penWidth))
         dc.SetPen(pen)
 
+        (x1, y1), (x2, y2) = corners
+        lines = []
         if self._diagonalsEnabled in ('Bottomleft-Topright', True):
-            dc.DrawLine(int(scale[0] * p1[0] + shift[0]),
-                        int(scale[1] * p1[1] + shift[1]),
-                        int(scale[0] * p2[0] + shift[0]),
-                        int(scale[1] * p2[1] + shift[1]))
+            lines.append(_segments(x1, y1, x2, y2))
         if self._diagonalsEnabled in ('Bottomright-Topleft', True):
-            dc.DrawLine(int(scale[0] * p1[0] + shift[0]),
-                        int(scale[1] * p2[1] + shift[1]),
-                        int(scale[0] * p2[0] + shift[0]),
-                        int(scale[1] * p1[1] + shift[1]))
+            lines.append(_segments(x1, y2, x2, y1))
+        _drawLineList(dc, lines)
 
     @TempStyle('pen')
-    def _drawAxes(self, dc, p1, p2, scale, shift):
+    def _drawAxes(self, dc, corners):
         """
         Draw the frame lines.
 
         :param :class:`wx.DC` `dc`: The :class:`wx.DC` to draw on.
         :type `dc`: :class:`wx.DC`
-        :param p1: The lower-left hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p1 = (-10, -5)
-        :type p1: :class:`np.array`, length 2
-        :param p2: The upper-right hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p2 = (10, 5)
-        :type p2: :class:`np.array`, length 2
-        :param scale: The [X, Y] scaling factor to convert plot coords to
-                      DC coords
-        :type scale: :class:`np.array`, length 2
-        :param shift: The [X, Y] shift values to convert plot coords to
-                      DC coords. Must be in plot units, not DC units.
-        :type shift: :class:`np.array`, length 2
+        :param corners: The lower-left and upper-right hand corners of the
+                        plot in DC coords, ``[[x1, y1], [x2, y2]]``
+        :type corners: :class:`np.array`, shape (2, 2)
         """
         # increases thickness for printing only
         pen = self._axesPen
@@ -2211,52 +2565,36 @@ class PlotCanvas(wx.Panel):
         pen.SetWidth(int(penWidth))
         dc.SetPen(pen)
 
+        (x1, y1), (x2, y2) = corners
         axes = self._axesEnabled
+        lines = []
         if self._xSpec != 'none':
             if axes.bottom:
-                lower, upper = p1[0], p2[0]
-                a1 = scale_and_shift_point(lower, p1[1], scale, shift)
-                a2 = scale_and_shift_point(upper, p1[1], scale, shift)
-                dc.DrawLine(int(a1[0]), int(a1[1]), int(a2[0]), int(a2[1]))
+                lines.append(_segments(x1, y1, x2, y1))
             if axes.top:
-                lower, upper = p1[0], p2[0]
-                a1 = scale_and_shift_point(lower, p2[1], scale, shift)
-                a2 = scale_and_shift_point(upper, p2[1], scale, shift)
-                dc.DrawLine(int(a1[0]), int(a1[1]), int(a2[0]), int(a2[1]))
+                lines.append(_segments(x1, y2, x2, y2))
 
         if self._ySpec != 'none':
             if axes.left:
-                lower, upper = p1[1], p2[1]
-                a1 = scale_and_shift_point(p1[0], lower, scale, shift)
-                a2 = scale_and_shift_point(p1[0], upper, scale, shift)
-                dc.DrawLine(int(a1[0]), int(a1[1]), int(a2[0]), int(a2[1]))
+                lines.append(_segments(x1, y1, x1, y2))
             if axes.right:
-                lower, upper = p1[1], p2[1]
-                a1 = scale_and_shift_point(p2[0], lower, scale, shift)
-                a2 = scale_and_shift_point(p2[0], upper, scale, shift)
-                dc.DrawLine(int(a1[0]), int(a1[1]), int(a2[0]), int(a2[1]))
+                lines.append(_segments(x2, y1, x2, y2))
+        _drawLineList(dc, lines)
 
     @TempStyle('pen')
-    def _drawAxesValues(self, dc, p1, p2, scale, shift, xticks, yticks):
+    def _drawAxesValues(self, dc, corners, xpos, ypos, xticks, yticks):
         """
         Draws the axes values: numbers representing each major grid or tick.
 
         :param :class:`wx.DC` `dc`: The :class:`wx.DC` to draw on.
         :type `dc`: :class:`wx.DC`
-        :param p1: The lower-left hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p1 = (-10, -5)
-        :type p1: :class:`np.array`, length 2
-        :param p2: The upper-right hand corner of the plot in plot coords. So,
-                   if the plot ranges from x=-10 to 10 and y=-5 to 5, then
-                   p2 = (10, 5)
-        :type p2: :class:`np.array`, length 2
-        :param scale: The [X, Y] scaling factor to convert plot coords to
-                      DC coords
-        :type scale: :class:`np.array`, length 2
-        :param shift: The [X, Y] shift values to convert plot coords to
-                      DC coords. Must be in plot units, not DC units.
-        :type shift: :class:`np.array`, length 2
+        :param corners: The lower-left and upper-right hand corners of the
+                        plot in DC coords, ``[[x1, y1], [x2, y2]]``
+        :type corners: :class:`np.array`, shape (2, 2)
+        :param xpos: The X tick positions in DC coords
+        :type xpos: :class:`np.array`
+        :param ypos: The Y tick positions in DC coords
+        :type ypos: :class:`np.array`
         :param xticks: The X tick definition
         :type xticks: list of length-2 lists
         :param yticks: The Y tick definition
@@ -2268,55 +2606,47 @@ class PlotCanvas(wx.Panel):
         xTickLength = xTickLength if xTickLength < 0 else 0
         yTickLength = yTickLength if yTickLength < 0 else 0
 
-        # TODO: More code duplication? Same as _drawGrid and _drawTicks?
         # TODO: update the bounding boxes when adding right and top values
+        (x1, y1), (x2, y2) = corners
         axes = self._axesValuesEnabled
         if self._xSpec != 'none':
+            labels = [tick[1] for tick in xticks]
             if axes.bottom:
-                labels = [tick[1] for tick in xticks]
                 coords = []
-                for x, label in xticks:
+                for x, label in zip(xpos, labels):
                     w = dc.GetTextExtent(label)[0]
-                    pt = scale_and_shift_point(x, p1[1], scale, shift)
                     coords.append(
-                        (int(pt[0] - w / 2),
-                         int(pt[1] + 2 * self._pointSize[1] - xTickLength)))
+                        (int(x - w / 2),
+                         int(y1 + 2 * self._pointSize[1] - xTickLength)))
                 dc.DrawTextList(labels, coords)
 
             if axes.top:
-                labels = [tick[1] for tick in xticks]
                 coords = []
-                for x, label in xticks:
+                for x, label in zip(xpos, labels):
                     w, h = dc.GetTextExtent(label)
-                    pt = scale_and_shift_point(x, p2[1], scale, shift)
-                    coords.append((int(pt[0] - w / 2),
-                                   int(pt[1] - 2 * self._pointSize[1] - h -
+                    coords.append((int(x - w / 2),
+                                   int(y2 - 2 * self._pointSize[1] - h -
                                        xTickLength)))
                 dc.DrawTextList(labels, coords)
 
         if self._ySpec != 'none':
+            h = dc.GetCharHeight()
+            labels = [tick[1] for tick in yticks]
             if axes.left:
-                h = dc.GetCharHeight()
-                labels = [tick[1] for tick in yticks]
                 coords = []
-                for y, label in yticks:
+                for y, label in zip(ypos, labels):
                     w = dc.GetTextExtent(label)[0]
-                    pt = scale_and_shift_point(p1[0], y, scale, shift)
                     coords.append(
-                        (int(pt[0] - w - 3 * self._pointSize[0] + yTickLength),
-                         int(pt[1] - 0.5 * h)))
+                        (int(x1 - w - 3 * self._pointSize[0] + yTickLength),
+                         int(y - 0.5 * h)))
                 dc.DrawTextList(labels, coords)
 
             if axes.right:
-                h = dc.GetCharHeight()
-                labels = [tick[1] for tick in yticks]
                 coords = []
-                for y, label in yticks:
-                    w = dc.GetTextExtent(label)[0]
-                    pt = scale_and_shift_point(p2[0], y, scale, shift)
+                for y, label in zip(ypos, labels):
                     coords.append(
-                        (int(pt[0] + 3 * self._pointSize[0] + yTickLength),
-                         int(pt[1] - 0.5 * h)))
+                        (int(x2 + 3 * self._pointSize[0] + yTickLength),
+                         int(y - 0.5 * h)))
                 dc.DrawTextList(labels, coords)
 
     @TempStyle('pen')
@@ -2345,23 +2675,31 @@ class PlotCanvas(wx.Panel):
         :param yticks: The Y tick definition
         :type yticks: list of length-2 lists
         """
+        # one scale and shift for every element, each draws one line list
+        corners = np.array((p1, p2), np.float64) * scale + shift
+        # ticks are None when the axis spec is 'none'
+        xpos = np.array([tick[0] for tick in xticks or ()], np.float64)
+        xpos = xpos * scale[0] + shift[0]
+        ypos = np.array([tick[0] for tick in yticks or ()], np.float64)
+        ypos = ypos * scale[1] + shift[1]
+
         if self._gridEnabled:
-            self._drawGrid(dc, p1, p2, scale, shift, xticks, yticks)
+            self._drawGrid(dc, corners, xpos, ypos)
 
         if self._ticksEnabled:
-            self._drawTicks(dc, p1, p2, scale, shift, xticks, yticks)
+            self._drawTicks(dc, corners, xpos, ypos)
 
         if self._centerLinesEnabled:
-            self._drawCenterLines(dc, p1, p2, scale, shift)
+            self._drawCenterLines(dc, corners)
 
         if self._diagonalsEnabled:
-            self._drawDiagonals(dc, p1, p2, scale, shift)
+            self._drawDiagonals(dc, corners)
 
         if self._axesEnabled:
-            self._drawAxes(dc, p1, p2, scale, shift)
+            self._drawAxes(dc, corners)
 
         if self._axesValuesEnabled:
-            self._drawAxesValues(dc, p1, p2, scale, shift, xticks, yticks)
+            self._drawAxesValues(dc, corners, xpos, ypos, xticks, yticks)
 
     @TempStyle('pen')
     def _drawPlotTitle(self, dc, graphics: PlotGraphics, lhsW, rhsW, titleWH):
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
 from collections import namedtuple
-from typing import List, Literal, Optional, Sequence, Tuple, Union
+from concurrent.futures import Executor
+from itertools import chain
+from typing import (Callable, List, Literal, MutableMapping, Optional, Sequence,
+                    Tuple, Union)
 
 import numpy as np
 import wx
@@ -9,7 +12,11 @@ from numpy.typing import NDArray
 from wx.lib.plot.polyobjects import PlotGraphics as _PlotGraphics
 from wx.lib.plot.polyobjects import PlotPrintout
 from wx.lib.plot.polyobjects import PolyPoints as _PolyPoints
-from wx.lib.plot.utils import TempStyle, pairwise
+from wx.lib.plot.utils import TempStyle
+
+from . import raster
+from .colourmaps import colour_lut, group_by_index, quantize
+from .sketch import QuantileSketch, Reservoir
 
 LINESTYLE = {
     '-': wx.PENSTYLE_SOLID,
@@ -29,6 +36,157 @@ BRUSHSTYLE = {
     wx.BRUSHSTYLE_SOLID: wx.BRUSHSTYLE_SOLID,
     wx.BRUSHSTYLE_TRANSPARENT: wx.BRUSHSTYLE_TRANSPARENT,
 }
+# screen coordinates are clipped to this range before the int32 cast
+_INT_LIMIT = 2**30
+# draws an object into an RGBA buffer at the given screen origin
+RasterJob = Callable[[NDArray[np.uint8], Tuple[int, int]], None]
+
+
+def _sameScale(scale, current) -> bool:
+    """
+    True if two `(x, y)` scales are equal up to float rounding.
+
+    Panning recomputes the scale from shifted axes, which changes its last
+    bits, so an exact comparison would miss most shift-only updates.
+    """
+    return (abs(scale[0] - current[0]) <= 1e-12 * abs(current[0])
+            and abs(scale[1] - current[1]) <= 1e-12 * abs(current[1]))
+
+
+def _decimate(coords: NDArray[np.int32], step: int = 1) -> NDArray[np.int32]:
+    """
+    Min/max decimation of a polyline in screen coordinates.
+
+    Each run of consecutive points in the same ``step`` pixels wide column
+    is replaced by its first, lowest, highest and last point, which keeps
+    the drawn envelope of dense series.
+
+    Parameters
+    ----------
+    coords : NDArray, shape ``(n, 2)``
+        The integer screen coordinates.
+    step : int
+        The column width in pixels.
+
+    Returns
+    -------
+    NDArray
+        The decimated coordinates, or ``coords`` itself if decimation
+        would not remove points.
+    """
+    n = len(coords)
+    if n <= 4:
+        return coords
+    col = coords[:, 0] // step
+    starts = np.flatnonzero(np.r_[True, col[1:] != col[:-1]])
+    if 4 * len(starts) >= n:
+        return coords
+    ends = np.r_[starts[1:], n] - 1
+    y = coords[:, 1]
+    out = np.empty((len(starts), 4, 2), np.int32)
+    out[:, 0] = coords[starts]
+    out[:, 1, 0] = out[:, 2, 0] = coords[starts, 0]
+    out[:, 1, 1] = np.minimum.reduceat(y, starts)
+    out[:, 2, 1] = np.maximum.reduceat(y, starts)
+    out[:, 3] = coords[ends]
+    return out.reshape(-1, 2)
+
+
+def _clipBox(dc: wx.DC) -> Tuple[int, int, int, int]:
+    """The ``(x, y, width, height)`` drawn area: the clipping box, or the
+    whole DC if no clipping region is set."""
+    bounds = tuple(dc.GetClippingBox())
+    if bounds[2] <= 0 or bounds[3] <= 0:
+        bounds = (0, 0) + tuple(dc.GetSize())
+    return bounds
+
+
+def _visibleSlice(sx: NDArray, dc: Union[wx.DC, Tuple[int, int, int, int]],
+                  margin: int = 1) -> slice:
+    """
+    The slice of the ascending screen x coordinates `sx` inside the drawn
+    area of the DC (or the given ``(x, y, width, height)`` box), with
+    `margin` points on both sides so that lines leave the area instead of
+    stopping at its edge.
+    """
+    x, _, w, _ = dc if isinstance(dc, tuple) else _clipBox(dc)
+    start = max(int(np.searchsorted(sx, x, 'left')) - margin, 0)
+    stop = int(np.searchsorted(sx, x + w, 'right')) + margin
+    return slice(start, stop)
+
+
+def _axisScale(values: NDArray[np.float64], obj: 'PolyPoints',
+               axis: int) -> NDArray[np.float64]:
+    """Applies the abs and log10 scales of `obj` along `axis` to values"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if obj._absScale[axis]:
+            values = np.abs(values)
+        if obj._logscale[axis]:
+            values = np.log10(values)
+    return values
+
+
+def _toScreen(values: NDArray[np.float64], obj: 'PolyPoints',
+              axis: int) -> NDArray[np.float64]:
+    """
+    Plot values along `axis` to screen coordinates with the current scale
+    and shift of `obj`. Unlike ``obj.scaled``, no rows are dropped: values
+    outside a log scale become NaN or -inf.
+    """
+    values = _axisScale(values, obj, axis)
+    return values * obj.currentScale[axis] + obj.currentShift[axis]
+
+
+def _mergeNarrowRects(rects: NDArray[np.float64]) -> NDArray[np.int32]:
+    """
+    Converts ``(x, y, width, height)`` screen rectangles to int32, merging
+    those narrower than a pixel.
+
+    The narrow rectangles starting in the same pixel column are replaced by
+    one 1 pixel wide rectangle covering their vertical extent, which is
+    what they would paint anyway.
+
+    Parameters
+    ----------
+    rects : NDArray, shape ``(n, 4)``
+        The rectangles in screen coordinates, width and height may be
+        negative.
+
+    Returns
+    -------
+    NDArray, shape ``(m, 4)``
+        The wide rectangles followed by the merged narrow ones.
+    """
+    narrow = np.abs(rects[:, 2]) < 1
+    if np.count_nonzero(narrow) > 1:
+        thin = rects[narrow]
+        col = np.floor(np.minimum(thin[:, 0], thin[:, 0] + thin[:, 2]))
+        top = np.minimum(thin[:, 1], thin[:, 1] + thin[:, 3])
+        bottom = np.maximum(thin[:, 1], thin[:, 1] + thin[:, 3])
+        order = np.argsort(col, kind='stable')
+        col, top, bottom = col[order], top[order], bottom[order]
+        starts = np.flatnonzero(np.r_[True, col[1:] != col[:-1]])
+        merged = np.empty((len(starts), 4))
+        merged[:, 0] = col[starts]
+        merged[:, 1] = np.minimum.reduceat(top, starts)
+        merged[:, 2] = 1
+        merged[:, 3] = np.maximum.reduceat(bottom, starts) - merged[:, 1]
+        rects = np.concatenate((rects[~narrow], merged))
+    return _int32(rects)
+
+
+def _rgba(colour) -> Tuple[int, int, int, int]:
+    """The RGBA tuple of a colour, for the raster backend"""
+    if not isinstance(colour, wx.Colour):
+        colour = wx.Colour(colour)
+    return tuple(colour.Get(True))
+
+
+def _int32(a: NDArray[np.float64]) -> NDArray[np.int32]:
+    """Screen coordinates to int32, clipped and truncated like int()"""
+    out = np.empty(np.shape(a), np.int32)
+    np.clip(a, -_INT_LIMIT, _INT_LIMIT, out=out, casting='unsafe')
+    return out
 
 
 class PolyPoints(_PolyPoints):
@@ -41,6 +199,16 @@ class PolyPoints(_PolyPoints):
     currentScale: Tuple[float, float]
     currentShift: Tuple[float, float]
     scaled: NDArray[np.float64]
+    _screen: Optional[NDArray[np.int32]] = None
+    _screenValid: bool = False
+    _scaledFor: Optional[tuple] = None
+    _useSprites: bool = False
+    # interaction level-of-detail, set by the canvas while dragging/zooming
+    _hideMarkers: bool = False
+    _decimation: int = 0
+    # bumped by every change of the data or style, keys cached drawings
+    _version: int = 0
+    _visible: bool = True
 
     def __init__(self, points, **attr):
         _PolyPoints.__init__(self, points, attr)
@@ -55,9 +223,130 @@ class PolyPoints(_PolyPoints):
                     err_txt = 'Style attribute incorrect. Should be one of {}'
                     raise KeyError(err_txt.format(style.keys()))
 
+    @property
+    def points(self) -> NDArray[np.float64]:
+        """
+        Get or set the plotted points. Override property.
+
+        Setting the points marks the object as changed.
+        """
+        return _PolyPoints.points.fget(self)
+
+    @points.setter
+    def points(self, points):
+        self._points = np.asarray(points, np.float64)
+        self._scaledFor = None  # scale the new points on the next draw
+        self.markChanged()
+
+    def markChanged(self) -> None:
+        """
+        Marks the object as changed, so cached drawings of it are redrawn.
+
+        Call this after changing `attributes` or the data in place.
+        """
+        self._version += 1
+
+    def setVisible(self, visible: bool = True) -> None:
+        """
+        Shows or hides the object. A hidden object keeps its legend entry.
+
+        The change is shown by the next drawing, so call
+        ``canvas.Redraw()`` afterwards. The visibility is not part of the
+        version: with the canvas layer cache, toggling only recomposites
+        the cached layers.
+        """
+        self._visible = bool(visible)
+
+    def getVisible(self) -> bool:
+        """Whether the object is drawn"""
+        return self._visible
+
+    def _rescaleMode(self, scale, shift) -> Optional[str]:
+        """
+        How `self.scaled` must follow a new scale and shift.
+
+        Returns None if nothing changed, 'shift' if only the shift changed
+        (e.g. panning), so the scaled data can be translated in place, or
+        'full' if the data must be scaled again.
+        """
+        if (self._scaledFor != (self._logscale, self._absScale)
+                or not _sameScale(scale, self.currentScale)):
+            return 'full'
+        if list(shift) != list(self.currentShift):
+            return 'shift'
+        return None
+
+    def scaleAndShift(self, scale=(1, 1), shift=(0, 0)):
+        """
+        Scales and shifts the data for plotting. Override method.
+
+        A shift-only update translates the existing scaled data in place.
+        Also marks the cached integer screen coordinates as stale.
+        """
+        mode = self._rescaleMode(scale, shift)
+        if mode == 'full':
+            points = self.points
+            if len(points) == 0:
+                # no curves to draw
+                return
+            self.scaled = scale * points + shift
+            self.currentScale = scale
+            self._scaledFor = (self._logscale, self._absScale)
+        elif mode == 'shift':
+            self.scaled += np.subtract(shift, self.currentShift)
+        else:
+            # unchanged use the current scaling
+            return
+        self.currentShift = shift
+        self._screenValid = False
+
+    def _screenCoords(self) -> NDArray[np.int32]:
+        """
+        Returns ``self.scaled`` as C-contiguous int32 screen coordinates.
+
+        The buffer is cached: it is reused while `currentScale` and
+        `currentShift` are unchanged (repaints, point labels, print
+        previews of the same view) and rewritten in place otherwise.
+        """
+        scaled = self.scaled
+        buf = self._screen
+        if buf is None or buf.shape != scaled.shape:
+            buf = self._screen = np.empty(scaled.shape, np.int32)
+            self._screenValid = False
+        if not self._screenValid:
+            # truncates toward zero like int()
+            np.clip(scaled, -_INT_LIMIT, _INT_LIMIT, out=buf, casting='unsafe')
+            self._screenValid = True
+        return buf
+
     def draw(self, dc: wx.DC, printerScale: float, coord: Optional[NDArray[np.float64]] = None):
         raise NotImplementedError
 
+    def _rasterJob(self, dc: wx.DC, printerScale: float) -> Optional[RasterJob]:
+        """
+        Prepares drawing the object with the raster backend.
+
+        Everything needing wx (colours, pens, sprites) is done here, on the
+        UI thread. The returned job only uses NumPy, so it may run on a
+        worker thread.
+
+        Parameters
+        ----------
+        dc : `wx.DC`
+            The DC the buffer will be drawn on.
+        printerScale : float
+            The printer scale.
+
+        Returns
+        -------
+        RasterJob | None
+            ``job(buf, origin)`` drawing the object into the ``(height,
+            width, 4)`` RGBA buffer whose top left pixel is at the screen
+            coordinates `origin`, or None if the object does not support
+            the raster backend and must be drawn on the DC instead.
+        """
+        return None
+
     def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
         self.draw(dc, printerScale, coord)
 
@@ -128,35 +417,88 @@ class PolyMarker(PolyPoints):
                             marker=marker,
                             legend=legend)
 
-    def draw(self, dc: wx.DC, printerScale: float, coord: Optional[NDArray[np.float64]] = None):
-        """ Draw the points """
+    def _markerStyle(self, printerScale: float) -> Tuple[wx.Pen, wx.Brush, float]:
+        """The pen, brush and size of the markers"""
         colour = self.attributes['colour']
         width = self.attributes['width'] * printerScale * self._pointSize[0]
         size = self.attributes['size'] * printerScale * self._pointSize[0]
         fillcolour = self.attributes['fillcolour']
         fillstyle = self.attributes['fillstyle']
-        marker = self.attributes['marker']
 
         if colour and not isinstance(colour, wx.Colour):
             colour = wx.Colour(colour)
         if fillcolour and not isinstance(fillcolour, wx.Colour):
             fillcolour = wx.Colour(fillcolour)
 
-        dc.SetPen(wx.Pen(colour, int(width)))
+        pen = wx.Pen(colour, int(width))
         if fillcolour:
-            dc.SetBrush(wx.Brush(fillcolour, fillstyle))
+            brush = wx.Brush(fillcolour, fillstyle)
         else:
-            dc.SetBrush(wx.Brush(colour, fillstyle))
+            brush = wx.Brush(colour, fillstyle)
+        return pen, brush, size
+
+    def draw(self, dc: wx.DC, printerScale: float, coord: Optional[NDArray[np.float64]] = None):
+        """ Draw the points """
+        pen, brush, size = self._markerStyle(printerScale)
+        marker = self.attributes['marker']
+        dc.SetPen(pen)
+        dc.SetBrush(brush)
         if coord is None:
+            if self._hideMarkers:
+                marker = 'dot'  # keep the data visible at the lowest cost
             if len(self.scaled):  # bugfix for Mac OS X
-                self._drawmarkers(dc, self.scaled, marker, size)
+                if self._useSprites and marker != 'dot':
+                    self._drawsprites(dc, self._screenCoords(), marker, size,
+                                      pen, brush)
+                else:
+                    self._drawmarkers(dc, self._screenCoords(), marker, size)
         else:
             self._drawmarkers(dc, coord, marker, size)  # draw legend marker
 
     def _drawmarkers(self, dc, coords, marker, size):
+        coords = np.asarray(coords)
+        if coords.dtype != np.int32:
+            coords = coords.astype(np.int32)
         f = getattr(self, '_{}'.format(marker))
         f(dc, coords, size)
 
+    def _sprite(self, dc, marker, size, pen, brush) -> NDArray[np.uint8]:
+        """The marker rendered once into an RGBA sprite"""
+        if marker == 'dot':
+            return np.asarray(_rgba(pen.GetColour()), np.uint8).reshape(1, 1, 4)
+        antialias = isinstance(dc, wx.GCDC)
+        key = (marker, size, pen.GetColour().Get(), pen.GetWidth(),
+               brush.GetColour().Get(), brush.GetStyle(), antialias)
+
+        def draw(sdc, centre):
+            sdc.SetPen(pen)
+            sdc.SetBrush(brush)
+            self._drawmarkers(sdc, np.array([[centre, centre]]), marker, size)
+
+        side = int(np.ceil(5 * size + 2 * pen.GetWidth())) + 2
+        return raster.render_sprite(key, draw, side, antialias)
+
+    def _drawsprites(self, dc, coords, marker, size, pen, brush):
+        """
+        Renders the marker once into a sprite, stamps it on every point in a
+        NumPy RGBA buffer and draws that buffer with one ``DrawBitmap``.
+        """
+        sprite = self._sprite(dc, marker, size, pen, brush)
+        buf, x, y = raster.sprite_layer(coords, sprite, _clipBox(dc))
+        if buf is not None:
+            raster.blit_rgba(dc, buf, x, y)
+
+    def _rasterJob(self, dc, printerScale) -> Optional[RasterJob]:
+        """Stamps the marker sprite on every point"""
+        pen, brush, size = self._markerStyle(printerScale)
+        marker = 'dot' if self._hideMarkers else self.attributes['marker']
+        sprite = self._sprite(dc, marker, size, pen, brush)
+
+        def job(buf, origin):
+            if len(self.scaled):
+                raster.stamp_sprite(buf, sprite, self._screenCoords(), origin)
+        return job
+
     def getSymExtent(self, printerScale: float) -> Tuple[float, float]:
         """Width and Height of Marker"""
         s = 5 * self.attributes['size'] * printerScale * self._pointSize[0]
@@ -165,48 +507,49 @@ class PolyMarker(PolyPoints):
     def _circle(self, dc, coords, size=1):
         fact = 2.5 * size
         wh = 5.0 * size
-        rect = np.zeros((len(coords), 4), float) + [0.0, 0.0, wh, wh]
-        rect[:, 0:2] = coords - [fact, fact]
-        dc.DrawEllipseList(rect.astype(np.int64))
+        rect = np.empty((len(coords), 4), np.int32)
+        rect[:, 0:2] = coords - fact
+        rect[:, 2:] = wh
+        dc.DrawEllipseList(rect)
 
     def _dot(self, dc, coords, size=1):
-        coords = [(int(c[0]), int(c[1])) for c in coords]
         dc.DrawPointList(coords)
 
     def _square(self, dc, coords, size=1):
         fact = 2.5 * size
         wh = 5.0 * size
-        rect = np.zeros((len(coords), 4), float) + [0.0, 0.0, wh, wh]
-        rect[:, 0:2] = coords - [fact, fact]
-        dc.DrawRectangleList(rect.astype(np.int64))
+        rect = np.empty((len(coords), 4), np.int32)
+        rect[:, 0:2] = coords - fact
+        rect[:, 2:] = wh
+        dc.DrawRectangleList(rect)
 
     def _triangle(self, dc, coords, size=1):
         shape = [(-2.5 * size, 1.44 * size), (2.5 * size, 1.44 * size),
                  (0.0, -2.88 * size)]
-        poly = np.repeat(coords, 3, 0)
-        poly.shape = (len(coords), 3, 2)
-        poly += shape
-        dc.DrawPolygonList(poly.astype(np.int64))
+        poly = np.empty((len(coords), 3, 2), np.int32)
+        poly[:] = coords[:, None, :] + shape
+        dc.DrawPolygonList(poly)
 
     def _triangle_down(self, dc, coords, size=1):
         shape = [(-2.5 * size, -1.44 * size), (2.5 * size, -1.44 * size),
                  (0.0, 2.88 * size)]
-        poly = np.repeat(coords, 3, 0)
-        poly.shape = (len(coords), 3, 2)
-        poly += shape
-        dc.DrawPolygonList(poly.astype(np.int64))
+        poly = np.empty((len(coords), 3, 2), np.int32)
+        poly[:] = coords[:, None, :] + shape
+        dc.DrawPolygonList(poly)
 
     def _cross(self, dc, coords, size=1):
         fact = 2.5 * size
+        lines = np.empty((len(coords), 4), np.int32)
         for f in [[-fact, -fact, fact, fact], [-fact, fact, fact, -fact]]:
-            lines = np.concatenate((coords, coords), axis=1) + f
-            dc.DrawLineList(lines.astype(np.int64))
+            lines[:] = np.concatenate((coords, coords), axis=1) + f
+            dc.DrawLineList(lines)
 
     def _plus(self, dc, coords, size=1):
         fact = 2.5 * size
+        lines = np.empty((len(coords), 4), np.int32)
         for f in [[-fact, 0, fact, 0], [0, -fact, 0, fact]]:
-            lines = np.concatenate((coords, coords), axis=1) + f
-            dc.DrawLineList(lines.astype(np.int64))
+            lines[:] = np.concatenate((coords, coords), axis=1) + f
+            dc.DrawLineList(lines)
 
 
 class PolyLine(PolyMarker):
@@ -256,8 +599,23 @@ class PolyLine(PolyMarker):
         The fill colour of the marker. If None, the outline colour is used
     fillstyle : {'solid', 'transparent'}
         The fill style of the marker
-        
-    
+    values : sequence of float | None
+        Colours each segment by a value, e.g. the speed along a trajectory.
+        Either one value per segment (``len(points) - 1``) or one per point,
+        in which case a segment takes the mean of its two points. Segments
+        with a non-finite value are not drawn. `colour` is then replaced by
+        the middle colour of `cmap`, used for the legend and markers.
+    cmap : str | sequence of colours
+        The colour map of `values`, a name in `colourmaps.COLOURMAPS` or a
+        list of colours
+    ncolours : int
+        The number of colour bins of `values`, each drawn with one
+        ``DrawLineList``
+    vmin : float, optional
+        The value of the first colour. Default is the lowest value.
+    vmax : float, optional
+        The value of the last colour. Default is the highest value.
+
     Warning
     -------
        All methods except ``__init__`` are private.
@@ -276,6 +634,8 @@ class PolyLine(PolyMarker):
     }
     _drawstyles = ('line', 'steps-pre', 'steps-post', 'steps-mid-x',
                    'steps-mid-y')
+    # (order, starts, colours) of the segments grouped by colour bin
+    _segmentColours: Optional[tuple] = None
 
     def __init__(self,
                  points,
@@ -290,7 +650,15 @@ class PolyLine(PolyMarker):
                                  'triangle_down', 'cross', 'plus', 'none'] = 'none',
                  size: float = 2.,
                  fillcolour=None,
-                 fillstyle: Literal['solid', 'transparent'] = 'solid'):
+                 fillstyle: Literal['solid', 'transparent'] = 'solid',
+                 values=None,
+                 cmap='viridis',
+                 ncolours: int = 64,
+                 vmin: Optional[float] = None,
+                 vmax: Optional[float] = None):
+        if values is not None:
+            colour = self._setSegmentValues(len(points), values, cmap,
+                                            ncolours, vmin, vmax)
         PolyPoints.__init__(self,
                             points,
                             colour=colour,
@@ -303,6 +671,60 @@ class PolyLine(PolyMarker):
                             fillstyle=fillstyle,
                             marker=marker)
 
+    def _setSegmentValues(self, npoints, values, cmap, ncolours, vmin,
+                          vmax) -> wx.Colour:
+        """
+        Quantizes the segment values into colour bins.
+
+        Returns the middle colour of the colour map.
+        """
+        values = np.asarray(values, np.float64).ravel()
+        if len(values) == npoints:
+            values = (values[:-1] + values[1:]) / 2
+        elif len(values) != npoints - 1:
+            raise ValueError('`values` must have one value per point or '
+                             'per segment')
+        if not isinstance(ncolours, int) or ncolours < 1:
+            raise ValueError('`ncolours` must be a positive int')
+        self.values = values
+        self.lut = colour_lut(cmap, ncolours)
+        self._segmentColours = group_by_index(
+            quantize(values, ncolours, vmin, vmax))
+        return wx.Colour(*self.lut[ncolours // 2])
+
+    def _drawColoured(self, dc, drawstyle, width, style):
+        """Draws the segments, one ``DrawLineList`` per colour bin"""
+        order, starts, colours = self._segmentColours
+        if any(self._logscale):
+            # self.scaled lacks the rows a log scale drops, but segment i
+            # must stay between points i and i + 1 to match values[i]
+            coords = np.column_stack((_toScreen(self._points[:, 0], self, 0),
+                                      _toScreen(self._points[:, 1], self, 1)))
+            finite = np.isfinite(coords).all(axis=1)
+            keep = (finite[:-1] & finite[1:])[order]
+            coords = _int32(np.where(finite[:, None], coords, 0))
+        else:
+            coords = self._screenCoords()
+            keep = None
+        path = self._path(coords, drawstyle)
+        # every segment is `step` path pieces long
+        step = (len(path) - 1) // (len(coords) - 1)
+        lines = np.concatenate((path[:-1], path[1:]), axis=1)
+        lines = lines[(order[:, None] * step + np.arange(step)).ravel()]
+        if keep is not None:
+            keep = np.repeat(keep, step)
+        ends = np.r_[starts[1:], len(order)]
+        for start, end, k in zip(starts, ends, colours):
+            segments = lines[start * step:end * step]
+            if keep is not None:
+                segments = segments[keep[start * step:end * step]]
+            if not len(segments):
+                continue
+            pen = wx.Pen(wx.Colour(*self.lut[k]), width, style)
+            pen.SetCap(wx.CAP_ROUND)  # no gaps at the joints
+            dc.SetPen(pen)
+            dc.DrawLineList(segments)
+
     def _draw(self, dc, printerScale, coord):
         """
         Draw the lines.
@@ -318,13 +740,47 @@ class PolyLine(PolyMarker):
         pen.SetCap(wx.CAP_BUTT)
         dc.SetPen(pen)
         if coord is None:
-            if len(self.scaled):  # bugfix for Mac OS X
-                for c1, c2 in zip(self.scaled, self.scaled[1:]):
-                    self._path(dc, c1, c2, drawstyle)
+            if len(self.scaled) >= 2:  # bugfix for Mac OS X
+                if self._segmentColours is not None:
+                    self._drawColoured(dc, drawstyle, int(width), style)
+                    return
+                coords = self._screenCoords()
+                if self._decimation and drawstyle == 'line':
+                    coords = _decimate(coords, self._decimation)
+                dc.DrawLines(self._path(coords, drawstyle))
         else:
             coord = [(int(c[0]), int(c[1])) for c in coord]
             dc.DrawLines(coord)  # draw legend line
 
+    def _linePath(self, coords: NDArray[np.int32],
+                  bounds: Tuple[int, int, int, int]) -> NDArray[np.int32]:
+        """The polyline the raster backend draws through the points"""
+        drawstyle = self.attributes['drawstyle']
+        if drawstyle == 'line':
+            # one span per pixel column draws the same pixels
+            coords = _decimate(coords, max(self._decimation, 1))
+        return self._path(coords, drawstyle)
+
+    def _rasterJob(self, dc, printerScale) -> Optional[RasterJob]:
+        """Draws the lines and markers into the buffer"""
+        if self._segmentColours is not None:
+            return None
+        colour = _rgba(self.attributes['colour'])
+        width = int(self.attributes['width'] * printerScale * self._pointSize[0])
+        style = self.attributes['style']
+        bounds = _clipBox(dc)
+        markers = None
+        if self.attributes['marker'] != 'none' and not self._hideMarkers:
+            markers = PolyMarker._rasterJob(self, dc, printerScale)
+
+        def job(buf, origin):
+            if len(self.scaled) >= 2:
+                path = self._linePath(self._screenCoords(), bounds)
+                raster.draw_lines(buf, path, colour, width, style, origin)
+            if markers is not None:
+                markers(buf, origin)
+        return job
+
     def draw(self, dc, printerScale: float, coord: Optional[NDArray[np.float64]] = None):
         """
         Draw the lines with marker.
@@ -340,6 +796,8 @@ class PolyLine(PolyMarker):
         """
         self._draw(dc, printerScale, coord)
         if self.attributes['marker'] != 'none':
+            if coord is None and self._hideMarkers:
+                return
             super().draw(dc, printerScale, coord)
 
     def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]) -> None:
@@ -373,57 +831,67 @@ class PolyLine(PolyMarker):
         s = 0 if self.attributes['marker'] == 'none' else 5 * self.attributes['size'] * a
         return max(s, w), max(s, h)
 
-    def _path(self, dc, coord1: List[float], coord2: List[float],
-              drawstyle: str):
+    def _path(self, coords: NDArray[np.int32], drawstyle: str) -> NDArray[np.int32]:
         """
-        Calculates the path from coord1 to coord 2 along X and Y
+        Calculates the whole path through coords along X and Y
 
         Parameters
         ----------
-        dc : `wx.DC`
-            The `wx.DC` to draw on.
-        coord1 : list, length 2: ``[x, y]``
-            The first coordinate in the coord pair.
-        coord2 : list, length 2: ``[x, y]``
-            The second coordinate in the coord pair.
+        coords : NDArray, shape ``(n, 2)``
+            The integer screen coordinates of the points.
         drawstyle : str
             The type of connector to use.
+
+        Returns
+        -------
+        NDArray
+            The points of the path, drawn with a single ``DrawLines``.
         """
+        c1, c2 = coords[:-1], coords[1:]
         if drawstyle == 'line':
             # Straight line between points.
-            line = [coord1, coord2]
+            return coords
         elif drawstyle == 'steps-pre':
             # Up/down to next Y, then right to next X
-            intermediate = [coord1[0], coord2[1]]
-            line = [coord1, intermediate, coord2]
+            line = np.empty((2 * len(coords) - 1, 2), np.int32)
+            line[1::2, 0] = c1[:, 0]
+            line[1::2, 1] = c2[:, 1]
         elif drawstyle == 'steps-post':
             # Right to next X, then up/down to Y
-            intermediate = [coord2[0], coord1[1]]
-            line = [coord1, intermediate, coord2]
+            line = np.empty((2 * len(coords) - 1, 2), np.int32)
+            line[1::2, 0] = c2[:, 0]
+            line[1::2, 1] = c1[:, 1]
         elif drawstyle == 'steps-mid-x':
             # need 3 lines between points: right -> up/down -> right
-            mid_x = ((coord2[0] - coord1[0]) / 2) + coord1[0]
-            intermediate1 = [mid_x, coord1[1]]
-            intermediate2 = [mid_x, coord2[1]]
-            line = [coord1, intermediate1, intermediate2, coord2]
+            line = np.empty((3 * len(coords) - 2, 2), np.int32)
+            mid_x = (c1[:, 0] + c2[:, 0]) // 2
+            line[1::3, 0] = line[2::3, 0] = mid_x
+            line[1::3, 1] = c1[:, 1]
+            line[2::3, 1] = c2[:, 1]
         elif drawstyle == 'steps-mid-y':
             # need 3 lines between points: up/down -> right -> up/down
-            mid_y = ((coord2[1] - coord1[1]) / 2) + coord1[1]
-            intermediate1 = [coord1[0], mid_y]
-            intermediate2 = [coord2[0], mid_y]
-            line = [coord1, intermediate1, intermediate2, coord2]
+            line = np.empty((3 * len(coords) - 2, 2), np.int32)
+            mid_y = (c1[:, 1] + c2[:, 1]) // 2
+            line[1::3, 1] = line[2::3, 1] = mid_y
+            line[1::3, 0] = c1[:, 0]
+            line[2::3, 0] = c2[:, 0]
         else:
             err_txt = 'Invalid drawstyle \'{}\'. Must be one of {}.'
             raise ValueError(err_txt.format(drawstyle, self._drawstyles))
 
-        line = [(int(p[0]), int(p[1])) for p in line]
-        dc.DrawLines(line)
+        step = 2 if drawstyle in ('steps-pre', 'steps-post') else 3
+        line[::step] = coords
+        return line
 
 
 class PolySpline(PolyLine):
     """
-    Creates PolySpline object
-    
+    Creates PolySpline object: a smooth curve through the points.
+
+    The curve is a Catmull-Rom spline over the visible points, evaluated
+    with NumPy and drawn as one polyline, so long series cost about the
+    same as a `PolyLine`.
+
     Parameters
     ----------
     points : list of `[x, y]` values
@@ -473,6 +941,9 @@ class PolySpline(PolyLine):
         'fillstyle': wx.BRUSHSTYLE_SOLID,
         'marker': 'none'
     }
+    # pixels per curve vertex, and the most vertices per segment
+    _SPLINE_STEP = 4
+    _SPLINE_MAX = 32
 
     def __init__(self,
                  points,
@@ -497,8 +968,44 @@ class PolySpline(PolyLine):
                             fillstyle=fillstyle,
                             marker=marker)
 
+    def _linePath(self, coords: NDArray[np.int32],
+                  bounds: Tuple[int, int, int, int]) -> NDArray[np.int32]:
+        """
+        The spline through the visible points as one polyline.
+
+        For points ascending in x, only the visible ones and two neighbours
+        on each side are used. When there are more points than pixel
+        columns the curve is not visible anyway, so the min/max decimated
+        points are joined with straight lines. Otherwise every segment is
+        evaluated as a uniform Catmull-Rom curve, which passes through the
+        points, with about one vertex every `_SPLINE_STEP` pixels.
+        """
+        sx = coords[:, 0]
+        if len(coords) > 4 and (sx[1:] >= sx[:-1]).all():
+            coords = coords[_visibleSlice(sx, bounds, margin=2)]
+        decimated = _decimate(coords, max(self._decimation, 1))
+        if decimated is not coords or len(coords) < 3:
+            return decimated
+
+        p = coords.astype(np.float64)
+        # the ends are repeated as their own outer neighbours
+        p0 = np.concatenate((p[:1], p[:-2]))
+        p1, p2 = p[:-1], p[1:]
+        p3 = np.concatenate((p[2:], p[-1:]))
+        length = np.hypot(*(p2 - p1).T)
+        count = np.clip(np.ceil(length / self._SPLINE_STEP), 1,
+                        self._SPLINE_MAX).astype(np.intp)
+        seg = np.repeat(np.arange(len(p1)), count)
+        t = ((np.arange(len(seg)) - np.repeat(np.cumsum(count) - count, count))
+             / count[seg])[:, None]
+        p0, p1, p2, p3 = p0[seg], p1[seg], p2[seg], p3[seg]
+        curve = 0.5 * (2 * p1 + (p2 - p0) * t
+                       + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t**2
+                       + (3 * (p1 - p2) + p3 - p0) * t**3)
+        return _int32(np.concatenate((curve, p[-1:])))
+
     def _draw(self, dc, printerScale, coord):
-        """ Draw the spline """
+        """ Draw the spline with one ``DrawLines`` """
         colour = self.attributes['colour']
         width = self.attributes['width'] * printerScale * self._pointSize[0]
         style = self.attributes['style']
@@ -508,106 +1015,1234 @@ class PolySpline(PolyLine):
         pen.SetCap(wx.CAP_ROUND)
         dc.SetPen(pen)
         if coord is None:
-            if len(self.scaled) >= 3:
-                dc.DrawSpline(self.scaled.astype(np.int64))
+            if len(self.scaled) >= 2:
+                path = self._linePath(self._screenCoords(), _clipBox(dc))
+                if len(path) >= 2:
+                    dc.DrawLines(path)
         else:
             coord = [(int(c[0]), int(c[1])) for c in coord]
             dc.DrawLines(coord)  # draw legend line
 
 
-class PolyBarsBase(PolyPoints):
+class PolyMultiLine(PolyPoints):
     """
-    Base class for PolyBars and PolyHistogram.
+    Creates a PolyMultiLine object: several lines sharing one x vector.
 
-    Warning
-    -------
-       All methods are private.
+    Parameters
+    ----------
+    x : sequence of float, length ``n_points``
+        The x values shared by every line
+    y : 2D array of shape ``(n_series, n_points)``
+        The y values, one row per line
+    colour : `wx.Colour` | str | sequence of them
+        The colour of the lines. A sequence gives one colour per line
+    width : float | sequence of float
+        The width of the lines
+    style : {'-', '--', ':', '__', '-.'} | sequence of them
+        The line style
+            '-': Solid line
+            '--': Long dashed line
+            ':': Dotted line
+            '-.': Dot dash line
+            '__': Short dashed line
+    legend : str | sequence of str
+        The legend strings. A single non-empty str is suffixed with the
+        row index, e.g. ``'ch[0]'``, ``'ch[1]'``...
+
+    .. note::
+
+       Each row takes part in the legend and in closest-point lookup as a
+       separate curve.
+
+    .. warning::
+
+       All methods except ``__init__`` are private.
     """
-    _edgestyle = LINESTYLE
-    _fillstyle = BRUSHSTYLE
     _attributes = {
-        'edgecolour': 'black',
-        'edgewidth': 2.,
-        'edgestyle': '-',
+        'colour': 'black',
+        'width': 1.,
+        'style': '-',
         'legend': '',
-        'fillcolour': 'red',
-        'fillstyle': 'solid',
-        'barwidth': 1.
     }
 
-    def __init__(self, points, **attr):
+    def __init__(self,
+                 x,
+                 y,
+                 *,
+                 colour='black',
+                 width: Union[float, Sequence[float]] = 1.,
+                 style: Union[Literal['-', '--', ':', '__', '-.'],
+                              Sequence[str]] = '-',
+                 legend: Union[str, Sequence[str]] = ''):
+        self._x: NDArray[np.float64] = np.asarray(x, np.float64).ravel()
+        self._y: NDArray[np.float64] = np.atleast_2d(np.asarray(y, np.float64))
+        if self._y.ndim != 2 or self._y.shape[1] != self._x.size:
+            raise ValueError('y must have shape (n_series, {}), got {}'.format(
+                self._x.size, self._y.shape))
+        n = self._y.shape[0]
+
+        colours = self._perSeries(colour, n, 'colour')
+        widths = self._perSeries(width, n, 'width')
+        styles = self._perSeries(style, n, 'style')
+        if isinstance(legend, str):
+            legends = ['{}[{}]'.format(legend, i) if legend else ''
+                       for i in range(n)]
+        else:
+            legends = self._perSeries(legend, n, 'legend')
+        try:
+            styles = [LINESTYLE[s] for s in styles]
+        except KeyError:
+            err_txt = 'Style attribute incorrect. Should be one of {}'
+            raise KeyError(err_txt.format(LINESTYLE.keys()))
+        colours = [c if isinstance(c, wx.Colour) else wx.Colour(c)
+                   for c in colours]
+
+        PolyPoints.__init__(self,
+                            (),
+                            colour=colours,
+                            width=widths,
+                            style=styles,
+                            legend=legends)
+        self.scaled = self._stack(*self._xyData())
+
+    @staticmethod
+    def _perSeries(value, n: int, name: str) -> list:
+        """Broadcasts a style attribute to one value per series."""
+        if isinstance(value, (str, int, float, wx.Colour)):
+            return [value] * n
+        value = list(value)
+        if all(isinstance(v, (int, float)) for v in value) and name == 'colour':
+            return [tuple(value)] * n  # a single (r, g, b[, a]) colour
+        if len(value) != n:
+            err_txt = '{} has {} items but y has {} series'
+            raise ValueError(err_txt.format(name, len(value), n))
+        return value
+
+    @staticmethod
+    def _stack(x: NDArray, y: NDArray) -> NDArray[np.float64]:
+        """Builds the ``(n_series, n_points, 2)`` coordinate array."""
+        xy = np.empty(y.shape + (2,), np.float64)
+        xy[..., 0] = x
+        xy[..., 1] = y
+        return xy
+
+    def _xyData(self) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
         """
+        Returns x and y adjusted for the abs and log scales.
+
+        Invalid values for log scale become NaN instead of being dropped,
+        since x is shared by all series.
         """
-        PolyPoints.__init__(self, points, **attr)
+        x, y = self._x, self._y
+        if self.absScale[0]:
+            x = np.abs(x)
+        if self.logScale[0]:
+            x = np.log10(np.where(x > 0, x, np.nan))
+        if self.absScale[1]:
+            y = np.abs(y)
+        if self.logScale[1]:
+            y = np.log10(np.where(y > 0, y, np.nan))
+        return x, y
+
+    @property
+    def points(self) -> NDArray[np.float64]:
+        """All ``[x, y]`` values of all series, flattened to ``(n, 2)``."""
+        return self._stack(*self._xyData()).reshape(-1, 2)
+
+    @points.setter
+    def points(self, points):
+        raise AttributeError('PolyMultiLine points are set by x and y')
+
+    @property
+    def nSeries(self) -> int:
+        """The number of series (logical curves)."""
+        return self._y.shape[0]
+
+    def getLegend(self, index: int = 0) -> str:
+        return self.attributes['legend'][index]
+
+    def getLegends(self) -> List[str]:
+        """Returns the legend string of every series"""
+        return list(self.attributes['legend'])
 
-    def _scaleAndShift(self, data: NDArray, scale=(1, 1), shift=(0, 0)):
-        """same as override method, but returns a value."""
-        return np.asarray(data) * scale + shift
+    def boundingBox(self) -> Tuple[NDArray, NDArray]:
+        x, y = self._xyData()
+        if x.size == 0 or np.isnan(x).all() or np.isnan(y).all():
+            return np.array([-1.0, -1.0]), np.array([1.0, 1.0])
+        minXY = np.array([np.nanmin(x), np.nanmin(y)])
+        maxXY = np.array([np.nanmax(x), np.nanmax(y)])
+        return minXY, maxXY
 
-    def getSymExtent(self, printerScale: float) -> Tuple[float, float]:
-        """Width and Height of Marker"""
-        h = self.attributes['edgewidth'] * printerScale * self._pointSize[0]
+    def scaleAndShift(self, scale=(1, 1), shift=(0, 0)):
+        """
+        Scales x once and all y rows in one vectorized operation.
+        """
+        if self._x.size == 0:
+            return
+        mode = self._rescaleMode(scale, shift)
+        if mode == 'full':
+            x, y = self._xyData()
+            scaled = np.empty(y.shape + (2,), np.float64)
+            scaled[..., 0] = x * scale[0] + shift[0]
+            np.multiply(y, scale[1], out=scaled[..., 1])
+            scaled[..., 1] += shift[1]
+            self.scaled = scaled
+            self.currentScale = scale
+            self._scaledFor = (self._logscale, self._absScale)
+        elif mode == 'shift':
+            self.scaled += np.subtract(shift, self.currentShift)
+        else:
+            return
+        self.currentShift = shift
+        self._screenValid = False
+
+    def getClosestPoints(self, pntXY, pointScaled=True) -> list:
+        """
+        Returns, for every series, the index of closest point, pointXY,
+        scaledXY and distance, as in ``getClosestPoint``.
+
+        if pointScaled == True, then based on screen coords
+        if pointScaled == False, then based on user coords
+        """
+        if pointScaled:
+            p = self.scaled
+            pxy = self.currentScale * np.asarray(pntXY) + self.currentShift
+        else:
+            p = self._stack(*self._xyData())
+            pxy = np.asarray(pntXY)
+        d = np.sqrt(np.add.reduce((p - pxy)**2, -1))
+        d[np.isnan(d)] = np.inf
+        idx = np.argmin(d, 1)
+        x, y = self._xyData()
+        lst = []
+        for n, i in enumerate(idx):
+            lst.append([i, np.array([x[i], y[n, i]]),
+                        self.scaled[n, i] / self._pointSize, d[n, i]])
+        return lst
+
+    def getClosestPoint(self, pntXY, pointScaled=True):
+        """Closest point over all series. Override method."""
+        lst = self.getClosestPoints(pntXY, pointScaled)
+        return min(lst, key=lambda c: c[-1])
+
+    def getSymExtent(self, printerScale) -> Tuple[float, float]:
+        """Width and Height of the legend symbol"""
+        h = max(self.attributes['width']) * printerScale * self._pointSize[0]
         w = 5 * h
         return w, h
 
-    def set_pen_and_brush(self, dc, printerScale):
-        pencolour = self.attributes['edgecolour']
-        penwidth = (self.attributes['edgewidth'] * printerScale *
-                    self._pointSize[0])
-        penstyle = self.attributes['edgestyle']
-        fillcolour = self.attributes['fillcolour']
-        fillstyle = self.attributes['fillstyle']
-
-        if not isinstance(pencolour, wx.Colour):
-            pencolour = wx.Colour(pencolour)
-        pen = wx.Pen(pencolour, int(penwidth), penstyle)
+    def _setPen(self, dc, printerScale, index):
+        width = (self.attributes['width'][index] * printerScale *
+                 self._pointSize[0])
+        pen = wx.Pen(self.attributes['colour'][index], int(width),
+                     self.attributes['style'][index])
         pen.SetCap(wx.CAP_BUTT)
+        dc.SetPen(pen)
 
-        if not isinstance(fillcolour, wx.Colour):
-            fillcolour = wx.Colour(fillcolour)
-        brush = wx.Brush(fillcolour, fillstyle)
+    def draw(self, dc, printerScale: float, coord: Optional[NDArray[np.float64]] = None):
+        """Draw every series with its own pen."""
+        if coord is not None:
+            self.drawlegend(dc, printerScale, coord)
+            return
+        screen = self._screenCoords()
+        finite = np.isfinite(self.scaled).all(-1)
+        for i, line in enumerate(screen):
+            if not finite[i].all():
+                line = line[finite[i]]
+            if len(line) < 2:
+                continue
+            if self._decimation:
+                line = _decimate(line, self._decimation)
+            self._setPen(dc, printerScale, i)
+            dc.DrawLines(line)
+
+    def _rasterJob(self, dc, printerScale) -> Optional[RasterJob]:
+        """Draws every series into the buffer"""
+        colours = [_rgba(c) for c in self.attributes['colour']]
+        widths = [int(w * printerScale * self._pointSize[0])
+                  for w in self.attributes['width']]
+        styles = self.attributes['style']
+
+        def job(buf, origin):
+            screen = self._screenCoords()
+            finite = np.isfinite(self.scaled).all(-1)
+            for i, line in enumerate(screen):
+                if not finite[i].all():
+                    line = line[finite[i]]
+                if len(line) < 2:
+                    continue
+                raster.draw_lines(buf, _decimate(line, max(self._decimation, 1)),
+                                  colours[i], widths[i], styles[i], origin)
+        return job
+
+    def drawlegend(self, dc: wx.DC, printerScale: float,
+                   coord: NDArray[np.float64], index: int = 0) -> None:
+        self._setPen(dc, printerScale, index)
+        coord = [(int(c[0]), int(c[1])) for c in coord]
+        dc.DrawLines(coord)  # draw legend line
+
+
+class PolyScatter(PolyMarker):
+    """
+    Creates a PolyScatter object: markers coloured by a value.
 
-        dc.SetPen(pen)
-        dc.SetBrush(brush)
+    The values are quantized into `ncolours` colour bins and each bin is
+    drawn with one list call and one shared pen and brush, so the number of
+    draw calls follows the number of colours, not of points.
 
-    def scale_rect(self, rect):
-        # Scale the points to the plot area
-        scaled_rect = self._scaleAndShift(rect, self.currentScale,
-                                          self.currentShift)
+    Parameters
+    ----------
+    x : sequence of float
+        The x coordinates
+    y : sequence of float
+        The y coordinates
+    values : sequence of float
+        The value of each point, mapped to its colour. Points with a
+        non-finite value are not drawn.
+    cmap : str | sequence of colours
+        A name in `colourmaps.COLOURMAPS` or a list of colours
+    ncolours : int
+        The number of colour bins
+    vmin : float, optional
+        The value of the first colour. Default is the lowest value.
+    vmax : float, optional
+        The value of the last colour. Default is the highest value.
+    edgecolour : `wx.Colour` | str | None
+        The marker outline colour. If None, the fill colour is used.
+    width : float
+        The marker outline width.
+    size : float
+        The marker size.
+    marker : {'circle', 'dot', 'square', 'triangle', 'triangle_down', 'cross', 'plus'}
+        The marker type, see `PolyMarker`.
+    legend : str
+        The legend string, drawn with the middle colour.
 
-        # Convert to (left, top, width, height) for drawing
-        wx_rect = [
-            scaled_rect[0][0],  # X (left)
-            scaled_rect[0][1],  # Y (top)
-            scaled_rect[1][0] - scaled_rect[0][0],  # Width
-            scaled_rect[1][1] - scaled_rect[0][1]   # Height
-        ]
+    Warning
+    -------
+       All methods except ``__init__`` are private.
+    """
 
-        return wx_rect
+    def __init__(self,
+                 x,
+                 y,
+                 values,
+                 *,
+                 cmap='viridis',
+                 ncolours: int = 64,
+                 vmin: Optional[float] = None,
+                 vmax: Optional[float] = None,
+                 edgecolour=None,
+                 width: float = 1.,
+                 size: float = 2.,
+                 marker: Literal['circle', 'dot', 'square', 'triangle',
+                                 'triangle_down', 'cross', 'plus'] = 'circle',
+                 legend: str = ''):
+        x = np.asarray(x, np.float64).ravel()
+        y = np.asarray(y, np.float64).ravel()
+        self.values = np.asarray(values, np.float64).ravel()
+        if not len(x) == len(y) == len(self.values):
+            raise ValueError('`x`, `y` and `values` must have the same length')
+        if not isinstance(ncolours, int) or ncolours < 1:
+            raise ValueError('`ncolours` must be a positive int')
+
+        self.lut = colour_lut(cmap, ncolours)
+        index = quantize(self.values, ncolours, vmin, vmax)
+        # the points of each colour bin are drawn together
+        self._order, self._starts, self._colours = group_by_index(index)
+        if edgecolour is not None and not isinstance(edgecolour, wx.Colour):
+            edgecolour = wx.Colour(edgecolour)
+        self._edgecolour = edgecolour
+
+        middle = wx.Colour(*self.lut[ncolours // 2])
+        PolyMarker.__init__(self,
+                            np.column_stack((x, y)),
+                            colour=edgecolour or middle,
+                            width=width,
+                            size=size,
+                            fillcolour=middle,
+                            marker=marker,
+                            legend=legend)
 
-    def draw(self, dc: wx.DC, printerScale: float, coord: Optional[NDArray[np.float64]]=None):
-        raise NotImplementedError
+    def draw(self, dc: wx.DC, printerScale: float, coord: Optional[NDArray[np.float64]] = None):
+        """ Draw the points, one list call per colour bin """
+        if coord is not None:
+            PolyMarker.draw(self, dc, printerScale, coord)  # legend marker
+            return
+        if not len(self.scaled) or not len(self._order):
+            return
+        size = self.attributes['size'] * printerScale * self._pointSize[0]
+        marker = 'dot' if self._hideMarkers else self.attributes['marker']
+        sprites = self._useSprites and marker != 'dot'
+        coords, bounds = self._screenOrder()
+        for start, end, (pen, brush) in zip(bounds[:-1], bounds[1:],
+                                            self._bins(printerScale)):
+            if start == end:
+                continue
+            dc.SetPen(pen)
+            dc.SetBrush(brush)
+            if sprites:
+                self._drawsprites(dc, coords[start:end], marker, size, pen,
+                                  brush)
+            else:
+                self._drawmarkers(dc, coords[start:end], marker, size)
 
-    def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
-        self.draw(dc, printerScale, coord)
+    def _screenOrder(self) -> Tuple[NDArray[np.int32], NDArray[np.intp]]:
+        """
+        The screen coordinates of the points in `_order`, and the start of
+        every colour bin in them followed by the end of the last.
+
+        A log scale drops rows from ``self.scaled``, which then no longer
+        match `_order`, so the points are transformed from `_points` and
+        those the scale cannot place are left out of their bins.
+        """
+        bounds = np.r_[self._starts, len(self._order)]
+        if not any(self._logscale):
+            return self._screenCoords()[self._order], bounds
+        x, y = self._points[self._order].T
+        coords = np.column_stack((_toScreen(x, self, 0), _toScreen(y, self, 1)))
+        finite = np.isfinite(coords).all(axis=1)
+        bounds = np.r_[0, np.cumsum(finite)][bounds]
+        return _int32(coords[finite]), bounds
+
+    def _bins(self, printerScale):
+        """Yields the pen and brush of every colour bin"""
+        width = int(self.attributes['width'] * printerScale * self._pointSize[0])
+        if self._edgecolour is not None:
+            pen = wx.Pen(self._edgecolour, width)
+        for k in self._colours:
+            colour = wx.Colour(*self.lut[k])
+            if self._edgecolour is None:
+                pen = wx.Pen(colour, width)
+            yield pen, wx.Brush(colour, wx.BRUSHSTYLE_SOLID)
+
+    def _rasterJob(self, dc, printerScale) -> Optional[RasterJob]:
+        """Stamps one sprite per colour bin"""
+        size = self.attributes['size'] * printerScale * self._pointSize[0]
+        marker = 'dot' if self._hideMarkers else self.attributes['marker']
+        sprites = [self._sprite(dc, marker, size, pen, brush)
+                   for pen, brush in self._bins(printerScale)]
 
+        def job(buf, origin):
+            if not len(self.scaled) or not len(self._order):
+                return
+            coords, bounds = self._screenOrder()
+            for start, end, sprite in zip(bounds[:-1], bounds[1:], sprites):
+                raster.stamp_sprite(buf, sprite, coords[start:end], origin)
+        return job
 
-class PolyBars(PolyBarsBase):
+
+class PolyFill(PolyPoints):
     """
-    Creates a PolyBars object.
+    Creates a PolyFill object: the band between two curves sharing x, e.g. a
+    min/max envelope or a confidence band.
+
+    Only the visible part of the band is drawn, as one polygon. When there
+    are more points than pixel columns, each column is reduced to the
+    lowest and highest edge of the band in it.
 
     Parameters
     ----------
-    points : list of `(center, height)` values
-        The points that make up the line
-    barwidth : float | list[float]
-        The width of the bars
-    edgecolour : `wx.Colour` | str
-        The colour of the line
-    edgewidth : float
-        The width of the edges
-    edgestyle : {'-', '--', ':', '__', '-.'}
-        The line style
+    x : sequence of float
+        The x coordinates, ascending
+    y_low : sequence of float
+        The lower edge of the band
+    y_high : sequence of float
+        The upper edge of the band
+    colour : `wx.Colour` | str
+        The colour of the outline
+    width : float
+        The width of the outline, 0 for no outline
+    fillcolour : `wx.Colour` | str
+        The fill colour of the band
+    fillstyle : {'solid', 'transparent'}
+        The fill style of the band
+    legend : str
+        The legend string
+
+    .. note::
+
+       Points with a non-finite edge are dropped.
+
+    Warning
+    -------
+       All methods except ``__init__`` are private.
+    """
+    _fillstyle = BRUSHSTYLE
+    _attributes = {
+        'colour': 'black',
+        'width': 0.,
+        'fillcolour': 'LIGHT GREY',
+        'fillstyle': 'solid',
+        'legend': ''
+    }
+
+    def __init__(self,
+                 x,
+                 y_low,
+                 y_high,
+                 *,
+                 colour='black',
+                 width: float = 0.,
+                 fillcolour='LIGHT GREY',
+                 fillstyle: Literal['solid', 'transparent'] = 'solid',
+                 legend: str = ''):
+        x = np.asarray(x, np.float64).ravel()
+        y_low = np.asarray(y_low, np.float64).ravel()
+        y_high = np.asarray(y_high, np.float64).ravel()
+        if not len(x) == len(y_low) == len(y_high):
+            raise ValueError('`x`, `y_low` and `y_high` must have the same length')
+        if (np.diff(x) < 0).any():
+            raise ValueError('`x` must be ascending')
+        keep = np.isfinite(x) & np.isfinite(y_low) & np.isfinite(y_high)
+        x, y_low, y_high = x[keep], y_low[keep], y_high[keep]
+        self._n = len(x)
+        # the lower edge followed by the upper edge
+        points = np.column_stack((np.r_[x, x], np.r_[y_low, y_high]))
+        PolyPoints.__init__(self,
+                            points,
+                            colour=colour,
+                            width=width,
+                            fillcolour=fillcolour,
+                            fillstyle=fillstyle,
+                            legend=legend)
+
+    def getSymExtent(self, printerScale) -> Tuple[float, float]:
+        """Width and Height of Marker"""
+        h = 8 * printerScale * self._pointSize[0]
+        return 2 * h, h
+
+    def _setPenAndBrush(self, dc, printerScale):
+        colour = self.attributes['colour']
+        width = int(self.attributes['width'] * printerScale * self._pointSize[0])
+        fillcolour = self.attributes['fillcolour']
+        if not isinstance(fillcolour, wx.Colour):
+            fillcolour = wx.Colour(fillcolour)
+        if width > 0:
+            if not isinstance(colour, wx.Colour):
+                colour = wx.Colour(colour)
+            dc.SetPen(wx.Pen(colour, width))
+        else:
+            dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.SetBrush(wx.Brush(fillcolour, self.attributes['fillstyle']))
+
+    def _polygon(self, dc) -> NDArray[np.int32]:
+        """The visible, decimated band polygon in screen coordinates"""
+        n = self._n
+        x = _toScreen(self._points[:n, 0], self, 0)
+        low = _toScreen(self._points[:n, 1], self, 1)
+        high = _toScreen(self._points[n:, 1], self, 1)
+        # one mask for both edges keeps them paired under a log scale
+        keep = np.isfinite(x) & np.isfinite(low) & np.isfinite(high)
+        x, low, high = _int32(x[keep]), _int32(low[keep]), _int32(high[keep])
+        visible = _visibleSlice(x, dc)
+        x, low, high = x[visible], low[visible], high[visible]
+        top = np.minimum(low, high)
+        bottom = np.maximum(low, high)
+
+        starts = np.flatnonzero(np.r_[True, x[1:] != x[:-1]])
+        if 2 * len(starts) < len(x):
+            # envelope of each pixel column
+            x = x[starts]
+            top = np.minimum.reduceat(top, starts)
+            bottom = np.maximum.reduceat(bottom, starts)
+        polygon = np.empty((2 * len(x), 2), np.int32)
+        polygon[:len(x), 0] = x
+        polygon[:len(x), 1] = top
+        polygon[len(x):, 0] = x[::-1]
+        polygon[len(x):, 1] = bottom[::-1]
+        return polygon
+
+    @TempStyle('pen')
+    def draw(self, dc, printerScale, coord=None):
+        """ Draw the band with one polygon """
+        self._setPenAndBrush(dc, printerScale)
+        if coord is None:
+            if self._n >= 2:
+                polygon = self._polygon(dc)
+                if len(polygon) >= 4:
+                    dc.DrawPolygon(polygon)
+        else:
+            (x1, y1), (x2, _) = coord  # draw legend box
+            h = self.getSymExtent(printerScale)[1]
+            dc.DrawRectangle(int(x1), int(y1 - h / 2), int(x2 - x1), int(h))
+
+    def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
+        self.draw(dc, printerScale, coord)
+
+
+class PolyErrorBars(PolyPoints):
+    """
+    Creates a PolyErrorBars object: x and/or y error bars with caps.
+
+    All bars and caps are drawn as one segment array with a single
+    ``DrawLineList``. Bars shorter than a pixel and bars outside the drawn
+    area are culled.
+
+    Parameters
+    ----------
+    x : sequence of float
+        The x coordinates of the points
+    y : sequence of float
+        The y coordinates of the points
+    xerr : float | sequence of float | None
+        The x errors: one value for all points, one per point, or a
+        ``(2, n)`` array of lower and upper errors. None for no x bars.
+    yerr : float | sequence of float | None
+        The y errors, as `xerr`
+    capsize : float
+        The half length of the caps in points, 0 for no caps
+    colour : `wx.Colour` | str
+        The colour of the bars
+    width : float
+        The width of the bars
+    style : {'-', '--', ':', '__', '-.'}
+        The line style
+    legend : str
+        The legend string
+
+    Warning
+    -------
+       All methods except ``__init__`` are private.
+    """
+    _style = LINESTYLE
+    _attributes = {
+        'colour': 'black',
+        'width': 1.,
+        'style': '-',
+        'capsize': 3.,
+        'legend': ''
+    }
+
+    def __init__(self,
+                 x,
+                 y,
+                 *,
+                 xerr=None,
+                 yerr=None,
+                 capsize: float = 3.,
+                 colour='black',
+                 width: float = 1.,
+                 style: Literal['-', '--', ':', '__', '-.'] = '-',
+                 legend: str = ''):
+        x = np.asarray(x, np.float64).ravel()
+        y = np.asarray(y, np.float64).ravel()
+        if len(x) != len(y):
+            raise ValueError('`x` and `y` must have the same length')
+        self._xerr = self._errors(xerr, len(x), 'xerr')
+        self._yerr = self._errors(yerr, len(x), 'yerr')
+        PolyPoints.__init__(self,
+                            np.column_stack((x, y)),
+                            colour=colour,
+                            width=width,
+                            style=style,
+                            capsize=capsize,
+                            legend=legend)
+
+    @staticmethod
+    def _errors(err, n: int, name: str) -> Optional[NDArray[np.float64]]:
+        """The errors as a ``(2, n)`` array of lower and upper errors"""
+        if err is None:
+            return None
+        err = np.asarray(err, np.float64)
+        if err.ndim == 0 or err.shape == (n,):
+            return np.broadcast_to(err, (2, n)).copy()
+        if err.shape == (2, n):
+            return err.copy()
+        raise ValueError('`{}` must be a float, or have shape ({n},) or '
+                         '(2, {n})'.format(name, n=n))
+
+    def _ends(self, axis: int) -> Tuple[NDArray, NDArray]:
+        """The lower and upper bar ends along `axis` in plot coordinates"""
+        centre = self._points[:, axis]
+        err = self._xerr if axis == 0 else self._yerr
+        return (_axisScale(centre - err[0], self, axis),
+                _axisScale(centre + err[1], self, axis))
+
+    def boundingBox(self) -> Tuple[NDArray, NDArray]:
+        """
+        Returns bounding box for the plot, including the error bars.
+
+        Override method.
+        """
+        minXY, maxXY = PolyPoints.boundingBox(self)
+        for axis, err in enumerate((self._xerr, self._yerr)):
+            if err is not None:
+                low, high = self._ends(axis)
+                minXY[axis] = np.nanmin(np.r_[minXY[axis], low[np.isfinite(low)]])
+                maxXY[axis] = np.nanmax(np.r_[maxXY[axis], high[np.isfinite(high)]])
+        return minXY, maxXY
+
+    def getSymExtent(self, printerScale) -> Tuple[float, float]:
+        """Width and Height of Marker"""
+        h = self.attributes['width'] * printerScale * self._pointSize[0]
+        w = 5 * h
+        return w, h
+
+    def _segments(self, dc, printerScale) -> NDArray[np.int32]:
+        """All visible bars and caps as one ``(n, 4)`` segment array"""
+        scale, shift = self.currentScale, self.currentShift
+        cap = self.attributes['capsize'] * printerScale * self._pointSize[0]
+        bx, by, bw, bh = _clipBox(dc)
+        lines = []
+        for axis, err in enumerate((self._xerr, self._yerr)):
+            if err is None:
+                continue
+            low, high = self._ends(axis)
+            low = low * scale[axis] + shift[axis]
+            high = high * scale[axis] + shift[axis]
+            # not self.scaled, which lacks the rows dropped by a log scale
+            centre = _toScreen(self._points[:, 1 - axis], self, 1 - axis)
+            if axis == 0:
+                lo_view, hi_view, c_lo, c_hi = bx, bx + bw, by, by + bh
+            else:
+                lo_view, hi_view, c_lo, c_hi = by, by + bh, bx, bx + bw
+            # cull bars shorter than a pixel or outside the drawn area
+            with np.errstate(invalid='ignore'):
+                keep = (np.isfinite(low) & np.isfinite(high)
+                        & np.isfinite(centre)
+                        & (np.abs(high - low) >= 1)
+                        & (np.maximum(low, high) >= lo_view)
+                        & (np.minimum(low, high) <= hi_view)
+                        & (centre >= c_lo - cap) & (centre <= c_hi + cap))
+            low, high, centre = low[keep], high[keep], centre[keep]
+            if cap > 0:
+                parts = [(low, centre, high, centre),
+                         (low, centre - cap, low, centre + cap),
+                         (high, centre - cap, high, centre + cap)]
+            else:
+                parts = [(low, centre, high, centre)]
+            for a1, b1, a2, b2 in parts:
+                # (a, b) are the coordinates along and across `axis`
+                seg = (a1, b1, a2, b2) if axis == 0 else (b1, a1, b2, a2)
+                lines.append(np.column_stack(seg))
+        if not lines:
+            return np.empty((0, 4), np.int32)
+        return _int32(np.concatenate(lines))
+
+    @TempStyle('pen')
+    def draw(self, dc, printerScale, coord=None):
+        """ Draw all error bars with one line list """
+        colour = self.attributes['colour']
+        width = self.attributes['width'] * printerScale * self._pointSize[0]
+        if not isinstance(colour, wx.Colour):
+            colour = wx.Colour(colour)
+        pen = wx.Pen(colour, int(width), self.attributes['style'])
+        pen.SetCap(wx.CAP_BUTT)
+        dc.SetPen(pen)
+        if coord is None:
+            if len(self.scaled):
+                lines = self._segments(dc, printerScale)
+                if len(lines):
+                    dc.DrawLineList(lines)
+        else:
+            dc.DrawLines(_int32(coord))  # draw legend line
+
+    def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
+        self.draw(dc, printerScale, coord)
+
+
+class PolyCandlestick(PolyPoints):
+    """
+    Creates a PolyCandlestick object: open/high/low/close candles.
+
+    Wicks are drawn with one ``DrawLineList`` and the rising and falling
+    bodies with one ``DrawRectangleList`` each. When zooming out makes the
+    candles narrower than `minwidth` pixels, consecutive candles are merged
+    into coarser buckets (first open, highest high, lowest low, last close),
+    so the draw cost is bounded by the pixel width of the plot.
+
+    Parameters
+    ----------
+    t : sequence of float
+        The time of each candle, ascending
+    open : sequence of float
+        The opening values
+    high : sequence of float
+        The highest values
+    low : sequence of float
+        The lowest values
+    close : sequence of float
+        The closing values
+    width : float
+        The body width as a fraction of the candle spacing
+    minwidth : int
+        The smallest candle spacing in pixels before candles are merged
+    colour : `wx.Colour` | str
+        The colour of the wicks and body outlines
+    upcolour : `wx.Colour` | str
+        The fill colour of candles closing at or above their open
+    downcolour : `wx.Colour` | str
+        The fill colour of candles closing below their open
+    legend : str
+        The legend string
+
+    Warning
+    -------
+       All methods except ``__init__`` are private.
+    """
+    _attributes = {
+        'colour': 'black',
+        'width': 0.8,
+        'minwidth': 3,
+        'upcolour': 'FOREST GREEN',
+        'downcolour': 'RED',
+        'legend': ''
+    }
+
+    def __init__(self,
+                 t,
+                 open,
+                 high,
+                 low,
+                 close,
+                 *,
+                 width: float = 0.8,
+                 minwidth: int = 3,
+                 colour='black',
+                 upcolour='FOREST GREEN',
+                 downcolour='RED',
+                 legend: str = ''):
+        t = np.asarray(t, np.float64).ravel()
+        ohlc = np.asarray([np.ravel(a) for a in (open, high, low, close)],
+                          np.float64)
+        if ohlc.shape[1] != len(t):
+            raise ValueError('`t`, `open`, `high`, `low` and `close` must '
+                             'have the same length')
+        if (np.diff(t) <= 0).any():
+            raise ValueError('`t` must be strictly ascending')
+        self._t = t
+        self._ohlc = ohlc
+        # typical candle spacing in x units
+        self._dt = float(np.median(np.diff(t))) if len(t) > 1 else 1.
+        # the lows followed by the highs, for the bounding box and hits
+        points = np.column_stack((np.r_[t, t], np.r_[ohlc[2], ohlc[1]]))
+        PolyPoints.__init__(self,
+                            points,
+                            colour=colour,
+                            width=width,
+                            minwidth=minwidth,
+                            upcolour=upcolour,
+                            downcolour=downcolour,
+                            legend=legend)
+
+    def getSymExtent(self, printerScale) -> Tuple[float, float]:
+        """Width and Height of Marker"""
+        h = 8 * printerScale * self._pointSize[0]
+        return 2 * h, h
+
+    def _candles(self, dc) -> Tuple[NDArray[np.float64], NDArray[np.float64], float]:
+        """
+        The visible candles, merged into buckets if they are too narrow.
+
+        Returns
+        -------
+        tuple
+            ``(x, ohlc, spacing)``: the screen x of the candles, their
+            ``(4, n)`` open/high/low/close in screen coordinates and the
+            candle spacing in pixels.
+        """
+        n = len(self._t)
+        x = _toScreen(self._t, self, 0)
+        # a log scale maps t <= 0 to NaN or -inf, left of every other candle
+        visible = _visibleSlice(np.where(np.isfinite(x), x, -np.inf), dc)
+        start, stop = visible.indices(n)[:2]
+        if self._logscale[0]:
+            # the spacing varies along a log axis, take the visible one
+            steps = np.diff(x[start:stop])
+            steps = steps[np.isfinite(steps)]
+            spacing = float(np.median(steps)) if len(steps) \
+                else self.attributes['minwidth']
+        else:
+            spacing = abs(self._dt * self.currentScale[0])
+        k = max(int(np.ceil(self.attributes['minwidth'] / spacing)), 1) \
+            if spacing > 0 else n
+        if k > 1:
+            # buckets aligned to multiples of k keep still while panning
+            start -= start % k
+        x = x[start:stop]
+        ohlc = self._ohlc[:, start:stop]
+        if k > 1 and len(x):
+            starts = np.arange(0, len(x), k)
+            ends = np.r_[starts[1:], len(x)] - 1
+            x = (x[starts] + x[ends]) / 2
+            ohlc = np.asarray([ohlc[0, starts],
+                               np.maximum.reduceat(ohlc[1], starts),
+                               np.minimum.reduceat(ohlc[2], starts),
+                               ohlc[3, ends]])
+        ohlc = _toScreen(ohlc, self, 1)
+        # drop the candles a log scale cannot place
+        keep = np.isfinite(x) & np.isfinite(ohlc).all(axis=0)
+        return x[keep], ohlc[:, keep], spacing * k
+
+    @TempStyle('pen')
+    def draw(self, dc, printerScale, coord=None):
+        """ Draw the wicks and the rising and falling bodies """
+        colour = self.attributes['colour']
+        if not isinstance(colour, wx.Colour):
+            colour = wx.Colour(colour)
+        penwidth = max(int(printerScale * self._pointSize[0]), 1)
+        dc.SetPen(wx.Pen(colour, penwidth))
+        brushes = [wx.Brush(self.attributes[c], wx.BRUSHSTYLE_SOLID)
+                   for c in ('upcolour', 'downcolour')]
+        if coord is not None:
+            (x1, y1), (x2, _) = coord  # draw legend box
+            h = self.getSymExtent(printerScale)[1]
+            dc.SetBrush(brushes[0])
+            dc.DrawRectangle(int(x1), int(y1 - h / 2), int(x2 - x1), int(h))
+            return
+        if not len(self._t):
+            return
+
+        x, (o, h, l, c), spacing = self._candles(dc)
+        if not len(x):
+            return
+        dc.DrawLineList(_int32(np.column_stack((x, h, x, l))))
+
+        w = max(self.attributes['width'] * spacing, 1.)
+        top = np.minimum(o, c)  # screen y grows downwards
+        bodies = np.column_stack((x - w / 2, top, np.full(len(x), w),
+                                  np.maximum(np.abs(o - c), 1.)))
+        rising = c <= o  # a higher close is a smaller screen y
+        for brush, mask in zip(brushes, (rising, ~rising)):
+            if mask.any():
+                dc.SetBrush(brush)
+                dc.DrawRectangleList(_int32(bodies[mask]))
+
+    def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
+        self.draw(dc, printerScale, coord)
+
+
+def _blockReduce(a: NDArray, f: int, axis: int, how: str) -> NDArray:
+    """
+    Reduces blocks of `f` items along `axis` to their mean or maximum.
+
+    The last block may be shorter. NaN is ignored by the maximum and
+    propagated by the mean.
+    """
+    starts = np.arange(0, a.shape[axis], f)
+    if how == 'max':
+        return np.fmax.reduceat(a, starts, axis=axis)
+    sums = np.add.reduceat(a, starts, axis=axis, dtype=np.float64)
+    counts = np.diff(np.r_[starts, a.shape[axis]])
+    shape = [1] * a.ndim
+    shape[axis] = -1
+    return sums / counts.reshape(shape)
+
+
+class PolyImage(PolyPoints):
+    """
+    Creates a PolyImage object: a 2D array drawn as an image inside the
+    axes, e.g. a spectrogram or a camera frame.
+
+    Only the part of the array inside the plot area is used. It is sampled
+    at the centre of each screen pixel (optionally after reducing blocks of
+    array cells that share a pixel) and put on the DC as one bitmap, so the
+    draw cost depends on the plot size and not on the array size. The array
+    is not copied.
+
+    Parameters
+    ----------
+    data : NDArray
+        ``(rows, cols)`` scalars, mapped through `cmap`, or ``(rows, cols,
+        3)`` RGB / ``(rows, cols, 4)`` RGBA values between 0 and 255
+    extent : tuple of float, optional
+        ``(xmin, xmax, ymin, ymax)`` the edges of the image in data
+        coordinates, defaults to ``(0, cols, 0, rows)``
+    cmap : str | sequence of colours
+        The colour map of scalar data, see `colourmaps.COLOURMAPS`
+    vmin : float, optional
+        The value mapped to the first colour, defaults to the data minimum
+    vmax : float, optional
+        The value mapped to the last colour, defaults to the data maximum
+    origin : {'upper', 'lower'}
+        Whether the first row is drawn at `ymax` or at `ymin`
+    reduce : {'subsample', 'mean', 'max'}
+        How array cells sharing a screen pixel are combined: pick one, or
+        their mean or maximum (``'max'`` keeps narrow peaks visible)
+    legend : str
+        The legend string
+
+    .. note::
+
+       Non-finite scalars are transparent. The cells are evenly spaced on
+       the drawn axes, also on log scaled axes.
+
+    Warning
+    -------
+       All methods except ``__init__`` are private.
+    """
+    _attributes = {
+        'cmap': 'viridis',
+        'vmin': None,
+        'vmax': None,
+        'origin': 'upper',
+        'reduce': 'subsample',
+        'legend': ''
+    }
+
+    def __init__(self,
+                 data,
+                 extent: Optional[Tuple[float, float, float, float]] = None,
+                 *,
+                 cmap='viridis',
+                 vmin: Optional[float] = None,
+                 vmax: Optional[float] = None,
+                 origin: Literal['upper', 'lower'] = 'upper',
+                 reduce: Literal['subsample', 'mean', 'max'] = 'subsample',
+                 legend: str = ''):
+        data = np.asarray(data)
+        self._rgb = data.ndim == 3 and data.shape[2] in (3, 4)
+        if data.ndim != 2 and not self._rgb:
+            raise ValueError('`data` must be a (rows, cols) array of scalars '
+                             'or a (rows, cols, 3 | 4) RGB(A) array')
+        if data.shape[0] == 0 or data.shape[1] == 0:
+            raise ValueError('`data` must not be empty')
+        if origin not in ('upper', 'lower'):
+            raise ValueError("`origin` must be 'upper' or 'lower'")
+        if reduce not in ('subsample', 'mean', 'max'):
+            raise ValueError("`reduce` must be 'subsample', 'mean' or 'max'")
+        rows, cols = data.shape[:2]
+        if extent is None:
+            extent = (0., cols, 0., rows)
+        xmin, xmax, ymin, ymax = map(float, extent)
+        if xmin == xmax or ymin == ymax:
+            raise ValueError('`extent` must have a non-zero width and height')
+        self._data = data
+
+        # the lookup table has a transparent last row for index -1
+        self._lut = np.zeros((257, 4), np.uint8)
+        if not self._rgb:
+            if vmin is None or vmax is None:
+                finite = data[np.isfinite(data)]
+                if vmin is None:
+                    vmin = float(finite.min()) if len(finite) else 0.
+                if vmax is None:
+                    vmax = float(finite.max()) if len(finite) else 1.
+            self._lut[:256, :3] = colour_lut(cmap, 256)
+            self._lut[:256, 3] = 255
+        PolyPoints.__init__(self, [[xmin, ymin], [xmax, ymax]],
+                            cmap=cmap,
+                            vmin=vmin,
+                            vmax=vmax,
+                            origin=origin,
+                            reduce=reduce,
+                            legend=legend)
+
+    def getSymExtent(self, printerScale) -> Tuple[float, float]:
+        """Width and Height of Marker"""
+        h = 8 * printerScale * self._pointSize[0]
+        return 2 * h, h
+
+    def _sample(self, dc) -> Optional[Tuple[NDArray, int, int]]:
+        """
+        Samples the array at the visible screen pixels.
+
+        Returns
+        -------
+        tuple | None
+            ``(pixels, x, y)``: the ``(height, width)`` or ``(height,
+            width, channels)`` samples and the screen position of their top
+            left corner, or None if the image is not visible.
+        """
+        if len(self.scaled) < 2:  # a corner was dropped by the log scale
+            return None
+        data = self._data
+        rows, cols = data.shape[:2]
+        (x0, y0), (x1, y1) = self.scaled
+        if x1 < x0:
+            data = data[:, ::-1]
+            x0, x1 = x1, x0
+        first, last = (y1, y0) if self.attributes['origin'] == 'upper' else (y0, y1)
+        if last < first:
+            data = data[::-1]
+            first, last = last, first
+
+        bx, by, bw, bh = _clipBox(dc)
+        left = max(int(np.floor(x0)), bx)
+        right = min(int(np.ceil(x1)), bx + bw)
+        top = max(int(np.floor(first)), by)
+        bottom = min(int(np.ceil(last)), by + bh)
+        if right <= left or bottom <= top:
+            return None
+
+        # the array cell at the centre of each screen pixel
+        cw = (x1 - x0) / cols
+        rh = (last - first) / rows
+        ix = ((np.arange(left, right) + .5 - x0) / cw).astype(np.intp)
+        iy = ((np.arange(top, bottom) + .5 - first) / rh).astype(np.intp)
+        np.clip(ix, 0, cols - 1, out=ix)
+        np.clip(iy, 0, rows - 1, out=iy)
+
+        how = self.attributes['reduce']
+        fx, fy = max(int(1 / cw), 1), max(int(1 / rh), 1)
+        if how != 'subsample' and (fx > 1 or fy > 1):
+            # blocks aligned to multiples of the factor keep still while
+            # panning
+            c0, r0 = ix[0] - ix[0] % fx, iy[0] - iy[0] % fy
+            data = data[r0:iy[-1] + 1, c0:ix[-1] + 1]
+            if fx > 1:
+                data = _blockReduce(data, fx, 1, how)
+            if fy > 1:
+                data = _blockReduce(data, fy, 0, how)
+            ix = (ix - c0) // fx
+            iy = (iy - r0) // fy
+        return data[iy[:, None], ix], left, top
+
+    def _colours(self, pixels: NDArray) -> NDArray[np.uint8]:
+        """The samples as an RGB or RGBA uint8 array"""
+        if self._rgb:
+            if pixels.dtype != np.uint8:
+                pixels = np.clip(pixels, 0, 255).astype(np.uint8)
+            return pixels
+        index = quantize(pixels, 256, self.attributes['vmin'],
+                         self.attributes['vmax'])
+        if (index < 0).any():
+            return self._lut[index]
+        return self._lut[index, :3]
+
+    def draw(self, dc, printerScale, coord=None):
+        """ Draw the visible part of the image as one bitmap """
+        if coord is not None:
+            self._drawLegendBox(dc, printerScale, coord)
+            return
+        sample = self._sample(dc)
+        if sample is None:
+            return
+        pixels, x, y = sample
+        rgb = self._colours(pixels)
+        if rgb.shape[2] == 4:
+            raster.blit_rgba(dc, rgb, x, y)
+        else:
+            height, width = rgb.shape[:2]
+            bmp = wx.Bitmap.FromBuffer(width, height, np.ascontiguousarray(rgb))
+            dc.DrawBitmap(bmp, x, y, False)
+
+    @TempStyle('both')
+    def _drawLegendBox(self, dc, printerScale, coord):
+        """The legend box, filled with the middle colour of the colour map"""
+        colour = wx.Colour(*self._lut[128, :3]) if not self._rgb else wx.LIGHT_GREY
+        dc.SetPen(wx.BLACK_PEN)
+        dc.SetBrush(wx.Brush(colour, wx.BRUSHSTYLE_SOLID))
+        (x1, y1), (x2, _) = coord
+        h = self.getSymExtent(printerScale)[1]
+        dc.DrawRectangle(int(x1), int(y1 - h / 2), int(x2 - x1), int(h))
+
+    def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
+        self.draw(dc, printerScale, coord)
+
+
+class PolyBarsBase(PolyPoints):
+    """
+    Base class for PolyBars and PolyHistogram.
+
+    Warning
+    -------
+       All methods are private.
+    """
+    _edgestyle = LINESTYLE
+    _fillstyle = BRUSHSTYLE
+    _attributes = {
+        'edgecolour': 'black',
+        'edgewidth': 2.,
+        'edgestyle': '-',
+        'legend': '',
+        'fillcolour': 'red',
+        'fillstyle': 'solid',
+        'barwidth': 1.
+    }
+
+    def __init__(self, points, **attr):
+        """
+        """
+        PolyPoints.__init__(self, points, **attr)
+
+    def _scaleAndShift(self, data: NDArray, scale=(1, 1), shift=(0, 0)):
+        """same as override method, but returns a value."""
+        return np.asarray(data) * scale + shift
+
+    def getSymExtent(self, printerScale: float) -> Tuple[float, float]:
+        """Width and Height of Marker"""
+        h = self.attributes['edgewidth'] * printerScale * self._pointSize[0]
+        w = 5 * h
+        return w, h
+
+    def set_pen_and_brush(self, dc, printerScale):
+        pencolour = self.attributes['edgecolour']
+        penwidth = (self.attributes['edgewidth'] * printerScale *
+                    self._pointSize[0])
+        penstyle = self.attributes['edgestyle']
+        fillcolour = self.attributes['fillcolour']
+        fillstyle = self.attributes['fillstyle']
+
+        if not isinstance(pencolour, wx.Colour):
+            pencolour = wx.Colour(pencolour)
+        pen = wx.Pen(pencolour, int(penwidth), penstyle)
+        pen.SetCap(wx.CAP_BUTT)
+
+        if not isinstance(fillcolour, wx.Colour):
+            fillcolour = wx.Colour(fillcolour)
+        brush = wx.Brush(fillcolour, fillstyle)
+
+        dc.SetPen(pen)
+        dc.SetBrush(brush)
+
+    def scale_rect(self, rect):
+        # Scale the points to the plot area
+        scaled_rect = self._scaleAndShift(rect, self.currentScale,
+                                          self.currentShift)
+
+        # Convert to (left, top, width, height) for drawing
+        wx_rect = [
+            scaled_rect[0][0],  # X (left)
+            scaled_rect[0][1],  # Y (top)
+            scaled_rect[1][0] - scaled_rect[0][0],  # Width
+            scaled_rect[1][1] - scaled_rect[0][1]   # Height
+        ]
+
+        return wx_rect
+
+    def _rects(self, left, right, top, bottom=0.) -> NDArray[np.int32]:
+        """
+        Scales the bar edges to ``(N, 4)`` int32 ``(x, y, width, height)``
+        rectangles in one transform. Bars narrower than a pixel are merged.
+        """
+        scale, shift = self.currentScale, self.currentShift
+        left = np.asarray(left, np.float64) * scale[0] + shift[0]
+        right = np.asarray(right, np.float64) * scale[0] + shift[0]
+        top = np.asarray(top, np.float64) * scale[1] + shift[1]
+        bottom = np.asarray(bottom, np.float64) * scale[1] + shift[1]
+        left, right, top, bottom = np.broadcast_arrays(left, right, top, bottom)
+        rects = np.empty((len(left), 4))
+        rects[:, 0] = left
+        rects[:, 1] = top
+        rects[:, 2] = right - left
+        rects[:, 3] = bottom - top
+        return _mergeNarrowRects(rects)
+
+    def draw(self, dc: wx.DC, printerScale: float, coord: Optional[NDArray[np.float64]]=None):
+        raise NotImplementedError
+
+    def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
+        self.draw(dc, printerScale, coord)
+
+
+class PolyBars(PolyBarsBase):
+    """
+    Creates a PolyBars object.
+
+    Parameters
+    ----------
+    points : list of `(center, height)` values
+        The points that make up the line
+    barwidth : float | list[float]
+        The width of the bars
+    edgecolour : `wx.Colour` | str
+        The colour of the line
+    edgewidth : float
+        The width of the edges
+    edgestyle : {'-', '--', ':', '__', '-.'}
+        The line style
             '-': Solid line
             '--': Long dashed line
             ':': Dotted line
@@ -652,65 +2287,309 @@ class PolyBars(PolyBarsBase):
                               fillstyle=fillstyle,
                               legend=legend)
 
-    def calc_rect(self, x, y, w):
-        """ Calculate the rectangle for plotting. """
-        return self.scale_rect([
-            [x - w / 2, y],  # left, top
-            [x + w / 2, 0]   # right, bottom
-        ])
+    def calc_rect(self, x, y, w):
+        """ Calculate the rectangle for plotting. """
+        return self.scale_rect([
+            [x - w / 2, y],  # left, top
+            [x + w / 2, 0]   # right, bottom
+        ])
+
+    def draw(self, dc, printerScale, coord=None):
+        """ Draw the bars """
+        self.set_pen_and_brush(dc, printerScale)
+        barwidth = self.attributes['barwidth']
+
+        if coord is None:
+            points = self.points
+            if isinstance(barwidth, (int, float)):
+                # use a single width for all bars
+                w = float(barwidth)
+            elif isinstance(barwidth, (list, tuple, np.ndarray)):
+                # use a separate width for each bar
+                if len(barwidth) != len(points):
+                    err_str = ('Barwidth ({} items) and Points ({} items) do '
+                               'not have the same length!')
+                    err_str = err_str.format(len(barwidth), len(points))
+                    raise ValueError(err_str)
+                w = np.asarray(barwidth, np.float64)
+            else:
+                # invalid attribute type
+                err_str = ('Invalid type for \'barwidth\'. Expected float, '
+                           'int, or list or tuple of (int or float). Got {}.')
+                raise TypeError(err_str.format(type(barwidth)))
+
+            x, y = points[:, 0], points[:, 1]
+            dc.DrawRectangleList(self._rects(x - w / 2, x + w / 2, y))
+        else:
+            dc.DrawLines(coord)  # draw legend line
+
+
+class PolyHistogram(PolyBarsBase):
+    """
+    Creates a PolyHistogram object.
+
+    Parameters
+    ----------
+    hist : sequence of ``y`` values that define the heights of the bars
+        The histogram data
+    binspec : sequence of ``x`` values that define the edges of the bins
+        The bin specification
+    edgecolour : `wx.Colour` | str
+        The colour of the line
+    edgewidth : float
+        The width of the edges
+    edgestyle : {'-', '--', ':', '__', '-.'}
+        The line style
+            '-': Solid line
+            '--': Long dashed line
+            ':': Dotted line
+            '-.': Dot dash line
+            '__': Short dashed line
+    fillcolour : `wx.Colour` | str
+        The fill colour of the bars.
+    fillstyle : {'solid', 'transparent'}
+        The fill style of the marker
+    legend : str
+        The legend string
+
+    .. tip::
+
+       Use ``np.histogram()`` to easily create your histogram parameters::
+
+         hist_data, binspec = np.histogram(data)
+         hist_plot = PolyHistogram(hist_data, binspec)
+
+    .. important::
+
+       ``len(binspec)`` must equal ``len(hist) + 1``.
+
+    .. warning::
+
+       All methods except ``__init__`` are private.
+    """
+
+    def __init__(self,
+                 hist,
+                 binspec,
+                 *,
+                 edgecolour='black',
+                 edgewidth: float = 1.,
+                 edgestyle: Literal['-', '--', ':', '__', '-.'] = '-',
+                 fillcolour='red',
+                 fillstyle: Literal['solid', 'transparent'] = 'solid',
+                 legend: str = ''):
+        if len(binspec) != len(hist) + 1:
+            raise ValueError('Len(binspec) must equal len(hist) + 1')
+
+        self.hist = hist
+        self.binspec = binspec
+
+        # define the bins and center x locations
+        edges = np.asarray(self.binspec, np.float64)
+        self.bins = np.column_stack((edges[:-1], edges[1:]))
+        bar_center_x = self.bins[:, 0] + (self.bins[:, 1] - self.bins[:, 0]) / 2
+        # bar_center_x = (pair[0] + (pair[1] - pair[0]) / 2
+        #                 for pair in self.bins)
+        # points = list(zip(bar_center_x, self.hist))
+        points = np.asarray((bar_center_x, self.hist)).T
+        PolyBarsBase.__init__(self,
+                              points,
+                              edgecolour=edgecolour,
+                              edgewidth=edgewidth,
+                              edgestyle=edgestyle,
+                              fillcolour=fillcolour,
+                              fillstyle=fillstyle,
+                              legend=legend)
+
+    def calc_rect(self, y, low, high):
+        """ Calculate the rectangle for plotting. """
+        return self.scale_rect([
+            [low, y],  # left, top
+            [high, 0]  # right, bottom
+        ])
+
+    def draw(self, dc, printerScale, coord=None):
+        """ Draw the bars """
+        self.set_pen_and_brush(dc, printerScale)
+
+        if coord is None:
+            dc.DrawRectangleList(
+                self._rects(self.bins[:, 0], self.bins[:, 1], self.hist))
+        else:
+            dc.DrawLines(coord)  # draw legend line
+
+
+class PolyAdaptiveHistogram(PolyHistogram):
+    """
+    Creates a PolyAdaptiveHistogram object.
+
+    A histogram of raw samples, re-binned for the visible x range on every
+    zoom, so zooming in shows finer bins instead of magnified coarse ones.
+
+    Parameters
+    ----------
+    data : sequence of float
+        The samples, non-finite values are ignored
+    bins : int
+        The approximate number of bins across the visible x range
+    density : bool
+        If True the bar heights are ``count / (len(data) * binwidth)``, which
+        keeps them comparable between zoom levels
+    edgecolour : `wx.Colour` | str
+        The colour of the line
+    edgewidth : float
+        The width of the edges
+    edgestyle : {'-', '--', ':', '__', '-.'}
+        The line style
+    fillcolour : `wx.Colour` | str
+        The fill colour of the bars.
+    fillstyle : {'solid', 'transparent'}
+        The fill style of the marker
+    legend : str
+        The legend string
+
+    .. note::
+
+       The samples are sorted once. Binning a view is a ``np.searchsorted``
+       of the bin edges, O(bins log N), and the bin width is a power of two
+       aligned to its multiples, so panning keeps the bins in place and the
+       recent views are served from a cache.
+
+    .. warning::
+
+       All methods except ``__init__`` are private.
+    """
+    _BIN_CACHE_SIZE = 16
+
+    def __init__(self,
+                 data,
+                 bins: int = 100,
+                 *,
+                 density: bool = False,
+                 edgecolour='black',
+                 edgewidth: float = 1.,
+                 edgestyle: Literal['-', '--', ':', '__', '-.'] = '-',
+                 fillcolour='red',
+                 fillstyle: Literal['solid', 'transparent'] = 'solid',
+                 legend: str = ''):
+        if not isinstance(bins, int) or bins < 1:
+            raise ValueError('`bins` must be a positive int')
+        data = np.asarray(data, np.float64).ravel()
+        self._sorted = np.sort(data[np.isfinite(data)])
+        if not len(self._sorted):
+            raise ValueError('`data` has no finite values')
+        self.nbins = bins
+        self.density = density
+        self._binCache = {}
+
+        hist, binspec = self._histogram(self._sorted[0], self._sorted[-1])
+        PolyHistogram.__init__(self,
+                               hist,
+                               binspec,
+                               edgecolour=edgecolour,
+                               edgewidth=edgewidth,
+                               edgestyle=edgestyle,
+                               fillcolour=fillcolour,
+                               fillstyle=fillstyle,
+                               legend=legend)
+        # the bars of all samples, kept in the bounding box after a zoom
+        self._fullBox = PolyHistogram.boundingBox(self)
+
+    def _histogram(self, lower: float,
+                   upper: float) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Bins the samples between `lower` and `upper`.
+
+        Returns
+        -------
+        tuple
+            ``(hist, binspec)`` as for `PolyHistogram`.
+        """
+        span = upper - lower
+        width = 2.0**np.floor(np.log2(span / self.nbins)) if span > 0 else 1.
+        first = int(np.floor(lower / width))
+        last = max(int(np.ceil(upper / width)), first + 1)
+        key = (width, first, last)
+        cached = self._binCache.get(key)
+        if cached is not None:
+            return cached
+
+        binspec = np.arange(first, last + 1) * width
+        index = np.searchsorted(self._sorted, binspec)
+        # the last bin includes its right edge, as in np.histogram
+        index[-1] = np.searchsorted(self._sorted, binspec[-1], side='right')
+        hist = np.diff(index).astype(np.float64)
+        if self.density:
+            hist /= len(self._sorted) * width
+
+        if len(self._binCache) >= self._BIN_CACHE_SIZE:
+            self._binCache.clear()
+        self._binCache[key] = (hist, binspec)
+        return hist, binspec
+
+    def _visibleRange(self, dc: wx.DC) -> Tuple[float, float]:
+        """The x range of the data inside the drawn area of the DC"""
+        x, _, w, _ = _clipBox(dc)
+        scale, shift = self.currentScale[0], self.currentShift[0]
+        lower, upper = sorted(((x - shift) / scale, (x + w - shift) / scale))
+        if self._logscale[0]:
+            # the scale and shift are in log10 units, the samples are not
+            lower, upper = 10.0**lower, 10.0**upper
+        return max(lower, self._sorted[0]), min(upper, self._sorted[-1])
+
+    def boundingBox(self) -> Tuple[NDArray, NDArray]:
+        """
+        Returns bounding box for the plot: the drawn bars and the bars of
+        all samples, so that autoscaling after a zoom shows all of them.
+
+        Override method.
+        """
+        minXY, maxXY = PolyHistogram.boundingBox(self)
+        return (np.minimum(minXY, self._fullBox[0]),
+                np.maximum(maxXY, self._fullBox[1]))
 
     def draw(self, dc, printerScale, coord=None):
         """ Draw the bars """
-        self.set_pen_and_brush(dc, printerScale)
-        barwidth = self.attributes['barwidth']
-
         if coord is None:
-            if isinstance(barwidth, (int, float)):
-                # use a single width for all bars
-                pts = ((x, y, barwidth) for x, y in self.points)
-            elif isinstance(barwidth, (list, tuple)):
-                # use a separate width for each bar
-                if len(barwidth) != len(self.points):
-                    err_str = ('Barwidth ({} items) and Points ({} items) do '
-                               'not have the same length!')
-                    err_str = err_str.format(len(barwidth), len(self.points))
-                    raise ValueError(err_str)
-                pts = ((x, y, w) for (x, y), w in zip(self.points, barwidth))
-            else:
-                # invalid attribute type
-                err_str = ('Invalid type for \'barwidth\'. Expected float, '
-                           'int, or list or tuple of (int or float). Got {}.')
-                raise TypeError(err_str.format(type(barwidth)))
-
-            rects = [self.calc_rect(x, y, w) for x, y, w in pts]
-            rects = [(int(r[0]), int(r[1]), int(r[2]), int(r[3]))
-                     for r in rects]
-            dc.DrawRectangleList(rects)
-        else:
-            dc.DrawLines(coord)  # draw legend line
-
-
-class PolyHistogram(PolyBarsBase):
+            lower, upper = self._visibleRange(dc)
+            if upper < lower:  # no data in view
+                return
+            hist, binspec = self._histogram(lower, upper)
+            if hist is not self.hist:
+                self.hist, self.binspec = hist, binspec
+                self.bins = np.column_stack((binspec[:-1], binspec[1:]))
+                # the points follow the drawn bars, for the point labels
+                self._points = np.column_stack((self.bins.mean(axis=1), hist))
+                self._scaledFor = None
+                self.scaleAndShift(self.currentScale, self.currentShift)
+        PolyHistogram.draw(self, dc, printerScale, coord)
+
+
+class PolyStreamHistogram(PolyHistogram):
     """
-    Creates a PolyHistogram object.
+    Creates a PolyStreamHistogram object.
+
+    A histogram for live data: new samples are counted into the existing
+    bins with `add_samples`, instead of re-running ``np.histogram`` over the
+    whole history and creating a new object.
 
     Parameters
     ----------
-    hist : sequence of ``y`` values that define the heights of the bars
-        The histogram data
     binspec : sequence of ``x`` values that define the edges of the bins
-        The bin specification
+        The initial bin specification. Must be evenly spaced if `extend` is
+        True.
+    extend : bool
+        If True the bins grow by whole bin widths to cover new samples
+        outside them, otherwise those samples are dropped.
+    maxbins : int
+        The most bins `extend` may grow to. Samples beyond them are
+        dropped, so that one far outlier cannot exhaust the memory.
     edgecolour : `wx.Colour` | str
         The colour of the line
     edgewidth : float
         The width of the edges
     edgestyle : {'-', '--', ':', '__', '-.'}
         The line style
-            '-': Solid line
-            '--': Long dashed line
-            ':': Dotted line
-            '-.': Dot dash line
-            '__': Short dashed line
     fillcolour : `wx.Colour` | str
         The fill colour of the bars.
     fillstyle : {'solid', 'transparent'}
@@ -720,74 +2599,134 @@ class PolyHistogram(PolyBarsBase):
 
     .. tip::
 
-       Use ``np.histogram()`` to easily create your histogram parameters::
-
-         hist_data, binspec = np.histogram(data)
-         hist_plot = PolyHistogram(hist_data, binspec)
-
-    .. important::
+       Call ``canvas.Redraw()`` after `add_samples` to show the new counts::
 
-       ``len(binspec)`` must equal ``len(hist) + 1``.
+         hist_plot = PolyStreamHistogram(np.linspace(0, 1, 51), extend=True)
+         hist_plot.add_samples(new_data)
 
     .. warning::
 
-       All methods except ``__init__`` are private.
+       All methods except ``__init__``, ``add_samples`` and
+       ``clear_samples`` are private.
     """
 
     def __init__(self,
-                 hist,
                  binspec,
                  *,
+                 extend: bool = False,
+                 maxbins: int = 10000,
                  edgecolour='black',
                  edgewidth: float = 1.,
                  edgestyle: Literal['-', '--', ':', '__', '-.'] = '-',
                  fillcolour='red',
                  fillstyle: Literal['solid', 'transparent'] = 'solid',
                  legend: str = ''):
-        if len(binspec) != len(hist) + 1:
-            raise ValueError('Len(binspec) must equal len(hist) + 1')
+        binspec = np.asarray(binspec, np.float64)
+        if binspec.ndim != 1 or len(binspec) < 2 or (np.diff(binspec) <= 0).any():
+            raise ValueError('`binspec` must be at least 2 increasing edges')
+        widths = np.diff(binspec)
+        # evenly spaced bins can be extended by whole widths
+        self._width = widths[0] if np.allclose(widths, widths[0]) else None
+        if extend and self._width is None:
+            raise ValueError('`extend` needs evenly spaced `binspec`')
+        self.extend = extend
+        self.maxbins = maxbins
+        self._dirty = False
+        PolyHistogram.__init__(self,
+                               np.zeros(len(binspec) - 1),
+                               binspec,
+                               edgecolour=edgecolour,
+                               edgewidth=edgewidth,
+                               edgestyle=edgestyle,
+                               fillcolour=fillcolour,
+                               fillstyle=fillstyle,
+                               legend=legend)
+
+    def add_samples(self, samples) -> None:
+        """
+        Counts new samples into the bins.
 
-        self.hist = hist
-        self.binspec = binspec
+        The counts are updated in place with ``np.bincount``; the bars are
+        refreshed on the next draw. Non-finite samples are ignored.
 
-        # define the bins and center x locations
-        self.bins = np.array(pairwise(self.binspec))
-        bar_center_x = self.bins[:, 0] + (self.bins[:, 1] - self.bins[:, 0]) / 2
-        # bar_center_x = (pair[0] + (pair[1] - pair[0]) / 2
-        #                 for pair in self.bins)
-        # points = list(zip(bar_center_x, self.hist))
-        points = np.asarray((bar_center_x, self.hist)).T
-        PolyBarsBase.__init__(self,
-                              points,
-                              edgecolour=edgecolour,
-                              edgewidth=edgewidth,
-                              edgestyle=edgestyle,
-                              fillcolour=fillcolour,
-                              fillstyle=fillstyle,
-                              legend=legend)
+        Parameters
+        ----------
+        samples : sequence of float
+            The new samples
+        """
+        samples = np.asarray(samples, np.float64).ravel()
+        samples = samples[np.isfinite(samples)]
+        if not len(samples):
+            return
+        if self.extend:
+            self._extendTo(samples.min(), samples.max())
+
+        binspec = self.binspec
+        samples = samples[(samples >= binspec[0]) & (samples <= binspec[-1])]
+        n = len(self.hist)
+        # compare with the edges rather than dividing by the bin width,
+        # which rounds samples on an edge into the wrong bin
+        index = np.searchsorted(binspec, samples, side='right') - 1
+        # the last bin includes its right edge, as in np.histogram
+        np.minimum(index, n - 1, out=index)
+        self.hist += np.bincount(index, minlength=n)
+        self._dirty = True
+        self.markChanged()
+
+    def clear_samples(self) -> None:
+        """Sets all counts to zero, keeping the bins."""
+        self.hist[:] = 0
+        self._dirty = True
+        self.markChanged()
+
+    def _extendTo(self, lower: float, upper: float) -> None:
+        """
+        Adds whole bins so that the edges cover `lower` and `upper`, up to
+        `maxbins` bins in all.
+        """
+        binspec, width = self.binspec, self._width
+        n = len(self.hist)
+        room = max(self.maxbins - n, 0)
+        # clip before converting, an outlier may be too far for an int
+        below = int(np.clip(np.ceil((binspec[0] - lower) / width), 0, room))
+        above = int(np.clip(np.ceil((upper - binspec[-1]) / width), 0, room))
+        if below + above > room:
+            # share the room, neither side taking more than it needs
+            below = min(below, max(room - above, room // 2))
+            above = min(above, room - below)
+        if below or above:
+            self.binspec = binspec[0] + np.arange(-below, n + above + 1) * width
+            self.bins = np.column_stack((self.binspec[:-1], self.binspec[1:]))
+            self.hist = np.concatenate(
+                (np.zeros(below), self.hist, np.zeros(above)))
+
+    def _refresh(self) -> None:
+        """Updates the bar points after new samples"""
+        if self._dirty:
+            self._points = np.column_stack((self.bins.mean(axis=1), self.hist))
+            self._scaledFor = None  # the next scaleAndShift scales again
+            self._dirty = False
 
-    def calc_rect(self, y, low, high):
-        """ Calculate the rectangle for plotting. """
-        return self.scale_rect([
-            [low, y],  # left, top
-            [high, 0]  # right, bottom
-        ])
+    def boundingBox(self) -> Tuple[NDArray, NDArray]:
+        self._refresh()
+        return PolyHistogram.boundingBox(self)
 
-    def draw(self, dc, printerScale, coord=None):
-        """ Draw the bars """
-        self.set_pen_and_brush(dc, printerScale)
+    def scaleAndShift(self, scale=(1, 1), shift=(0, 0)):
+        self._refresh()
+        PolyHistogram.scaleAndShift(self, scale, shift)
 
-        if coord is None:
-            rects = [
-                self.calc_rect(y, low, high)
-                for y, (low, high) in zip(self.hist, self.bins)
-            ]
-            rects = [(int(r[0]), int(r[1]), int(r[2]), int(r[3]))
-                     for r in rects]
-
-            dc.DrawRectangleList(rects)
-        else:
-            dc.DrawLines(coord)  # draw legend line
+
+def _jitter(xpos: NDArray[np.float64], seed: Optional[int]) -> NDArray[np.float64]:
+    """
+    Reproducible x positions of outlier markers within 0.025 of `xpos`.
+
+    The seed is combined with the box positions, so boxes at different
+    positions get different jitters from the same seed.
+    """
+    xpos = np.asarray(xpos, np.float64)
+    if seed is not None:
+        seed = [seed, *np.unique(xpos).view(np.uint64).tolist()]
+    return 0.05 * np.random.default_rng(seed).random(xpos.shape) + xpos - 0.025
 
 
 BPData = namedtuple(
@@ -816,6 +2755,9 @@ class PolyBoxPlot(PolyPoints):
             '__': Short dashed line
     legend : str
         The legend string
+    seed : int, optional
+        The seed of the outlier jitter, which also depends on the box
+        position. None for a different one every time.
 
     .. note::
 
@@ -847,7 +2789,8 @@ class PolyBoxPlot(PolyPoints):
                  colour='black',
                  width: float = 1,
                  style: Literal['-', '--', ':', '__', '-.'] = '-',
-                 legend: str = ''):
+                 legend: str = '',
+                 seed: Optional[int] = 0):
         # Set various attributes
         self.box_width = 0.5
 
@@ -858,16 +2801,23 @@ class PolyBoxPlot(PolyPoints):
         # Calculate the box plot points and the outliers
         self._bpdata = self.calcBpData(points)
         self._outliers = self.calcOutliers(points)
-        points = np.concatenate((self._bpdata, self._outliers))
-        points = np.asarray([(self.xpos, x) for x in points])
 
         # Create a jitter for the outliers
-        self.jitter: NDArray[np.float64] = 0.05 * np.random.random_sample(
-            len(self._outliers)) + self.xpos - 0.025
+        self.jitter: NDArray[np.float64] = _jitter(
+            np.full(len(self._outliers), self.xpos), seed)
+
+        # the points are the box features followed by the outliers, all at
+        # xpos; getClosestPoint searches the outliers at their jitter
+        points = np.concatenate(
+            (np.column_stack((np.full(len(self._bpdata), self.xpos),
+                              self._bpdata)),
+             np.column_stack((np.full(len(self._outliers), self.xpos),
+                              self._outliers))))
 
         # Init the parent class
         PolyPoints.__init__(self, points, colour=colour, width=width,
                             style=style, legend=legend)
+        self._setDrawnPoints()
 
     def _clean_data(self, data=None):
         """
@@ -903,17 +2853,14 @@ class PolyBoxPlot(PolyPoints):
 
         if pointScaled == True, then based on screen coords
         if pointScaled == False, then based on user coords
-        """
-
-        xpos = self.xpos
-
-        # combine the outliers with the box plot data
-        data_to_use = np.concatenate((self._bpdata, self._outliers))
-        data_to_use = np.asarray([(xpos, x) for x in data_to_use])
 
+        The screen search finds the outliers where their markers are drawn,
+        the returned data point has their true x position. Both arrays are
+        prepared beforehand, so a hover only computes the distances.
+        """
         if pointScaled:
             # Use screen coords
-            p = self.scaled
+            p = self._drawnScaled
             pxy = self.currentScale * np.asarray(pntXY) + self.currentShift
         else:
             # Using user coords
@@ -921,14 +2868,36 @@ class PolyBoxPlot(PolyPoints):
             pxy = np.asarray(pntXY)
 
         # determine distance for each point
-        d = np.sqrt(np.add.reduce((p - pxy)**2, 1))  # sqrt(dx^2+dy^2)
+        d = np.hypot(p[:, 0] - pxy[0], p[:, 1] - pxy[1])
         pntIndex = np.argmin(d)
         dist = d[pntIndex]
         return [
-            pntIndex, self.points[pntIndex],
-            self.scaled[pntIndex] / self._pointSize, dist
+            pntIndex, self._points[pntIndex],
+            self._drawnScaled[pntIndex] / self._pointSize, dist
         ]
 
+    def _setDrawnPoints(self) -> None:
+        """
+        Builds the hit-test points: the points with the outliers, which
+        come last, at their jitter where their markers are drawn.
+        """
+        drawn = np.array(self._points)
+        if len(self.jitter):
+            drawn[-len(self.jitter):, 0] = self.jitter
+        self._drawnPoints = self._drawnScaled = drawn
+
+    def scaleAndShift(self, scale=(1, 1), shift=(0, 0)):
+        """
+        Scales and shifts the data for plotting. Override method.
+
+        Also scales the hit-test points of `getClosestPoint`.
+        """
+        if self._rescaleMode(scale, shift) is None:
+            return
+        PolyPoints.scaleAndShift(self, scale, shift)
+        self._drawnScaled = self._scaleAndShift(
+            self._drawnPoints, self.currentScale, self.currentShift)
+
     def getSymExtent(self, printerScale) -> Tuple[float, float]:
         """Width and Height of Marker"""
         # TODO: does this need to be updated?
@@ -1132,6 +3101,390 @@ class PolyBoxPlot(PolyPoints):
         dc.DrawRectangleList(rect.astype(np.int64))
 
 
+class PolyBoxPlots(PolyPoints):
+    """
+    Creates a PolyBoxPlots object: box plots of several groups side by side.
+
+    The statistics of all groups are computed in one ``np.nanpercentile``
+    pass and each plot element is drawn with a single list call.
+
+    Parameters
+    ----------
+    data : 2D array-like | sequence of 1D array-like
+        Raw data to create the box plots from. A 2D `np.ndarray` holds one
+        group per column; otherwise every item is a group, and groups may
+        have different lengths.
+    xpos : sequence of float, optional
+        The x position of each group. Default is ``1, 2, ..., n``.
+    box_width : float
+        The width of the boxes in x units
+    colour : `wx.Colour` | str
+        The colour of the lines
+    width : float
+        The width of the whiskers, the box outlines and the medians are
+        drawn 1.5 and 2 times as wide
+    style : {'-', '--', ':', '__', '-.'}
+        The line style
+    fillcolour : `wx.Colour` | str
+        The fill colour of the boxes
+    outliercolour : `wx.Colour` | str
+        The colour of the outlier markers
+    legend : str
+        The legend string
+    seed : int, optional
+        The seed of the outlier jitter, which also depends on the box
+        positions. None for a different one every time.
+
+    .. note::
+
+       ``np.NaN`` and ``np.inf`` values are ignored, groups without finite
+       values are not drawn.
+    """
+    _style = LINESTYLE
+    _attributes = {
+        'colour': 'black',
+        'width': 2,
+        'style': '-',
+        'fillcolour': 'GREEN',
+        'outliercolour': 'BLUE',
+        'legend': '',
+    }
+
+    def __init__(self,
+                 data,
+                 *,
+                 xpos: Optional[Sequence[float]] = None,
+                 box_width: float = 0.5,
+                 colour='black',
+                 width: float = 2,
+                 style: Literal['-', '--', ':', '__', '-.'] = '-',
+                 fillcolour='GREEN',
+                 outliercolour='BLUE',
+                 legend: str = '',
+                 seed: Optional[int] = 0):
+        data = self._groups(data)
+        ngroups = data.shape[1]
+        if xpos is None:
+            xpos = np.arange(1, ngroups + 1, dtype=np.float64)
+        xpos = np.asarray(xpos, np.float64).ravel()
+        if len(xpos) != ngroups:
+            raise ValueError('`xpos` must have one value per group')
+
+        # drop the groups without finite values
+        valid = np.isfinite(data).any(axis=0)
+        data = data[:, valid]
+        self.xpos = xpos[valid]
+        self.box_width = box_width
+
+        # Calculate the box plot points and the outliers
+        self._bpdata = self.calcBpData(data)
+        self._outliers = self.calcOutliers(data)
+
+        # Create a jitter for the outliers
+        outlier_x = self.xpos[self._outliers[:, 0].astype(np.intp)]
+        self.jitter: NDArray[np.float64] = _jitter(outlier_x, seed)
+
+        # the box features followed by the outliers, see PolyBoxPlot
+        points = np.concatenate(
+            (np.column_stack((np.repeat(self.xpos, 7), self._bpdata.ravel())),
+             np.column_stack((outlier_x, self._outliers[:, 1]))))
+        PolyPoints.__init__(self, points, colour=colour, width=width,
+                            style=style, fillcolour=fillcolour,
+                            outliercolour=outliercolour, legend=legend)
+        self._setDrawnPoints()
+
+    @staticmethod
+    def _groups(data) -> NDArray[np.float64]:
+        """The groups as NaN padded columns, with inf replaced by NaN"""
+        if isinstance(data, np.ndarray) and data.ndim == 2:
+            out = data.astype(np.float64)
+        else:
+            groups = [np.asarray(g, np.float64).ravel() for g in data]
+            if not groups:
+                raise ValueError('`data` has no groups')
+            out = np.full((max(len(g) for g in groups), len(groups)), np.nan)
+            for i, g in enumerate(groups):
+                out[:len(g), i] = g
+        out[np.isinf(out)] = np.nan
+        return out
+
+    @property
+    def nGroups(self) -> int:
+        """The number of drawn groups"""
+        return len(self.xpos)
+
+    def getBpData(self, index: int = 0) -> BPData:
+        """The descriptive statistics of group `index`"""
+        return BPData(*map(float, self._bpdata[index]))
+
+    def calcBpData(self, data: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Box plot points of every column, see `PolyBoxPlot.calcBpData`.
+
+        Returns
+        -------
+        NDArray, shape ``(n, 7)``
+            One row of (min_data, low_whisker, q25, median, q75,
+            high_whisker, max_data) per group.
+        """
+        q25, median, q75 = np.nanpercentile(data, (25, 50, 75), axis=0)
+        iqr = q75 - q25
+        low = np.where(data >= q25 - 1.5 * iqr, data, np.nan)
+        high = np.where(data <= q75 + 1.5 * iqr, data, np.nan)
+        return np.column_stack(
+            (np.nanmin(data, axis=0), np.nanmin(low, axis=0), q25, median,
+             q75, np.nanmax(high, axis=0), np.nanmax(data, axis=0)))
+
+    def calcOutliers(self, data: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Calculates the outliers. Must be called after calcBpData.
+
+        Returns
+        -------
+        NDArray, shape ``(m, 2)``
+            The ``(group index, value)`` of every outlier.
+        """
+        with np.errstate(invalid='ignore'):
+            outlier_bool = ((data > self._bpdata[:, 5])
+                            | (data < self._bpdata[:, 1]))
+        rows, cols = np.nonzero(outlier_bool)
+        return np.column_stack((cols, data[rows, cols])).astype(np.float64)
+
+    def boundingBox(self) -> Tuple[NDArray, NDArray]:
+        """
+        Returns bounding box for the plot.
+
+        Override method.
+        """
+        half = self.box_width / 2
+        minXY = np.asarray([self.xpos.min() - half, self._bpdata[:, 0].min() * 0.95])
+        maxXY = np.asarray([self.xpos.max() + half, self._bpdata[:, 6].max() * 1.05])
+        return minXY, maxXY
+
+    def getSymExtent(self, printerScale) -> Tuple[float, float]:
+        """Width and Height of Marker"""
+        h = self.attributes['width'] * printerScale * self._pointSize[0]
+        w = 5 * h
+        return w, h
+
+    _scaleAndShift = PolyBoxPlot._scaleAndShift
+    _setDrawnPoints = PolyBoxPlot._setDrawnPoints
+    scaleAndShift = PolyBoxPlot.scaleAndShift
+    getClosestPoint = PolyBoxPlot.getClosestPoint
+
+    def _segments(self, x1, x2, y) -> NDArray[np.int32]:
+        """Scaled horizontal (``y``) or vertical (``x1 == x2``) segments"""
+        scale, shift = self.currentScale, self.currentShift
+        x1, x2, y1, y2 = np.broadcast_arrays(x1, x2, *y)
+        lines = np.column_stack((x1 * scale[0], y1 * scale[1],
+                                 x2 * scale[0], y2 * scale[1]))
+        return _int32(lines + np.tile(shift, 2))
+
+    def _pen(self, printerScale, factor: float = 1.,
+             colour=None, style=None) -> wx.Pen:
+        """
+        A pen `factor` times as wide as the width attribute, in the colour
+        and style attributes unless given.
+        """
+        if colour is None:
+            colour = self.attributes['colour']
+        if not isinstance(colour, wx.Colour):
+            colour = wx.Colour(colour)
+        width = (factor * self.attributes['width'] * printerScale
+                 * self._pointSize[0])
+        pen = wx.Pen(colour, max(int(width), 1),
+                     self.attributes['style'] if style is None else style)
+        pen.SetCap(wx.CAP_BUTT)
+        return pen
+
+    @TempStyle('pen')
+    def draw(self, dc, printerScale, coord=None):
+        """
+        Draws all box plots on the DC, in the order of `PolyBoxPlot.draw`.
+        """
+        x = self.xpos
+        half = self.box_width / 2
+        (_, low, q25, median, q75, high, _) = self._bpdata.T
+        scale, shift = self.currentScale, self.currentShift
+
+        # whiskers as single lines, the middle is hidden by the boxes
+        whisker_pen = self._pen(printerScale)
+        dc.SetPen(whisker_pen)
+        dc.DrawLineList(self._segments(x, x, (low, high)))
+
+        # Inner Quartile Range boxes as (left, top, width, height)
+        boxes = np.column_stack(
+            ((x - half) * scale[0] + shift[0], q75 * scale[1] + shift[1],
+             np.full(len(x), self.box_width * scale[0]),
+             (q25 - q75) * scale[1]))
+        fillcolour = self.attributes['fillcolour']
+        if not isinstance(fillcolour, wx.Colour):
+            fillcolour = wx.Colour(fillcolour)
+        dc.SetPen(self._pen(printerScale, 1.5))
+        dc.SetBrush(wx.Brush(fillcolour, wx.BRUSHSTYLE_SOLID))
+        dc.DrawRectangleList(_int32(boxes))
+
+        # median lines after the boxes
+        dc.SetPen(self._pen(printerScale, 2))
+        dc.DrawLineList(self._segments(x - half, x + half, (median, median)))
+
+        # whisker end caps
+        cap = self.box_width * 0.2
+        dc.SetPen(whisker_pen)
+        dc.DrawLineList(self._segments(np.tile(x - cap, 2), np.tile(x + cap, 2),
+                                       (np.r_[high, low], np.r_[high, low])))
+
+        # outliers
+        if len(self._outliers):
+            size = 0.5
+            fact = 2.5 * size
+            wh = 5.0 * size
+            rect = np.empty((len(self._outliers), 4))
+            rect[:, 0] = self.jitter * scale[0] + shift[0] - fact
+            rect[:, 1] = self._outliers[:, 1] * scale[1] + shift[1] - fact
+            rect[:, 2:] = wh
+            dc.SetPen(self._pen(printerScale, 2.5,
+                                self.attributes['outliercolour'],
+                                wx.PENSTYLE_SOLID))
+            dc.DrawRectangleList(_int32(rect))
+
+    def drawlegend(self, dc: wx.DC, printerScale: float, coord: NDArray[np.float64]):
+        dc.SetPen(self._pen(printerScale, 1.5))
+        dc.DrawLines(coord)
+
+
+class PolyStreamBoxPlot(PolyBoxPlots):
+    """
+    Creates a PolyStreamBoxPlot object: a box plot of an unbounded stream.
+
+    The raw data is not kept. The quartiles and whiskers come from a
+    `QuantileSketch` and the outliers are drawn from a `Reservoir` sample,
+    so memory is bounded and `add_samples` costs O(1) amortized per sample.
+
+    Parameters
+    ----------
+    xpos : float
+        The x position of the box
+    compression : int
+        The accuracy of the quantile sketch, see `QuantileSketch`
+    reservoir : int
+        The number of samples kept for the outlier markers
+    seed : int, optional
+        The seed of the reservoir sampling and the outlier jitter, None for
+        different ones every time
+    box_width : float
+        The width of the box in x units
+    colour : `wx.Colour` | str
+        The colour of the lines
+    width : float
+        The width of the whiskers, the box outlines and the medians are
+        drawn 1.5 and 2 times as wide
+    style : {'-', '--', ':', '__', '-.'}
+        The line style
+    fillcolour : `wx.Colour` | str
+        The fill colour of the boxes
+    outliercolour : `wx.Colour` | str
+        The colour of the outlier markers
+    legend : str
+        The legend string
+
+    .. note::
+
+       The whiskers are the sketch centroids nearest inside the 1.5 IQR
+       fences, so they are estimates like the quartiles.
+
+    .. warning::
+
+       All methods except ``__init__``, ``add_samples`` and ``getBpData``
+       are private.
+    """
+
+    def __init__(self,
+                 xpos: float = 1.,
+                 *,
+                 compression: int = 100,
+                 reservoir: int = 1000,
+                 seed: Optional[int] = 0,
+                 box_width: float = 0.5,
+                 colour='black',
+                 width: float = 2,
+                 style: Literal['-', '--', ':', '__', '-.'] = '-',
+                 fillcolour='GREEN',
+                 outliercolour='BLUE',
+                 legend: str = ''):
+        self.sketch = QuantileSketch(compression)
+        self.reservoir = Reservoir(reservoir, seed)
+        # one fixed jitter per reservoir slot keeps the outliers in place
+        self._slotJitter = _jitter(np.full(reservoir, float(xpos)), seed)
+        self.xpos = np.asarray([xpos], np.float64)
+        self.box_width = box_width
+        self._bpdata = np.full((1, 7), np.nan)
+        self._outliers = np.empty((0, 2))
+        self.jitter = np.empty(0)
+        self._dirty = False
+        PolyPoints.__init__(self, np.empty((0, 2)), colour=colour, width=width,
+                            style=style, fillcolour=fillcolour,
+                            outliercolour=outliercolour, legend=legend)
+        self._setDrawnPoints()
+
+    def add_samples(self, samples) -> None:
+        """
+        Adds samples to the stream. Non-finite values are ignored.
+
+        The box is refreshed on the next draw.
+        """
+        samples = np.asarray(samples, np.float64).ravel()
+        samples = samples[np.isfinite(samples)]
+        if not len(samples):
+            return
+        self.sketch.update(samples)
+        self.reservoir.update(samples)
+        self._dirty = True
+        self.markChanged()
+
+    def _refresh(self) -> None:
+        """Updates the box statistics and outliers after new samples"""
+        if not self._dirty:
+            return
+        sketch = self.sketch
+        q25, median, q75 = sketch.quantile((0.25, 0.5, 0.75))
+        iqr = q75 - q25
+        low = sketch.lowest_above(q25 - 1.5 * iqr)
+        high = sketch.highest_below(q75 + 1.5 * iqr)
+        self._bpdata = np.asarray(
+            [[sketch.min, low, q25, median, q75, high, sketch.max]])
+
+        sample = self.reservoir.sample
+        slots = np.flatnonzero((sample < low) | (sample > high))
+        self._outliers = np.column_stack((np.zeros(len(slots)), sample[slots]))
+        self.jitter = self._slotJitter[slots]
+
+        self._points = np.concatenate(
+            (np.column_stack((np.full(7, self.xpos[0]), self._bpdata[0])),
+             np.column_stack((np.full(len(slots), self.xpos[0]),
+                              sample[slots]))))
+        self._setDrawnPoints()
+        self._scaledFor = None  # the next scaleAndShift scales again
+        self._dirty = False
+
+    def boundingBox(self) -> Tuple[NDArray, NDArray]:
+        self._refresh()
+        if not self.sketch.count:
+            half = self.box_width / 2
+            return (np.asarray([self.xpos[0] - half, 0.]),
+                    np.asarray([self.xpos[0] + half, 1.]))
+        return PolyBoxPlots.boundingBox(self)
+
+    def scaleAndShift(self, scale=(1, 1), shift=(0, 0)):
+        self._refresh()
+        PolyBoxPlots.scaleAndShift(self, scale, shift)
+
+    def draw(self, dc, printerScale, coord=None):
+        self._refresh()
+        if self.sketch.count:
+            PolyBoxPlots.draw(self, dc, printerScale, coord)
+
+
 class PlotGraphics(_PlotGraphics):
     """
     Creates a PlotGraphics object.
@@ -1166,6 +3519,124 @@ class PlotGraphics(_PlotGraphics):
         self._xLabel = xLabel
         self._yLabel = yLabel
         self._pointSize = (1.0, 1.0)
+        self._useSprites = False
+        self._useRaster = False
+        self._hideMarkers = False
+        self._decimation = 0
+        # worker threads of the canvas, None to work on the calling thread
+        self._executor: Optional[Executor] = None
+        self._threads = 0
+        # the canvas cache of raster layers, None to draw every layer
+        self._layerCache: Optional[MutableMapping] = None
+
+    def draw(self, dc: wx.DC) -> None:
+        """
+        Draw every object, passing down the canvas drawing options.
+
+        With the raster backend, consecutive objects supporting it are drawn
+        into RGBA buffers, which are put on the DC before the next object
+        that does not, so the drawing order is kept. Hidden objects are
+        skipped.
+        """
+        run = []
+        for o in self.objects:
+            o._pointSize = self._pointSize
+            o._useSprites = self._useSprites
+            o._hideMarkers = self._hideMarkers
+            o._decimation = self._decimation
+            if not o._visible:
+                continue
+            if self._useRaster:
+                item = self._rasterItem(o, dc)
+                if item is not None:
+                    run.append(item)
+                    continue
+                self._drawRaster(dc, run)
+                run = []
+            o.draw(dc, self._printerScale)
+        self._drawRaster(dc, run)
+
+    def _rasterItem(self, o: PolyPoints, dc: wx.DC) -> Optional[tuple]:
+        """
+        Prepares an object for the raster backend.
+
+        Returns
+        -------
+        tuple | None
+            ``(object, cache key, job)``, where job is None if the cached
+            layer of the object is current, or None if the object does not
+            support the raster backend.
+        """
+        key = None
+        if self._layerCache is not None:
+            # the object version and everything about the view
+            key = (o._version, o._logscale, o._absScale,
+                   tuple(map(float, o.currentScale)),
+                   tuple(map(float, o.currentShift)), _clipBox(dc),
+                   self._printerScale, self._pointSize, self._hideMarkers,
+                   self._decimation, isinstance(dc, wx.GCDC))
+            cached = self._layerCache.get(o)
+            if cached is not None and cached[0] == key:
+                return o, key, None
+        job = o._rasterJob(dc, self._printerScale)
+        return None if job is None else (o, key, job)
+
+    def _drawRaster(self, dc: wx.DC, run: List[tuple]) -> None:
+        """
+        Draws the `_rasterItem` of consecutive objects with one
+        ``DrawBitmap``.
+
+        Without layer cache and worker threads all jobs draw into one
+        buffer. Otherwise the jobs are split into one contiguous chunk per
+        worker, each drawn into one buffer, and the drawn pixels of the
+        chunks and of the cached layers are composited in order on the
+        calling thread. With the layer cache, the pixels of every job are
+        taken from the chunk buffer after it ran, to be cached on their own.
+        """
+        if not run:
+            return
+        bounds = _clipBox(dc)
+        buf, x, y = raster.new_layer(bounds)
+        cache = self._layerCache
+        if cache is None and (self._executor is None or len(run) == 1):
+            for _, _, job in run:
+                job(buf, (x, y))
+            raster.blit_rgba(dc, buf, x, y)
+            return
+
+        def render(chunk):
+            layer = raster.new_layer(bounds)
+            if cache is None:
+                for job in chunk:
+                    job(layer[0], layer[1:])
+                return [raster.drawn_pixels(*layer)]
+            layers = []
+            for job in chunk:
+                job(layer[0], layer[1:])
+                layers.append(raster.take_pixels(*layer))
+            return layers
+
+        jobs = [job for _, _, job in run if job is not None]
+        workers = 1 if self._executor is None else max(self._threads, 1)
+        nchunks = min(workers, len(jobs))
+        edges = np.linspace(0, len(jobs), nchunks + 1).astype(np.intp)
+        chunks = [jobs[a:b] for a, b in zip(edges[:-1], edges[1:])]
+        if nchunks > 1:
+            layers = chain.from_iterable(self._executor.map(render, chunks))
+        else:
+            layers = chain.from_iterable(map(render, chunks))
+        if cache is None:
+            for layer in layers:
+                raster.put_pixels(buf, *layer, (x, y))
+        else:
+            for o, key, job in run:
+                if job is None:
+                    layer = cache[o][1]
+                else:
+                    layer = next(layers)
+                    cache[o] = (key, layer)
+                raster.put_pixels(buf, *layer, (x, y))
+        raster.blit_rgba(dc, buf, x, y)
 
     def getSymExtent(self, printerScale) -> Tuple[float, float]:
         """Get max width and height of lines and markers symbols for legend"""
@@ -1178,9 +3649,43 @@ class PlotGraphics(_PlotGraphics):
             symExt = (max(symExt[0], oSymExt[0]), max(symExt[1], oSymExt[1]))
         return symExt
 
+    def getLegendItems(self) -> List[Tuple[PolyPoints, Optional[int]]]:
+        """
+        Returns list of `(object, series index)` for each legend entry.
+
+        The series index is None except for `PolyMultiLine`, which has one
+        entry per series.
+        """
+        items = []
+        for o in self.objects:
+            if isinstance(o, PolyMultiLine):
+                items.extend((o, i) for i in range(o.nSeries))
+            else:
+                items.append((o, None))
+        return items
+
     def getLegendNames(self) -> List[str]:
         """Returns list of legend names"""
-        return [o.getLegend() for o in self.objects]
+        return [o.getLegend() if i is None else o.getLegend(i)
+                for o, i in self.getLegendItems()]
+
+    def scaleAndShift(self, scale=(1, 1), shift=(0, 0)) -> None:
+        """
+        Scales and shifts every object.
+
+        Objects whose scale is unchanged (panning) only translate their
+        scaled data in place.
+        """
+        scale = np.asarray(scale, np.float64)
+        shift = np.asarray(shift, np.float64)
+        if self._executor is None or len(self.objects) < 2:
+            for o in self.objects:
+                o.scaleAndShift(scale, shift)
+        else:
+            # each object is only touched by one worker
+            for _ in self._executor.map(lambda o: o.scaleAndShift(scale, shift),
+                                        self.objects):
+                pass
 
     def setLogScale(self, logscale: Sequence[bool]) -> None:
         """Set the log scale boolean value."""
@@ -1221,6 +3726,8 @@ class PlotGraphics(_PlotGraphics):
 
 __all__ = [
     'LINESTYLE', 'BRUSHSTYLE', 'PlotGraphics', 'PlotPrintout', 'PolyPoints',
-    'PolyMarker', 'PolyLine', 'PolyBarsBase', 'PolyBars', 'PolyHistogram',
-    'PolyBoxPlot'
+    'PolyMarker', 'PolyLine', 'PolyMultiLine', 'PolyScatter', 'PolyFill',
+    'PolyErrorBars', 'PolyCandlestick', 'PolyImage', 'PolyBarsBase',
+    'PolyBars', 'PolyHistogram', 'PolyAdaptiveHistogram',
+    'PolyStreamHistogram', 'PolyBoxPlot', 'PolyBoxPlots', 'PolyStreamBoxPlot'
 ]
@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+NumPy RGBA raster helpers.
+
+Plot items are composited into a ``(height, width, 4)`` uint8 buffer with
+array operations, then put on the DC with a single ``DrawBitmap``. Markers
+are stamped sprites, lines are stepped pixel by pixel for all segments at
+once.
+"""
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import wx
+from numpy.typing import NDArray
+
+# rendered sprites, keyed by everything that changes their pixels
+_spriteCache: Dict[Hashable, NDArray[np.uint8]] = {}
+_SPRITE_CACHE_SIZE = 128
+# number of points stamped per chunk, bounds the temporary index arrays
+_STAMP_CHUNK = 16384
+# number of line segments rasterized per chunk
+_SEGMENT_CHUNK = 4096
+# on/off run lengths of the dashed pen styles, in line widths
+_DASHES = {
+    wx.PENSTYLE_DOT: (1, 2),
+    wx.PENSTYLE_LONG_DASH: (9, 5),
+    wx.PENSTYLE_SHORT_DASH: (4, 4),
+    wx.PENSTYLE_DOT_DASH: (8, 3, 1, 3),
+}
+
+
+def render_sprite(key: Hashable,
+                  draw: Callable[[wx.DC, int], None],
+                  side: int,
+                  antialias: bool = False) -> NDArray[np.uint8]:
+    """
+    Renders a small RGBA sprite once and caches it.
+
+    The shape is drawn twice, on black and on white, and the alpha channel
+    is recovered from the difference, so it works with any DC backend.
+
+    Parameters
+    ----------
+    key : Hashable
+        The cache key, e.g. ``(shape, size, pen, brush)``.
+    draw : Callable[[wx.DC, int], None]
+        Draws the shape centred on ``(centre, centre)`` of the given DC.
+    side : int
+        The side length of the sprite in pixels. Made odd so the sprite has
+        a centre pixel.
+    antialias : bool
+        Whether to render through a `wx.GCDC`.
+
+    Returns
+    -------
+    NDArray[np.uint8]
+        The ``(side, side, 4)`` RGBA sprite.
+    """
+    sprite = _spriteCache.get(key)
+    if sprite is not None:
+        return sprite
+
+    side = int(side) | 1
+    centre = side // 2
+    layers = []
+    for bg in (wx.BLACK, wx.WHITE):
+        bmp = wx.Bitmap(side, side, 24)
+        mdc = wx.MemoryDC(bmp)
+        mdc.SetBackground(wx.Brush(bg, wx.BRUSHSTYLE_SOLID))
+        mdc.Clear()
+        if antialias:
+            gcdc = wx.GCDC(mdc)
+            draw(gcdc, centre)
+            del gcdc  # flush the graphics context
+        else:
+            draw(mdc, centre)
+        mdc.SelectObject(wx.NullBitmap)
+        data = bmp.ConvertToImage().GetData()
+        layers.append(
+            np.frombuffer(data, np.uint8).reshape(side, side, 3).astype(np.float64))
+    black, white = layers
+
+    alpha = 255. - (white - black).mean(axis=2)
+    np.clip(alpha, 0, 255, out=alpha)
+    rgb = black * 255. / np.maximum(alpha, 1.)[..., None]
+    sprite = np.empty((side, side, 4), np.uint8)
+    sprite[..., :3] = np.clip(rgb, 0, 255)
+    sprite[..., 3] = alpha
+
+    if len(_spriteCache) >= _SPRITE_CACHE_SIZE:
+        _spriteCache.clear()
+    _spriteCache[key] = sprite
+    return sprite
+
+
+def stamp_sprite(buf: NDArray[np.uint8],
+                 sprite: NDArray[np.uint8],
+                 coords: NDArray[np.integer],
+                 origin: Tuple[int, int] = (0, 0)) -> None:
+    """
+    Stamps ``sprite`` centred on every point of ``coords`` into ``buf``.
+
+    Duplicate positions are stamped once. Partially covered (anti-aliased)
+    sprite pixels are written before the opaque ones, so the edge of one
+    marker never cuts into the body of another.
+
+    Parameters
+    ----------
+    buf : NDArray[np.uint8]
+        The ``(height, width, 4)`` RGBA buffer, modified in place.
+    sprite : NDArray[np.uint8]
+        The ``(side, side, 4)`` RGBA sprite.
+    coords : NDArray, shape ``(n, 2)``
+        The integer screen coordinates of the sprite centres.
+    origin : tuple of int
+        The screen coordinates of ``buf[0, 0]``.
+    """
+    height, width = buf.shape[:2]
+    side = sprite.shape[0]
+    centre = side // 2
+
+    x = coords[:, 0].astype(np.int64) - origin[0]
+    y = coords[:, 1].astype(np.int64) - origin[1]
+    keep = ((x > -side) & (x < width + side) & (y > -side) & (y < height + side))
+    # drop duplicate positions, x is offset by `side` to be non-negative
+    row = width + 2 * side
+    flat = np.unique(y[keep] * row + (x[keep] + side))
+    x = flat % row - side
+    y = flat // row
+
+    out = buf.reshape(-1, 4)
+    sy, sx = np.nonzero(sprite[..., 3])
+    opaque = sprite[sy, sx, 3] == 255
+    for part in (~opaque, opaque):
+        py = sy[part] - centre
+        px = sx[part] - centre
+        colours = sprite[sy[part], sx[part]]
+        for i in range(0, len(x), _STAMP_CHUNK):
+            X = x[i:i + _STAMP_CHUNK, None] + px
+            Y = y[i:i + _STAMP_CHUNK, None] + py
+            inside = (X >= 0) & (X < width) & (Y >= 0) & (Y < height)
+            idx = (Y * width + X)[inside]
+            out[idx] = np.broadcast_to(colours, X.shape + (4,))[inside]
+
+
+def new_layer(bounds: Tuple[int, int, int, int]) -> Tuple[NDArray[np.uint8], int, int]:
+    """
+    A transparent RGBA buffer covering ``bounds``, ``(x, y, width,
+    height)`` in screen coordinates.
+
+    Returns ``(buffer, x, y)`` like `sprite_layer`.
+    """
+    x, y, width, height = bounds
+    return np.zeros((max(height, 0), max(width, 0), 4), np.uint8), x, y
+
+
+def disc_sprite(width: int, colour: Tuple[int, int, int, int]) -> NDArray[np.uint8]:
+    """A solid round pen tip of diameter ``width`` as an RGBA sprite."""
+    side = int(width) | 1
+    centre = side // 2
+    yy, xx = np.mgrid[:side, :side] - centre
+    sprite = np.zeros((side, side, 4), np.uint8)
+    sprite[xx**2 + yy**2 <= (width / 2)**2 + 0.5] = colour
+    return sprite
+
+
+def _clipSegments(p1: NDArray[np.float64], p2: NDArray[np.float64],
+                  lo: Tuple[float, float], hi: Tuple[float, float]
+                  ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Liang-Barsky clipping of the segments ``p1 -> p2`` to the box
+    ``lo .. hi``.
+
+    Returns
+    -------
+    tuple
+        ``(t0, t1)``: the visible part of every segment as fractions of its
+        length, empty if ``t0 > t1``.
+    """
+    d = p2 - p1
+    t0 = np.zeros(len(d))
+    t1 = np.ones(len(d))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for axis in (0, 1):
+            for p, q in ((-d[:, axis], p1[:, axis] - lo[axis]),
+                         (d[:, axis], hi[axis] - p1[:, axis])):
+                r = q / p
+                t0 = np.where(p < 0, np.maximum(t0, r), t0)
+                t1 = np.where(p > 0, np.minimum(t1, r), t1)
+                t1 = np.where((p == 0) & (q < 0), -1., t1)
+    return t0, t1
+
+
+def line_pixels(coords: NDArray[np.integer],
+                bounds: Tuple[int, int, int, int]
+                ) -> Tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """
+    The pixels of the polyline through ``coords`` inside ``bounds``.
+
+    Every segment is clipped to the bounds and stepped one pixel along its
+    major axis (DDA), all segments at once. A nearly vertical segment, as
+    left by min/max decimation in every pixel column, becomes a span fill
+    of its column.
+
+    Parameters
+    ----------
+    coords : NDArray, shape ``(n, 2)``
+        The integer coordinates of the points, NaN free.
+    bounds : tuple of int
+        ``(x, y, width, height)`` of the area to keep.
+
+    Returns
+    -------
+    tuple
+        ``(x, y, pos)``: the pixel coordinates and the distance of every
+        pixel along the polyline in steps, for dash patterns.
+    """
+    c = np.asarray(coords, np.int64)
+    if len(c) < 2:
+        return c[:, 0], c[:, 1], np.zeros(len(c), np.int64)
+    d = np.diff(c, axis=0)
+    steps = np.abs(d).max(1)
+    before = np.cumsum(steps) - steps  # distance to the segment start
+
+    bx, by, bw, bh = bounds
+    t0, t1 = _clipSegments(c[:-1].astype(np.float64), c[1:].astype(np.float64),
+                           (bx - 1, by - 1), (bx + bw, by + bh))
+    keep = np.flatnonzero(t0 <= t1)
+    xs, ys, ps = [], [], []
+    for i in range(0, len(keep), _SEGMENT_CHUNK):
+        seg = keep[i:i + _SEGMENT_CHUNK]
+        n = steps[seg]
+        k0 = np.floor(t0[seg] * n).astype(np.int64)
+        k1 = np.ceil(t1[seg] * n).astype(np.int64)
+        # the segment end is the start of the next one, except for the last
+        k1 = np.where(seg == len(d) - 1, k1, np.minimum(k1, n - 1))
+        count = np.maximum(k1 - k0 + 1, 0)
+        index = np.repeat(np.arange(len(seg)), count)
+        k = (np.arange(len(index))
+             - np.repeat(np.cumsum(count) - count, count) + k0[index])
+        t = k / np.maximum(n, 1)[index]
+        s = seg[index]
+        xs.append(c[s, 0] + np.rint(d[s, 0] * t).astype(np.int64))
+        ys.append(c[s, 1] + np.rint(d[s, 1] * t).astype(np.int64))
+        ps.append(before[s] + k)
+    if not xs:
+        empty = np.empty(0, np.int64)
+        return empty, empty, empty
+    return np.concatenate(xs), np.concatenate(ys), np.concatenate(ps)
+
+
+def draw_lines(buf: NDArray[np.uint8],
+               coords: NDArray[np.integer],
+               colour: Tuple[int, int, int, int],
+               width: int = 1,
+               style: int = wx.PENSTYLE_SOLID,
+               origin: Tuple[int, int] = (0, 0)) -> None:
+    """
+    Draws the polyline through ``coords`` into ``buf``, like
+    ``dc.DrawLines`` with an aliased pen.
+
+    Parameters
+    ----------
+    buf : NDArray[np.uint8]
+        The ``(height, width, 4)`` RGBA buffer, modified in place.
+    coords : NDArray, shape ``(n, 2)``
+        The integer screen coordinates of the points.
+    colour : tuple of int
+        The RGBA colour.
+    width : int
+        The pen width in pixels, wider pens stamp a round tip on every
+        pixel of the line.
+    style : int
+        The ``wx.PENSTYLE_*`` of the pen, the dashed styles are
+        approximated.
+    origin : tuple of int
+        The screen coordinates of ``buf[0, 0]``.
+    """
+    height, w = buf.shape[:2]
+    width = max(int(width), 1)
+    margin = width // 2
+    x, y, pos = line_pixels(np.asarray(coords), (origin[0] - margin,
+                                                 origin[1] - margin,
+                                                 w + 2 * margin,
+                                                 height + 2 * margin))
+    dashes = _DASHES.get(style)
+    if dashes is not None:
+        # on for the even runs of the repeated pattern
+        runs = np.repeat(np.arange(len(dashes)) % 2 == 0,
+                         np.multiply(dashes, width))
+        on = runs[pos % len(runs)]
+        x, y = x[on], y[on]
+    if width > 1:
+        stamp_sprite(buf, disc_sprite(width, colour), np.column_stack((x, y)),
+                     origin)
+        return
+    x = x - origin[0]
+    y = y - origin[1]
+    inside = (x >= 0) & (x < w) & (y >= 0) & (y < height)
+    buf.reshape(-1, 4)[y[inside] * w + x[inside]] = colour
+
+
+def drawn_pixels(buf: NDArray[np.uint8], x: int = 0, y: int = 0
+                 ) -> Tuple[NDArray[np.int32], NDArray[np.int32], NDArray[np.uint8]]:
+    """
+    The drawn pixels of an RGBA buffer whose top left pixel is at the screen
+    coordinates ``(x, y)``.
+
+    Plot layers are mostly empty, so this is much smaller than the buffer
+    and faster to composite.
+
+    Returns
+    -------
+    tuple
+        ``(xs, ys, rgba)``: the screen coordinates and the ``(n, 4)``
+        colours of the pixels with a non-zero alpha.
+    """
+    height, width = buf.shape[:2]
+    # whole pixels as words, to find the rows with drawn pixels first
+    words = np.ascontiguousarray(buf).view(np.uint32).reshape(height, width)
+    rows = np.flatnonzero(words.any(axis=1))
+    if not len(rows):
+        index = rows
+    else:
+        top, bottom = rows[0], rows[-1] + 1
+        index = np.flatnonzero(words[top:bottom])
+        index = index[buf[top:bottom].reshape(-1, 4)[index, 3] != 0]
+        index += top * width
+    return ((index % width + x).astype(np.int32),
+            (index // width + y).astype(np.int32),
+            buf.reshape(-1, 4)[index])
+
+
+def take_pixels(buf: NDArray[np.uint8], x: int = 0, y: int = 0
+                ) -> Tuple[NDArray[np.int32], NDArray[np.int32], NDArray[np.uint8]]:
+    """
+    Like `drawn_pixels`, but also clears them, so that the buffer can be
+    reused for the next layer without allocating another.
+    """
+    pixels = drawn_pixels(buf, x, y)
+    width = buf.shape[1]
+    buf.reshape(-1, 4)[(pixels[1] - y) * width + pixels[0] - x] = 0
+    return pixels
+
+
+def put_pixels(dst: NDArray[np.uint8],
+               xs: NDArray[np.integer],
+               ys: NDArray[np.integer],
+               rgba: NDArray[np.uint8],
+               origin: Tuple[int, int] = (0, 0)) -> None:
+    """
+    Writes `drawn_pixels` into an RGBA buffer whose top left pixel is at
+    the screen coordinates ``origin``. Like stamping, the pixels replace
+    what is below them.
+    """
+    height, width = dst.shape[:2]
+    x = xs - origin[0]
+    y = ys - origin[1]
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    if not inside.all():
+        x, y, rgba = x[inside], y[inside], rgba[inside]
+    dst.reshape(-1, 4)[y * width + x] = rgba
+
+
+def blit_rgba(dc: wx.DC, buf: NDArray[np.uint8], x: int = 0, y: int = 0) -> None:
+    """Draws the RGBA buffer on the DC with its top left corner at (x, y)."""
+    height, width = buf.shape[:2]
+    if width == 0 or height == 0:
+        return
+    bmp = wx.Bitmap.FromBufferRGBA(width, height, np.ascontiguousarray(buf))
+    dc.DrawBitmap(bmp, int(x), int(y), True)
+
+
+def sprite_layer(coords: NDArray[np.integer],
+                 sprite: NDArray[np.uint8],
+                 bounds: Optional[Tuple[int, int, int, int]] = None
+                 ) -> Tuple[Optional[NDArray[np.uint8]], int, int]:
+    """
+    Stamps the sprite on every point into a buffer just large enough to
+    hold them.
+
+    Parameters
+    ----------
+    coords : NDArray, shape ``(n, 2)``
+        The integer screen coordinates of the sprite centres.
+    sprite : NDArray[np.uint8]
+        The RGBA sprite.
+    bounds : tuple of int, optional
+        ``(x, y, width, height)`` of the visible area. Points far outside
+        it are not stamped.
+
+    Returns
+    -------
+    tuple
+        ``(buffer, x, y)``: the RGBA buffer (None if nothing is visible)
+        and the screen position of its top left corner.
+    """
+    if len(coords) == 0:
+        return None, 0, 0
+    half = sprite.shape[0] // 2 + 1
+    lo = coords.min(0).astype(np.int64) - half
+    hi = coords.max(0).astype(np.int64) + half + 1
+    if bounds is not None:
+        bx, by, bw, bh = bounds
+        lo = np.maximum(lo, (bx, by))
+        hi = np.minimum(hi, (bx + bw, by + bh))
+    if (hi <= lo).any():
+        return None, 0, 0
+    buf = np.zeros((hi[1] - lo[1], hi[0] - lo[0], 4), np.uint8)
+    stamp_sprite(buf, sprite, coords, (int(lo[0]), int(lo[1])))
+    return buf, int(lo[0]), int(lo[1])
+
+
+__all__ = [
+    'render_sprite', 'stamp_sprite', 'blit_rgba', 'sprite_layer', 'new_layer',
+    'disc_sprite', 'line_pixels', 'draw_lines', 'drawn_pixels', 'put_pixels'
+]
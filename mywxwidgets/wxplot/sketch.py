@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Bounded memory summaries of unbounded sample streams.
+
+`QuantileSketch` is a merging t-digest and `Reservoir` a uniform random
+sample, both updated with NumPy array operations per batch of samples.
+"""
+from typing import Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+class QuantileSketch:
+    """
+    Online quantile estimator (merging t-digest).
+
+    Samples are collected in a buffer; a full buffer is sorted together with
+    the centroids and merged into at most about `compression` centroids.
+    Centroids near the tails hold fewer samples, so extreme quantiles stay
+    accurate. Memory is O(compression) and the cost per sample is
+    O(log compression) amortized.
+
+    Parameters
+    ----------
+    compression : int
+        The accuracy parameter, roughly the number of centroids kept
+    """
+
+    def __init__(self, compression: int = 100):
+        if not isinstance(compression, int) or compression < 10:
+            raise ValueError('`compression` must be an int >= 10')
+        self.compression = compression
+        self.count: int = 0
+        self.min: float = np.inf
+        self.max: float = -np.inf
+        self._means: NDArray[np.float64] = np.empty(0)
+        self._weights: NDArray[np.float64] = np.empty(0)
+        self._buffer: NDArray[np.float64] = np.empty(5 * compression)
+        self._nbuffer: int = 0
+
+    def update(self, samples: ArrayLike) -> None:
+        """Adds samples, non-finite values are ignored."""
+        samples = np.asarray(samples, np.float64).ravel()
+        samples = samples[np.isfinite(samples)]
+        if not len(samples):
+            return
+        self.count += len(samples)
+        self.min = min(self.min, float(samples.min()))
+        self.max = max(self.max, float(samples.max()))
+
+        size = len(self._buffer)
+        while len(samples):
+            n = min(size - self._nbuffer, len(samples))
+            self._buffer[self._nbuffer:self._nbuffer + n] = samples[:n]
+            self._nbuffer += n
+            samples = samples[n:]
+            if self._nbuffer == size:
+                self._merge()
+
+    def _merge(self) -> None:
+        """Merges the buffered samples into the centroids"""
+        if not self._nbuffer:
+            return
+        means = np.concatenate((self._means, self._buffer[:self._nbuffer]))
+        weights = np.concatenate((self._weights, np.ones(self._nbuffer)))
+        self._nbuffer = 0
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+
+        # the k1 scale function maps the rank of each item to the index of
+        # its centroid, centroids are narrower towards both tails
+        total = weights.sum()
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / np.pi * np.arcsin(2 * q - 1)
+        index = np.floor(k - k[0]).astype(np.intp)
+        starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+    def quantile(self, q: Union[float, ArrayLike]) -> Union[float, NDArray[np.float64]]:
+        """
+        Estimates the quantiles `q` (between 0 and 1) of the samples so far.
+
+        Returns NaN if no samples were added.
+        """
+        self._merge()
+        q = np.asarray(q, np.float64)
+        if not self.count:
+            return np.full(q.shape, np.nan)[()]
+        weights = self._weights
+        total = weights.sum()
+        # each centroid mean sits at the centre of its rank range
+        ranks = np.r_[0., np.cumsum(weights) - weights / 2, total]
+        values = np.r_[self.min, self._means, self.max]
+        return np.interp(q * total, ranks, values)[()]
+
+    def lowest_above(self, value: float) -> float:
+        """The smallest centroid mean (or minimum) at or above `value`"""
+        self._merge()
+        if self.min >= value:
+            return self.min
+        above = self._means[self._means >= value]
+        return float(above.min()) if len(above) else self.max
+
+    def highest_below(self, value: float) -> float:
+        """The largest centroid mean (or maximum) at or below `value`"""
+        self._merge()
+        if self.max <= value:
+            return self.max
+        below = self._means[self._means <= value]
+        return float(below.max()) if len(below) else self.min
+
+
+class Reservoir:
+    """
+    Uniform random sample of a stream (algorithm R, vectorized per batch).
+
+    Parameters
+    ----------
+    size : int
+        The number of samples kept
+    seed : int, optional
+        The seed of the random generator, for reproducible samples
+    """
+
+    def __init__(self, size: int = 1000, seed: Optional[int] = None):
+        if not isinstance(size, int) or size < 1:
+            raise ValueError('`size` must be a positive int')
+        self.size = size
+        self.seen: int = 0
+        self._rng = np.random.default_rng(seed)
+        self._data: NDArray[np.float64] = np.empty(size)
+
+    @property
+    def sample(self) -> NDArray[np.float64]:
+        """The kept samples, in slot order"""
+        return self._data[:min(self.seen, self.size)]
+
+    def update(self, samples: ArrayLike) -> None:
+        """Offers samples to the reservoir, non-finite values are ignored."""
+        samples = np.asarray(samples, np.float64).ravel()
+        samples = samples[np.isfinite(samples)]
+        # fill the free slots first
+        free = max(self.size - self.seen, 0)
+        head = samples[:free]
+        self._data[self.seen:self.seen + len(head)] = head
+        self.seen += len(head)
+        samples = samples[free:]
+        if not len(samples):
+            return
+        # item i of the stream replaces a random slot with probability
+        # size / (i + 1)
+        position = self.seen + np.arange(len(samples))
+        slot = self._rng.integers(0, position + 1)
+        keep = slot < self.size
+        self._data[slot[keep]] = samples[keep]
+        self.seen += len(samples)
+
+
+__all__ = ['QuantileSketch', 'Reservoir']